@@ -123,8 +123,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework configuration
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 10,
+    'DEFAULT_PAGINATION_CLASS': 'stock_spot.pagination.IdCursorPagination',
+    'PAGE_SIZE': 50,
 }
 
 # CORS configuration
@@ -144,4 +144,161 @@ MAILGUN_BASE_URL = os.getenv('MAILGUN_API_URL', 'https://api.mailgun.net')
 MAILGUN_FROM_EMAIL = os.getenv('MAILGUN_FROM_EMAIL', '')
 
 # Email Distribution
-EMAIL_DISTRIBUTION_LIST = os.getenv('EMAIL_DISTRIBUTION_LIST', '')
\ No newline at end of file
+EMAIL_DISTRIBUTION_LIST = os.getenv('EMAIL_DISTRIBUTION_LIST', '')
+
+# Ingestion
+# Provider fetches for a symbol run concurrently; each source gets its own timeout (seconds)
+INGESTION_MAX_WORKERS = int(os.getenv('INGESTION_MAX_WORKERS', '8'))
+INGESTION_FETCH_TIMEOUT = float(os.getenv('INGESTION_FETCH_TIMEOUT', '30'))
+INGESTION_FETCH_TIMEOUTS = {
+    'stock_info': INGESTION_FETCH_TIMEOUT,
+    # Covers the Alpha Vantage rate limiter's max wait plus the request itself
+    'relative_strength_index': float(os.getenv('INGESTION_RSI_TIMEOUT', '135')),
+}
+INGESTION_POLL_INTERVAL = 0.25
+# Batch ingestion runs several symbols at once, sharing a cap on concurrent calls per provider
+INGESTION_MAX_SYMBOL_WORKERS = int(os.getenv('INGESTION_MAX_SYMBOL_WORKERS', '4'))
+INGESTION_PROVIDER_CONCURRENCY = {
+    'yfinance': int(os.getenv('YFINANCE_MAX_CONCURRENCY', '8')),
+    'alpha_vantage': int(os.getenv('ALPHA_VANTAGE_MAX_CONCURRENCY', '1')),
+}
+# Re-ingesting a known stock only refreshes datasets older than their max age in seconds
+INGESTION_MAX_DATA_AGE = {
+    'stock_info': 24 * 60 * 60,
+    'annual_balance_sheet': 24 * 60 * 60,
+    'quarterly_balance_sheet': 24 * 60 * 60,
+    'annual_cashflow': 24 * 60 * 60,
+    'quarterly_cashflow': 24 * 60 * 60,
+    'annual_income_statement': 24 * 60 * 60,
+    'quarterly_income_statement': 24 * 60 * 60,
+    'relative_strength_index': 24 * 60 * 60,
+}
+
+# Yahoo Finance
+# Reuse one Ticker per symbol and one HTTP session per service across all statement fetches
+YFINANCE_REUSE_TICKERS = os.getenv('YFINANCE_REUSE_TICKERS', 'True') == 'True'
+# Only write statement periods that are new or whose content changed since the last refresh
+YFINANCE_INCREMENTAL_REFRESH = os.getenv('YFINANCE_INCREMENTAL_REFRESH', 'True') == 'True'
+
+# Alpha Vantage
+# A pooled session is shared across calls; 429 and 5xx responses are retried with exponential backoff
+ALPHA_VANTAGE_POOL_SIZE = int(os.getenv('ALPHA_VANTAGE_POOL_SIZE', '10'))
+ALPHA_VANTAGE_TIMEOUT = float(os.getenv('ALPHA_VANTAGE_TIMEOUT', '10'))
+ALPHA_VANTAGE_MAX_RETRIES = int(os.getenv('ALPHA_VANTAGE_MAX_RETRIES', '3'))
+ALPHA_VANTAGE_BACKOFF_FACTOR = float(os.getenv('ALPHA_VANTAGE_BACKOFF_FACTOR', '0.5'))
+# Client-side token buckets shared through the database: window -> (calls, period in seconds)
+ALPHA_VANTAGE_RATE_LIMITS = {
+    'minute': (int(os.getenv('ALPHA_VANTAGE_CALLS_PER_MINUTE', '5')), 60),
+    'day': (int(os.getenv('ALPHA_VANTAGE_CALLS_PER_DAY', '25')), 86400),
+}
+# Calls that would wait longer than this for a token fail instead of sleeping
+ALPHA_VANTAGE_RATE_LIMIT_MAX_WAIT = float(os.getenv('ALPHA_VANTAGE_RATE_LIMIT_MAX_WAIT', '120'))
+
+# Provider response cache
+# Fetches are cached per (provider, function, symbol, params) in an in-process LRU backed by files on disk
+PROVIDER_CACHE_ENABLED = os.getenv('PROVIDER_CACHE_ENABLED', 'True') == 'True'
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'provider_memory': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'provider-responses',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('PROVIDER_CACHE_MEMORY_ENTRIES', '512'))},
+    },
+    'provider_disk': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('PROVIDER_CACHE_DIR', str(BASE_DIR / '.cache' / 'providers')),
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('PROVIDER_CACHE_DISK_ENTRIES', '20000'))},
+    },
+}
+# Seconds each dataset stays fresh, keyed by yfinance dataset or Alpha Vantage function;
+# 'market_close' keeps a value until the next US market close
+PROVIDER_CACHE_DEFAULT_TTL = 60 * 60
+PROVIDER_CACHE_TTLS = {
+    'stock_info': 'market_close',
+    'annual_income_statement': 24 * 60 * 60,
+    'quarterly_income_statement': 24 * 60 * 60,
+    'annual_balance_sheet': 24 * 60 * 60,
+    'quarterly_balance_sheet': 24 * 60 * 60,
+    'annual_cashflow': 24 * 60 * 60,
+    'quarterly_cashflow': 24 * 60 * 60,
+    'GLOBAL_QUOTE': 'market_close',
+    'EARNINGS': 24 * 60 * 60,
+    'RSI': 'market_close',
+}
+
+# Report jobs
+# Seconds the run_report_jobs worker sleeps when the queue is empty
+REPORT_JOB_POLL_INTERVAL = float(os.getenv('REPORT_JOB_POLL_INTERVAL', '5'))
+# Seconds a job may stay running before it is assumed its worker died and it is queued again
+REPORT_JOB_TIMEOUT = float(os.getenv('REPORT_JOB_TIMEOUT', '3600'))
+# Reports render from stored data; a symbol is re-ingested first only if a dataset the report
+# shows is missing or older than its max age in seconds
+REPORT_RENDER_FROM_SNAPSHOT = os.getenv('REPORT_RENDER_FROM_SNAPSHOT', 'True') == 'True'
+REPORT_MAX_DATA_AGE = {
+    'stock_info': 24 * 60 * 60,
+    'relative_strength_index': 24 * 60 * 60,
+    'quarterly_income_statement': 7 * 24 * 60 * 60,
+    'annual_income_statement': 7 * 24 * 60 * 60,
+}
+
+# Screening
+# Largest page the screen endpoint returns
+SCREEN_MAX_LIMIT = int(os.getenv('SCREEN_MAX_LIMIT', '500'))
+
+# Prices and technical indicators
+# 'local' computes RSI from stored daily closes; 'alpha_vantage' fetches it per symbol during ingestion
+RSI_SOURCE = os.getenv('RSI_SOURCE', 'local')
+RSI_PERIOD = 14
+# Enough history for a 200-day moving average on first download
+PRICE_HISTORY_LOOKBACK_DAYS = int(os.getenv('PRICE_HISTORY_LOOKBACK_DAYS', '400'))
+# Symbols per multi-ticker download
+PRICE_DOWNLOAD_BATCH_SIZE = int(os.getenv('PRICE_DOWNLOAD_BATCH_SIZE', '200'))
+# Window downloaded by the price-only refresh; wide enough to span weekends and holidays
+PRICE_REFRESH_PERIOD = os.getenv('PRICE_REFRESH_PERIOD', '5d')
+
+# Scheduler
+# Cadences in seconds. 'market_hours' limits a task to the regular session, 'after_close' runs it once per
+# trading day that long after the close, and statements refresh a share of the universe every interval so
+# stocks near an expected filing come round once per due_max_age and the rest once per max_age
+REFRESH_SCHEDULE = {
+    'prices': {'interval': int(os.getenv('PRICE_REFRESH_INTERVAL', '900')), 'market_hours': True},
+    'indicators': {'after_close': 30 * 60},
+    'statements': {'interval': 60 * 60, 'due_max_age': 24 * 60 * 60, 'max_age': 30 * 24 * 60 * 60},
+}
+SCHEDULER_TICK_INTERVAL = float(os.getenv('SCHEDULER_TICK_INTERVAL', '60'))
+
+# Earnings calendar
+# Statements are refreshed daily from this many days before a stock's estimated filing date until they
+# include the new quarter, giving up after the grace period
+EARNINGS_WINDOW_DAYS_BEFORE = 3
+EARNINGS_OVERDUE_GRACE_DAYS = 120
+# Filing lag assumed for stocks without reported earnings history
+EARNINGS_DEFAULT_REPORT_LAG_DAYS = 40
+
+# Provider stand-ins
+# 'live' calls Yahoo Finance, Alpha Vantage and Mailgun; 'record' also saves every response under
+# PROVIDER_FIXTURE_DIR (disable the provider cache while recording so every call reaches the provider);
+# 'replay' serves the saved responses without any network access
+PROVIDER_MODE = os.getenv('PROVIDER_MODE', 'live')
+PROVIDER_FIXTURE_DIR = os.getenv('PROVIDER_FIXTURE_DIR', str(BASE_DIR / 'fixtures' / 'providers'))
+# Seconds added to each replayed call and the share of replayed calls that fail, per provider
+PROVIDER_REPLAY_LATENCY = {
+    'yfinance': float(os.getenv('YFINANCE_REPLAY_LATENCY', '0')),
+    'alpha_vantage': float(os.getenv('ALPHA_VANTAGE_REPLAY_LATENCY', '0')),
+    'mailgun': float(os.getenv('MAILGUN_REPLAY_LATENCY', '0')),
+}
+PROVIDER_REPLAY_ERROR_RATES = {
+    'yfinance': float(os.getenv('YFINANCE_REPLAY_ERROR_RATE', '0')),
+    'alpha_vantage': float(os.getenv('ALPHA_VANTAGE_REPLAY_ERROR_RATE', '0')),
+    'mailgun': float(os.getenv('MAILGUN_REPLAY_ERROR_RATE', '0')),
+}
+# Injected failures depend only on this seed and the call, so a replay fails the same calls every run
+PROVIDER_REPLAY_SEED = int(os.getenv('PROVIDER_REPLAY_SEED', '0'))
+
+# Benchmarks
+BENCHMARK_SIZES = [10, 100, 1000]
+BENCHMARK_BASELINE_FILE = os.getenv('BENCHMARK_BASELINE_FILE', str(BASE_DIR / 'benchmarks' / 'baselines.json'))
+# Share by which a stage may get slower, chattier or heavier than its baseline before the benchmark fails
+BENCHMARK_REGRESSION_THRESHOLD = float(os.getenv('BENCHMARK_REGRESSION_THRESHOLD', '0.25'))
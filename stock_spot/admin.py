@@ -3,7 +3,9 @@ from .models import (
     Stock, AnnualEarning, QuarterlyEarning,
     QuarterlyIncomeStatement, AnnualIncomeStatement,
     QuarterlyBalanceSheet, AnnualBalanceSheet,
-    QuarterlyCashFlow, AnnualCashFlow
+    QuarterlyCashFlow, AnnualCashFlow,
+    ReportJob, StockSnapshot, TechnicalIndicatorPoint, DailyPrice,
+    ScheduledTask
 )
 
 admin.site.register(Stock)
@@ -15,3 +17,8 @@ admin.site.register(QuarterlyBalanceSheet)
 admin.site.register(AnnualBalanceSheet)
 admin.site.register(QuarterlyCashFlow)
 admin.site.register(AnnualCashFlow)
+admin.site.register(ReportJob)
+admin.site.register(StockSnapshot)
+admin.site.register(TechnicalIndicatorPoint)
+admin.site.register(DailyPrice)
+admin.site.register(ScheduledTask)
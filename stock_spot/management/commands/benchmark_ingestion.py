@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from stock_spot.services.benchmark import IngestionBenchmark, find_regressions
+
+
+class Command(BaseCommand):
+    help = 'Benchmark ingestion, metrics and the daily report for synthetic universes against replayed providers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, help='Universe sizes to run (default: BENCHMARK_SIZES)')
+        parser.add_argument('--baseline', default=settings.BENCHMARK_BASELINE_FILE, help='Baseline results file')
+        parser.add_argument('--update-baseline', action='store_true', help='Store these results as the new baseline')
+        parser.add_argument('--threshold', type=float, default=settings.BENCHMARK_REGRESSION_THRESHOLD, help='Allowed regression as a fraction of the baseline')
+        parser.add_argument(
+            '--timing', action='store_true',
+            help='Also fail on slower wall time or throughput; only meaningful against a baseline recorded on this machine'
+        )
+        parser.add_argument('--latency', type=float, default=0, help='Seconds added to every replayed provider call')
+        parser.add_argument('--error-rate', type=float, default=0, help='Share of replayed provider calls that fail')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic data and injected failures')
+
+    def handle(self, *args, **options):
+        benchmark = IngestionBenchmark(options['sizes'], options['latency'], options['error_rate'], options['seed'])
+        # Synthetic universes are written to a throwaway test database, never the configured one
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            results = benchmark.run()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        for size, stages in results.items():
+            for stage, metrics in stages.items():
+                self.stdout.write(
+                    f"{size:>5} symbols  {stage:<18} {metrics['seconds']:>9.3f}s {metrics['queries']:>8} queries "
+                    f"{metrics['rows_per_second']:>10.1f} rows/s {metrics['peak_memory_mb']:>8.1f} MB"
+                )
+
+        path = Path(options['baseline'])
+        if options['update_baseline']:
+            baselines = json.loads(path.read_text()) if path.exists() else {}
+            baselines.update(results)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+            self.stdout.write(f"Baseline written to {path}")
+            return
+        if not path.exists():
+            self.stdout.write(f"No baseline at {path}; run with --update-baseline to store one")
+            return
+        regressions = find_regressions(results, json.loads(path.read_text()), options['threshold'], options['timing'])
+        if regressions:
+            raise CommandError('Performance regressions:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f"No regressions beyond {options['threshold']:.0%} of the baseline"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from stock_spot.services.prices import PriceHistoryService
+from stock_spot.services.yfinance import YFinanceService
+
+
+class Command(BaseCommand):
+    help = 'Refresh current prices for stored stocks using batched multi-ticker downloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('symbols', nargs='*', help='Symbols to refresh (all stocks by default)')
+
+    def handle(self, *args, **options):
+        symbols = [symbol.upper() for symbol in options['symbols']] or None
+        prices = PriceHistoryService(YFinanceService()).refresh_prices(symbols)
+        self.stdout.write(f"Updated prices for {len(prices)} stocks")
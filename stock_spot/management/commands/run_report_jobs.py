@@ -0,0 +1,22 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from stock_spot.services.report_jobs import ReportJobService
+
+
+class Command(BaseCommand):
+    help = 'Run queued daily report jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        service = ReportJobService()
+        while True:
+            job = service.run_next()
+            if job is not None:
+                self.stdout.write(f"Report job {job.pk} {job.status}")
+                continue
+            if options['once']:
+                return
+            time.sleep(settings.REPORT_JOB_POLL_INTERVAL)
@@ -0,0 +1,21 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from stock_spot.services.scheduler import RefreshScheduler
+from stock_spot.services.stock import StockService
+
+
+class Command(BaseCommand):
+    help = 'Run price, indicator and statement refreshes on their configured cadences'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run the tasks that are due and exit')
+
+    def handle(self, *args, **options):
+        scheduler = RefreshScheduler(StockService())
+        while True:
+            for name in scheduler.run_due():
+                self.stdout.write(f"Ran scheduled {name} refresh")
+            if options['once']:
+                return
+            time.sleep(settings.SCHEDULER_TICK_INTERVAL)
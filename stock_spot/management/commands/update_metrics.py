@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from stock_spot.services.metrics import MetricsService
+from stock_spot.services.snapshot import SnapshotService
+
+
+class Command(BaseCommand):
+    help = 'Recompute YoY EPS growth, CAGR and latest-fundamentals snapshots for stored stocks in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('symbols', nargs='*', help='Symbols to update (all stocks by default)')
+
+    def handle(self, *args, **options):
+        symbols = [symbol.upper() for symbol in options['symbols']] or None
+        with transaction.atomic():
+            metrics = MetricsService().update(symbols)
+            SnapshotService().refresh(symbols)
+        self.stdout.write(f"Updated metrics for {len(metrics)} stocks")
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-17 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0014_stock_companysummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RateLimitBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('tokens', models.FloatField()),
+                ('lastRefill', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-17 17:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0015_ratelimitbucket'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quarterlyincomestatement',
+            name='contentHash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='annualincomestatement',
+            name='contentHash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='annualbalancesheet',
+            name='contentHash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='quarterlybalancesheet',
+            name='contentHash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='quarterlycashflow',
+            name='contentHash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='annualcashflow',
+            name='contentHash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.CreateModel(
+            name='DatasetRefresh',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dataset', models.CharField(max_length=64)),
+                ('lastRefreshed', models.DateTimeField()),
+                ('latestFiscalDate', models.DateField(blank=True, null=True)),
+                ('stock', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dataset_refreshes', to='stock_spot.stock')),
+            ],
+            options={
+                'unique_together': {('stock', 'dataset')},
+            },
+        ),
+    ]
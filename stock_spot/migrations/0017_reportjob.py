@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-17 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0016_statement_contenthash_datasetrefresh'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('symbols', models.JSONField(default=list)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('progress', models.JSONField(blank=True, default=dict)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('startedAt', models.DateTimeField(blank=True, null=True)),
+                ('finishedAt', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
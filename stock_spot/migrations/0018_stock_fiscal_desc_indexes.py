@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0017_reportjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='annualearning',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='ae_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlyearning',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='qe_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlyincomestatement',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='qis_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='annualincomestatement',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='ais_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='annualbalancesheet',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='abs_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlybalancesheet',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='qbs_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlycashflow',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='qcf_stock_fiscal_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='annualcashflow',
+            index=models.Index(fields=['stock', '-fiscalDateEnding'], name='acf_stock_fiscal_desc_idx'),
+        ),
+    ]
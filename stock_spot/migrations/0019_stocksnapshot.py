@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0018_stock_fiscal_desc_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('symbol', models.CharField(max_length=5, unique=True)),
+                ('currentPrice', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('relativeStrengthIndex', models.DecimalField(blank=True, decimal_places=4, max_digits=6, null=True)),
+                ('yoyEPSPercentGrowth', models.DecimalField(blank=True, decimal_places=4, max_digits=7, null=True)),
+                ('compoundedAnnualGrowthRate', models.DecimalField(blank=True, decimal_places=2, max_digits=7, null=True)),
+                ('latestQuarterEnding', models.DateField(blank=True, null=True)),
+                ('quarterlyRevenue', models.BigIntegerField(blank=True, null=True)),
+                ('quarterlyNetIncome', models.BigIntegerField(blank=True, null=True)),
+                ('quarterlyDilutedEPS', models.DecimalField(blank=True, decimal_places=4, max_digits=10, null=True)),
+                ('quarterlyFreeCashFlow', models.BigIntegerField(blank=True, null=True)),
+                ('latestYearEnding', models.DateField(blank=True, null=True)),
+                ('annualRevenue', models.BigIntegerField(blank=True, null=True)),
+                ('annualNetIncome', models.BigIntegerField(blank=True, null=True)),
+                ('annualDilutedEPS', models.DecimalField(blank=True, decimal_places=4, max_digits=10, null=True)),
+                ('annualFreeCashFlow', models.BigIntegerField(blank=True, null=True)),
+                ('balanceSheetEnding', models.DateField(blank=True, null=True)),
+                ('totalDebt', models.BigIntegerField(blank=True, null=True)),
+                ('stockholdersEquity', models.BigIntegerField(blank=True, null=True)),
+                ('lastUpdated', models.DateTimeField(auto_now=True)),
+                ('stock', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='snapshot', to='stock_spot.stock')),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0019_stocksnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stocksnapshot',
+            index=models.Index(fields=['relativeStrengthIndex', 'id'], name='snapshot_rsi_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stocksnapshot',
+            index=models.Index(fields=['yoyEPSPercentGrowth', 'id'], name='snapshot_yoy_eps_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stocksnapshot',
+            index=models.Index(fields=['compoundedAnnualGrowthRate', 'id'], name='snapshot_cagr_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stocksnapshot',
+            index=models.Index(fields=['currentPrice', 'id'], name='snapshot_price_idx'),
+        ),
+    ]
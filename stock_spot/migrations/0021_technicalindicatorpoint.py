@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0020_stocksnapshot_screen_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechnicalIndicatorPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('indicator', models.CharField(max_length=16)),
+                ('date', models.DateField()),
+                ('value', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True)),
+                ('stock', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='indicator_points', to='stock_spot.stock')),
+            ],
+            options={
+                'unique_together': {('stock', 'indicator', 'date')},
+                'indexes': [models.Index(fields=['stock', 'indicator', '-date'], name='indicator_stock_date_desc_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 19:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0021_technicalindicatorpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPrice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('open', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True)),
+                ('high', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True)),
+                ('low', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True)),
+                ('close', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True)),
+                ('volume', models.BigIntegerField(blank=True, null=True)),
+                ('stock', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_prices', to='stock_spot.stock')),
+            ],
+            options={
+                'unique_together': {('stock', 'date')},
+                'indexes': [models.Index(fields=['stock', '-date'], name='price_stock_date_desc_idx')],
+            },
+        ),
+    ]
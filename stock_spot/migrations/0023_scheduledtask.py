@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0022_dailyprice'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=32, unique=True)),
+                ('lastRun', models.DateTimeField(blank=True, null=True)),
+                ('lastDuration', models.FloatField(blank=True, null=True)),
+                ('lastError', models.TextField(blank=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0023_scheduledtask'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='annualbalancesheet',
+            index=models.Index(fields=['fiscalDateEnding', 'id'], name='abs_fiscal_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='annualcashflow',
+            index=models.Index(fields=['fiscalDateEnding', 'id'], name='acf_fiscal_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='annualincomestatement',
+            index=models.Index(fields=['fiscalDateEnding', 'id'], name='ais_fiscal_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlybalancesheet',
+            index=models.Index(fields=['fiscalDateEnding', 'id'], name='qbs_fiscal_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlycashflow',
+            index=models.Index(fields=['fiscalDateEnding', 'id'], name='qcf_fiscal_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quarterlyincomestatement',
+            index=models.Index(fields=['fiscalDateEnding', 'id'], name='qis_fiscal_id_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0024_statement_fiscal_id_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stock',
+            name='relativeStrengthIndex',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=7, null=True),
+        ),
+        migrations.AlterField(
+            model_name='stocksnapshot',
+            name='relativeStrengthIndex',
+            field=models.DecimalField(blank=True, decimal_places=4, max_digits=7, null=True),
+        ),
+    ]
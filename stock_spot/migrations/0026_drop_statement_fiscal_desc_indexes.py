@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_spot', '0025_widen_relative_strength_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='annualbalancesheet',
+            name='abs_stock_fiscal_desc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='annualcashflow',
+            name='acf_stock_fiscal_desc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='annualincomestatement',
+            name='ais_stock_fiscal_desc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quarterlybalancesheet',
+            name='qbs_stock_fiscal_desc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quarterlycashflow',
+            name='qcf_stock_fiscal_desc_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quarterlyincomestatement',
+            name='qis_stock_fiscal_desc_idx',
+        ),
+    ]
@@ -9,7 +9,7 @@ class Stock(models.Model):
     priceWhenBought = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     isBought = models.BooleanField(null=True, blank=True)
     sharesOwned = models.IntegerField(null=True, blank=True)
-    relativeStrengthIndex = models.DecimalField(max_digits=6, decimal_places=4, null=True, blank=True)
+    relativeStrengthIndex = models.DecimalField(max_digits=7, decimal_places=4, null=True, blank=True)
     yoyEPSPercentGrowth = models.DecimalField(max_digits=7, decimal_places=4, null=True, blank=True)
     compoundedAnnualGrowthRate = models.DecimalField(max_digits=7, decimal_places=2, null=True, blank=True)
 
@@ -23,6 +23,11 @@ class AnnualEarning(models.Model):
     reportedEPS = models.DecimalField(max_digits=10, decimal_places=4, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['stock', '-fiscalDateEnding'], name='ae_stock_fiscal_desc_idx'),
+        ]
+
     def __str__(self):
         return f"{self.stock.symbol} - {self.fiscalDateEnding}"
 
@@ -38,6 +43,11 @@ class QuarterlyEarning(models.Model):
     reportTime = models.CharField(max_length=10)
     lastUpdated = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['stock', '-fiscalDateEnding'], name='qe_stock_fiscal_desc_idx'),
+        ]
+
     def __str__(self):
         return f"{self.stock.symbol} - {self.fiscalDateEnding}"
 
@@ -114,10 +124,15 @@ class QuarterlyIncomeStatement(models.Model):
     rentExpenseSupplemental = models.BigIntegerField(null=True, blank=True)
     otherUnderPreferredStockDividend = models.BigIntegerField(null=True, blank=True)
     
+    contentHash = models.CharField(max_length=64, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # The unique (stock, fiscalDateEnding) index also serves newest-first per-stock reads, scanned backwards
         unique_together = ['stock', 'fiscalDateEnding']
+        indexes = [
+            models.Index(fields=['fiscalDateEnding', 'id'], name='qis_fiscal_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.stock.symbol} - Q {self.fiscalDateEnding}"
@@ -196,10 +211,15 @@ class AnnualIncomeStatement(models.Model):
     rentExpenseSupplemental = models.BigIntegerField(null=True, blank=True)
     otherUnderPreferredStockDividend = models.BigIntegerField(null=True, blank=True)
     
+    contentHash = models.CharField(max_length=64, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # The unique (stock, fiscalDateEnding) index also serves newest-first per-stock reads, scanned backwards
         unique_together = ['stock', 'fiscalDateEnding']
+        indexes = [
+            models.Index(fields=['fiscalDateEnding', 'id'], name='ais_fiscal_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.stock.symbol} - Annual {self.fiscalDateEnding}"
@@ -318,10 +338,15 @@ class AnnualBalanceSheet(models.Model):
     cashEquivalents = models.BigIntegerField(null=True, blank=True)
     cashFinancial = models.BigIntegerField(null=True, blank=True)
     
+    contentHash = models.CharField(max_length=64, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # The unique (stock, fiscalDateEnding) index also serves newest-first per-stock reads, scanned backwards
         unique_together = ['stock', 'fiscalDateEnding']
+        indexes = [
+            models.Index(fields=['fiscalDateEnding', 'id'], name='abs_fiscal_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.stock.symbol} - Annual BS {self.fiscalDateEnding}"
@@ -439,10 +464,15 @@ class QuarterlyBalanceSheet(models.Model):
     cashEquivalents = models.BigIntegerField(null=True, blank=True)
     cashFinancial = models.BigIntegerField(null=True, blank=True)
     
+    contentHash = models.CharField(max_length=64, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # The unique (stock, fiscalDateEnding) index also serves newest-first per-stock reads, scanned backwards
         unique_together = ['stock', 'fiscalDateEnding']
+        indexes = [
+            models.Index(fields=['fiscalDateEnding', 'id'], name='qbs_fiscal_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.stock.symbol} - Q BS {self.fiscalDateEnding}"
@@ -516,10 +546,15 @@ class QuarterlyCashFlow(models.Model):
     netForeignCurrencyExchangeGainLoss = models.BigIntegerField(null=True, blank=True)
     gainLossOnSaleOfPPE = models.BigIntegerField(null=True, blank=True)
     
+    contentHash = models.CharField(max_length=64, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # The unique (stock, fiscalDateEnding) index also serves newest-first per-stock reads, scanned backwards
         unique_together = ['stock', 'fiscalDateEnding']
+        indexes = [
+            models.Index(fields=['fiscalDateEnding', 'id'], name='qcf_fiscal_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.stock.symbol} - Q CF {self.fiscalDateEnding}"
@@ -609,10 +644,148 @@ class AnnualCashFlow(models.Model):
     netForeignCurrencyExchangeGainLoss = models.BigIntegerField(null=True, blank=True)
     gainLossOnSaleOfPPE = models.BigIntegerField(null=True, blank=True)
     
+    contentHash = models.CharField(max_length=64, null=True, blank=True)
     lastUpdated = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # The unique (stock, fiscalDateEnding) index also serves newest-first per-stock reads, scanned backwards
         unique_together = ['stock', 'fiscalDateEnding']
+        indexes = [
+            models.Index(fields=['fiscalDateEnding', 'id'], name='acf_fiscal_id_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.stock.symbol} - Annual CF {self.fiscalDateEnding}"
+
+
+class RateLimitBucket(models.Model):
+    name = models.CharField(max_length=64, unique=True)
+    tokens = models.FloatField()
+    lastRefill = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name} - {self.tokens:.2f}"
+
+
+class DatasetRefresh(models.Model):
+    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name='dataset_refreshes')
+    dataset = models.CharField(max_length=64)
+    lastRefreshed = models.DateTimeField()
+    latestFiscalDate = models.DateField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ['stock', 'dataset']
+
+    def __str__(self):
+        return f"{self.stock.symbol} - {self.dataset} {self.lastRefreshed}"
+
+
+class ReportJob(models.Model):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    ]
+
+    symbols = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    progress = models.JSONField(default=dict, blank=True)
+    error = models.TextField(null=True, blank=True)
+    createdAt = models.DateTimeField(auto_now_add=True)
+    startedAt = models.DateTimeField(null=True, blank=True)
+    finishedAt = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Report job {self.pk} - {self.status}"
+
+
+class StockSnapshot(models.Model):
+    stock = models.OneToOneField(Stock, on_delete=models.CASCADE, related_name='snapshot')
+    symbol = models.CharField(max_length=5, unique=True)
+    currentPrice = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    relativeStrengthIndex = models.DecimalField(max_digits=7, decimal_places=4, null=True, blank=True)
+    yoyEPSPercentGrowth = models.DecimalField(max_digits=7, decimal_places=4, null=True, blank=True)
+    compoundedAnnualGrowthRate = models.DecimalField(max_digits=7, decimal_places=2, null=True, blank=True)
+
+    # Latest quarter
+    latestQuarterEnding = models.DateField(null=True, blank=True)
+    quarterlyRevenue = models.BigIntegerField(null=True, blank=True)
+    quarterlyNetIncome = models.BigIntegerField(null=True, blank=True)
+    quarterlyDilutedEPS = models.DecimalField(max_digits=10, decimal_places=4, null=True, blank=True)
+    quarterlyFreeCashFlow = models.BigIntegerField(null=True, blank=True)
+
+    # Latest year
+    latestYearEnding = models.DateField(null=True, blank=True)
+    annualRevenue = models.BigIntegerField(null=True, blank=True)
+    annualNetIncome = models.BigIntegerField(null=True, blank=True)
+    annualDilutedEPS = models.DecimalField(max_digits=10, decimal_places=4, null=True, blank=True)
+    annualFreeCashFlow = models.BigIntegerField(null=True, blank=True)
+
+    # Latest balance sheet
+    balanceSheetEnding = models.DateField(null=True, blank=True)
+    totalDebt = models.BigIntegerField(null=True, blank=True)
+    stockholdersEquity = models.BigIntegerField(null=True, blank=True)
+
+    lastUpdated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Common screen filters and sort keys; the id suffix serves keyset pagination
+        indexes = [
+            models.Index(fields=['relativeStrengthIndex', 'id'], name='snapshot_rsi_idx'),
+            models.Index(fields=['yoyEPSPercentGrowth', 'id'], name='snapshot_yoy_eps_idx'),
+            models.Index(fields=['compoundedAnnualGrowthRate', 'id'], name='snapshot_cagr_idx'),
+            models.Index(fields=['currentPrice', 'id'], name='snapshot_price_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.symbol} snapshot"
+
+
+class TechnicalIndicatorPoint(models.Model):
+    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name='indicator_points')
+    indicator = models.CharField(max_length=16)
+    date = models.DateField()
+    value = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
+
+    class Meta:
+        unique_together = ['stock', 'indicator', 'date']
+        indexes = [
+            models.Index(fields=['stock', 'indicator', '-date'], name='indicator_stock_date_desc_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.stock.symbol} - {self.indicator} {self.date}"
+
+
+class DailyPrice(models.Model):
+    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name='daily_prices')
+    date = models.DateField()
+    open = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
+    high = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
+    low = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
+    close = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
+    volume = models.BigIntegerField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ['stock', 'date']
+        indexes = [
+            models.Index(fields=['stock', '-date'], name='price_stock_date_desc_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.stock.symbol} - {self.date}"
+
+
+class ScheduledTask(models.Model):
+    name = models.CharField(max_length=32, unique=True)
+    lastRun = models.DateTimeField(null=True, blank=True)
+    lastDuration = models.FloatField(null=True, blank=True)
+    lastError = models.TextField(blank=True)
 
     def __str__(self):
-        return f"{self.stock.symbol} - Annual CF {self.fiscalDateEnding}"
\ No newline at end of file
+        return f"{self.name} - {self.lastRun}"
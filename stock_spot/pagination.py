@@ -0,0 +1,105 @@
+import base64
+import json
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorError(ValueError):
+    """Raised when a pagination cursor can't be decoded"""
+
+
+def encode_cursor(value, pk):
+    """Encode the sort value and primary key of the last row on a page"""
+    payload = json.dumps([value, pk], default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor back into the (sort value, primary key) it was built from"""
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return value, int(pk)
+    except (ValueError, TypeError) as e:
+        raise CursorError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_paginate(queryset, order_field, cursor=None, limit=50):
+    """Return one page of rows ordered by order_field (prefix '-' for descending) and the next page's cursor
+
+    Pages are found with a seek on (order_field, pk) instead of an OFFSET, so every page costs the
+    same index range scan. Rows whose order_field is null are left out.
+    """
+    descending = order_field.startswith('-')
+    field = order_field.lstrip('-')
+    queryset = queryset.filter(**{f"{field}__isnull": False})
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        op = 'lt' if descending else 'gt'
+        queryset = queryset.filter(Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"pk__{op}": pk}))
+    prefix = '-' if descending else ''
+    rows = list(queryset.order_by(f"{prefix}{field}", f"{prefix}pk")[:limit + 1])
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(_get(last, field), _get(last, 'pk'))
+    return rows, next_cursor
+
+
+def _get(row, field):
+    """Read a field from a model instance or a values() dict"""
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+class IdCursorPagination(CursorPagination):
+    """Cursor pagination in id order; pages seek on an index instead of scanning past an OFFSET"""
+    ordering = 'id'
+    page_size_query_param = 'limit'
+    max_page_size = 500
+
+
+class StockCursorPagination(IdCursorPagination):
+    ordering = 'symbol'
+
+
+class StatementCursorPagination(BasePagination):
+    """Keyset pagination newest period first, seeking on (fiscalDateEnding, id)
+
+    Fiscal dates repeat across every stock, so ordering on them alone would make DRF's cursor fall back
+    to an offset within each date; the id tie-breaker keeps every page an index seek.
+    """
+    ordering = '-fiscalDateEnding'
+    page_size_query_param = 'limit'
+    max_page_size = 500
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, settings.REST_FRAMEWORK['PAGE_SIZE']))
+        except ValueError:
+            page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            rows, self.next_cursor = keyset_paginate(
+                queryset, self.ordering,
+                cursor=request.query_params.get('cursor'),
+                limit=self.get_page_size(request)
+            )
+        except CursorError as e:
+            raise NotFound(str(e)) from e
+        return rows
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), 'cursor', self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
@@ -0,0 +1,50 @@
+import io
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+
+# Arrow and Parquet output is only offered when pyarrow is installed
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class ColumnarBinaryRenderer(BaseRenderer):
+    """Renders a {column: [values]} response as an Arrow table; errors fall back to JSON"""
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get('response')
+        if response is not None and response.status_code >= 400:
+            return JSONRenderer().render(data)
+        return self.write(pyarrow.table(data))
+
+    def write(self, table):
+        raise NotImplementedError
+
+
+class ArrowStreamRenderer(ColumnarBinaryRenderer):
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+
+    def write(self, table):
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+
+class ParquetRenderer(ColumnarBinaryRenderer):
+    media_type = 'application/vnd.apache.parquet'
+    format = 'parquet'
+
+    def write(self, table):
+        buffer = io.BytesIO()
+        pyarrow.parquet.write_table(table, buffer)
+        return buffer.getvalue()
+
+
+COLUMNAR_RENDERERS = [JSONRenderer, BrowsableAPIRenderer]
+if pyarrow is not None:
+    COLUMNAR_RENDERERS += [ArrowStreamRenderer, ParquetRenderer]
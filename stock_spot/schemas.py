@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class AnnualEarningsData:
@@ -21,3 +21,13 @@ class EarningsData:
     annualEarnings: list[AnnualEarningsData]
     quarterlyEarnings: list[QuarterlyEarningsData]
 
+@dataclass
+class IngestionReport:
+    symbol: str
+    succeeded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
@@ -1,7 +1,104 @@
 from rest_framework import serializers
-from .models import Stock
+from .models import (
+    Stock,
+    QuarterlyIncomeStatement, AnnualIncomeStatement,
+    QuarterlyBalanceSheet, AnnualBalanceSheet,
+    QuarterlyCashFlow, AnnualCashFlow
+)
 
-class StockSerializer(serializers.ModelSerializer):
+
+def requested_fields(request):
+    """Field names listed in the request's ?fields= parameter, or None to return every field"""
+    fields = request.query_params.get('fields') if request is not None else None
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(',') if field.strip()]
+
+
+class SparseFieldsMixin:
+    """Serializer mixin that only renders the fields named in ?fields="""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = requested_fields(self.context.get('request'))
+        if fields is None:
+            return
+        unknown = set(fields) - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError({'fields': f"Unknown fields: {', '.join(sorted(unknown))}"})
+        for name in set(self.fields) - set(fields):
+            self.fields.pop(name)
+
+    def get_only_fields(self):
+        """Model columns to load with .only() so unrequested columns are never selected
+
+        Sources on a related model (e.g. stock.symbol) come back as lookups with the foreign key they follow.
+        """
+        only = []
+        for field in self.fields.values():
+            if field.source == '*':
+                continue
+            if '.' in field.source:
+                related = field.source.split('.')[0]
+                only += [related, field.source.replace('.', '__')]
+            else:
+                only.append(field.source)
+        return list(dict.fromkeys(only))
+
+
+class StockSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Stock
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+
+class StatementSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Base for statement serializers; rows from several stocks are told apart by their symbol"""
+    symbol = serializers.CharField(source='stock.symbol', read_only=True)
+
+
+class QuarterlyIncomeStatementSerializer(StatementSerializer):
+    class Meta:
+        model = QuarterlyIncomeStatement
+        exclude = ['stock', 'contentHash']
+
+
+class AnnualIncomeStatementSerializer(StatementSerializer):
+    class Meta:
+        model = AnnualIncomeStatement
+        exclude = ['stock', 'contentHash']
+
+
+class QuarterlyBalanceSheetSerializer(StatementSerializer):
+    class Meta:
+        model = QuarterlyBalanceSheet
+        exclude = ['stock', 'contentHash']
+
+
+class AnnualBalanceSheetSerializer(StatementSerializer):
+    class Meta:
+        model = AnnualBalanceSheet
+        exclude = ['stock', 'contentHash']
+
+
+class QuarterlyCashFlowSerializer(StatementSerializer):
+    class Meta:
+        model = QuarterlyCashFlow
+        exclude = ['stock', 'contentHash']
+
+
+class AnnualCashFlowSerializer(StatementSerializer):
+    class Meta:
+        model = AnnualCashFlow
+        exclude = ['stock', 'contentHash']
+
+
+# Statement dataset names, as used by ingestion, mapped to their serializers
+STATEMENT_SERIALIZERS = {
+    'quarterly_income_statement': QuarterlyIncomeStatementSerializer,
+    'annual_income_statement': AnnualIncomeStatementSerializer,
+    'quarterly_balance_sheet': QuarterlyBalanceSheetSerializer,
+    'annual_balance_sheet': AnnualBalanceSheetSerializer,
+    'quarterly_cashflow': QuarterlyCashFlowSerializer,
+    'annual_cashflow': AnnualCashFlowSerializer,
+}
@@ -1,34 +1,106 @@
 from django.conf import settings
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from stock_spot.parser import Parser
-from stock_spot.models import Stock, AnnualEarning, QuarterlyEarning
+from stock_spot.models import Stock, AnnualEarning, QuarterlyEarning, TechnicalIndicatorPoint
+from stock_spot.services.cache import ProviderCache
+from stock_spot.services.freshness import record_refresh
+from stock_spot.services.rate_limit import RateLimitExceeded, TokenBucketRateLimiter
+from stock_spot.services.recording import ProviderRecorder
 from datetime import datetime
+from decimal import Decimal
+
+
+class AlphaVantageError(Exception):
+    """Raised when Alpha Vantage answers with a rate limit note or an error payload"""
 
 
 class AlphaVantageService:
     """Service for interacting with Alpha Vantage API"""
 
-    def __init__(self):
+    def __init__(self, session=None, rate_limiter=None, cache=None, recorder=None):
         self.base_url = settings.STOCK_API_BASE_URL
         self.api_key = settings.STOCK_API_KEY
+        self.timeout = settings.ALPHA_VANTAGE_TIMEOUT
+        # One pooled session keeps connections alive across calls and threads
+        self.session = session or self._create_session()
+        # Every call waits for a token so requests are spaced to stay just under the API key's quota
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            'alpha_vantage',
+            settings.ALPHA_VANTAGE_RATE_LIMITS,
+            settings.ALPHA_VANTAGE_RATE_LIMIT_MAX_WAIT
+        )
+        self.cache = cache or ProviderCache()
+        self.recorder = recorder or ProviderRecorder()
+
+    def _create_session(self):
+        """Build a pooled session that retries 429 and 5xx responses with exponential backoff"""
+        retry = Retry(
+            total=settings.ALPHA_VANTAGE_MAX_RETRIES,
+            backoff_factor=settings.ALPHA_VANTAGE_BACKOFF_FACTOR,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.ALPHA_VANTAGE_POOL_SIZE,
+            pool_maxsize=settings.ALPHA_VANTAGE_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _query(self, function, symbol, **params):
+        """Call an Alpha Vantage query function and return the decoded JSON body, cached per dataset TTL"""
+        return self.cache.get_or_fetch(
+            'alpha_vantage', function, symbol,
+            lambda: self.recorder.call(
+                'alpha_vantage', function, symbol,
+                lambda: self._request(function, symbol, params),
+                params=params
+            ),
+            params=params
+        )
+
+    def _request(self, function, symbol, params):
+        """Send one rate-limited request to Alpha Vantage"""
+        try:
+            self.rate_limiter.acquire()
+        except RateLimitExceeded as e:
+            raise AlphaVantageError(f"Alpha Vantage rate limit for {symbol}: {e}") from e
+        response = self.session.get(
+            f"{self.base_url}/query",
+            params={
+                'function': function,
+                'symbol': symbol,
+                **params,
+                'apikey': self.api_key
+            },
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        # Rate limit notes and errors come back as 200s; raise so they're never cached
+        error_msg = data.get("Note") or data.get("Information") or data.get("Error Message")
+        if error_msg:
+            raise AlphaVantageError(f"Alpha Vantage API limit/error for {symbol}: {error_msg}")
+        return data
 
     def get_price_today(self, symbol):
         """Fetch current stock price from Alpha Vantage"""
         try:
-            response = requests.get(
-                f"{self.base_url}/query",
-                params={
-                    'function': 'GLOBAL_QUOTE',
-                    'symbol': symbol,
-                    'apikey': self.api_key
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._query('GLOBAL_QUOTE', symbol)
             # Extract the price from the response
             price = data.get('Global Quote', {}).get('05. price')
             self._save_price_today(symbol, price)
             return price
+        except AlphaVantageError as e:
+            print(e)
+            return None
         except requests.RequestException as e:
             print(f"Alpha Vantage Error: {e}")
             return None
@@ -36,7 +108,6 @@ class AlphaVantageService:
     def _save_price_today(self, symbol, currentPrice):
         """Save current stock price to database"""
         try:
-            from decimal import Decimal
             stock = Stock.objects.get(symbol=symbol)
             if currentPrice:
                 stock.startingPrice = Decimal(currentPrice)
@@ -50,16 +121,7 @@ class AlphaVantageService:
     def get_eps_data(self, symbol):
         """Fetch EPS data from external Alpha Vantage and save to database"""
         try:
-            response = requests.get(
-                f"{self.base_url}/query",
-                params={
-                    'function': 'EARNINGS',
-                    'symbol': symbol,
-                    'apikey': self.api_key
-                }
-            )
-            response.raise_for_status()
-            raw_data = response.json()
+            raw_data = self._query('EARNINGS', symbol)
             
             # Parse the response
             parsed_data = Parser.parse_eps_data(raw_data)
@@ -68,6 +130,9 @@ class AlphaVantageService:
             self._save_earnings_to_db(symbol, parsed_data)
             
             return parsed_data
+        except AlphaVantageError as e:
+            print(e)
+            return None
         except requests.RequestException as e:
             print(f"Alpha Vantage Error: {e}")
             return None
@@ -115,43 +180,53 @@ class AlphaVantageService:
     def get_relative_strength_index_data(self, symbol):
         """Fetch RSI data from Alpha Vantage and save to database"""
         try:
-            response = requests.get(
-                f"{self.base_url}/query",
-                params={
-                    'function': 'RSI',
-                    'symbol': symbol,
-                    'interval': 'daily',
-                    'time_period': 14,
-                    'series_type': 'close',
-                    'apikey': self.api_key
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Check for API rate limit or error responses
-            if "Technical Analysis: RSI" not in data:
-                error_msg = data.get("Note") or data.get("Information") or data.get("Error Message")
-                if error_msg:
-                    print(f"Alpha Vantage API limit/error for {symbol}: {error_msg}")
-                else:
-                    print(f"Unexpected RSI response for {symbol}: {data}")
-                return None
-            
-            rsi_data = data["Technical Analysis: RSI"]
-            self._save_first_rsi(symbol, rsi_data)
+            rsi_data = self.fetch_relative_strength_index(symbol)
+            self.save_relative_strength_index(Stock.objects.get(symbol=symbol), rsi_data)
             return rsi_data
+        except AlphaVantageError as e:
+            print(e)
+            return None
         except Exception as e:
             print(f"Error fetching RSI data for: {symbol}, {e}")
             return None
 
-    def _save_first_rsi(self, symbol, rsi_data):
-        """Save the most recent RSI value"""
-        try:
-            stock = Stock.objects.get(symbol=symbol)
-            stock.relativeStrengthIndex = next(iter(rsi_data.values()))["RSI"]
-            stock.save()
-        except Stock.DoesNotExist:
-            print(f"Stock {symbol} not found in database")
-            return
-        print(f"RSI for stock {symbol} saved successfully")
+    def fetch_relative_strength_index(self, symbol):
+        """Fetch daily RSI data from Alpha Vantage without touching the database"""
+        data = self._query('RSI', symbol, interval='daily', time_period=14, series_type='close')
+
+        if "Technical Analysis: RSI" not in data:
+            raise AlphaVantageError(f"Unexpected RSI response for {symbol}: {data}")
+
+        return data["Technical Analysis: RSI"]
+
+    def save_relative_strength_index(self, stock, rsi_data):
+        """Append new points of the fetched RSI series and save the most recent value to the given Stock"""
+        if rsi_data is None:
+            return None
+        self._save_indicator_series(stock, 'RSI', rsi_data)
+        stock.relativeStrengthIndex = next(iter(rsi_data.values()))["RSI"]
+        stock.save(update_fields=['relativeStrengthIndex'])
+        record_refresh(stock, 'relative_strength_index')
+        print(f"RSI for stock {stock.symbol} saved successfully")
+        return rsi_data
+
+    def _save_indicator_series(self, stock, indicator, series):
+        """Bulk insert the points of a {date: {indicator: value}} series newer than the latest stored one"""
+        latest = (
+            TechnicalIndicatorPoint.objects.filter(stock=stock, indicator=indicator)
+            .order_by('-date')
+            .values_list('date', flat=True)
+            .first()
+        )
+        points = []
+        for day, values in series.items():
+            point_date = datetime.strptime(day, '%Y-%m-%d').date()
+            if latest is not None and point_date <= latest:
+                continue
+            points.append(TechnicalIndicatorPoint(
+                stock=stock,
+                indicator=indicator,
+                date=point_date,
+                value=Decimal(values[indicator])
+            ))
+        return TechnicalIndicatorPoint.objects.bulk_create(points, batch_size=1000, ignore_conflicts=True)
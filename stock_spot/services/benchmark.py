@@ -0,0 +1,145 @@
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import timedelta
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+from stock_spot.models import DatasetRefresh, Stock
+from stock_spot.services.email import EmailService
+from stock_spot.services.recording import ProviderRecorder
+from stock_spot.services.stock import StockService
+from stock_spot.services.synthetic import replay_settings, synthetic_symbols, write_fixtures
+
+STAGES = ('create_stock', 'update_metrics', 'send_stock_report')
+# Metric -> whether a larger value is worse. These depend only on the code and the synthetic data, so a
+# baseline recorded anywhere applies
+METRICS = {
+    'queries': True,
+    'rows_written': True,
+    'peak_memory_mb': True,
+}
+# Timing metrics vary with the machine and its load; they are only compared when asked for, against a
+# baseline recorded on the same machine
+TIMING_METRICS = {
+    'seconds': True,
+    'rows_per_second': False,
+}
+
+
+class QueryCounter:
+    """Counts queries and rows written on every database connection, including those opened by worker threads"""
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        rowcount = context['cursor'].rowcount
+        with self.lock:
+            self.queries += 1
+            if sql.lstrip()[:6].upper() in ('INSERT', 'UPDATE', 'DELETE') and rowcount > 0:
+                self.rows += rowcount
+        return result
+
+    def attach(self, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def __enter__(self):
+        for connection in connections.all():
+            self.attach(connection)
+        connection_created.connect(self.attach)
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self.attach)
+        for connection in connections.all():
+            if self in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self)
+
+
+def measure(run):
+    """Wall time, query count, rows written per second and peak traced memory of one call.
+
+    Memory is traced for the whole call, so times include tracemalloc's overhead; compare them only
+    with baselines measured the same way.
+    """
+    tracemalloc.start()
+    try:
+        with QueryCounter() as counter:
+            started = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'seconds': round(seconds, 3),
+        'queries': counter.queries,
+        'rows_written': counter.rows,
+        'rows_per_second': round(counter.rows / seconds, 1) if seconds else 0,
+        'peak_memory_mb': round(peak / 2 ** 20, 1),
+    }
+
+
+def find_regressions(results, baselines, threshold, timing=False):
+    """Describe every metric that moved past the threshold in its worse direction relative to its baseline.
+
+    Wall time and throughput are only checked with timing=True.
+    """
+    metrics_checked = {**METRICS, **TIMING_METRICS} if timing else METRICS
+    regressions = []
+    for size, stages in results.items():
+        for stage, metrics in stages.items():
+            baseline = baselines.get(size, {}).get(stage, {})
+            for metric, higher_is_worse in metrics_checked.items():
+                expected, actual = baseline.get(metric), metrics.get(metric)
+                if not expected or actual is None:
+                    continue
+                change = (actual - expected) / expected
+                if (change if higher_is_worse else -change) > threshold:
+                    regressions.append(f"{size} symbols, {stage}: {metric} {actual} vs baseline {expected} ({change:+.0%})")
+    return regressions
+
+
+class IngestionBenchmark:
+    """Runs ingestion, metrics and the daily report for synthetic universes against replayed providers"""
+
+    def __init__(self, sizes=None, latency=0, error_rate=0, seed=0):
+        self.sizes = sizes or settings.BENCHMARK_SIZES
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+
+    def provider_settings(self, directory):
+        """Settings that point every provider at the synthetic fixtures"""
+        return replay_settings(directory, self.latency, self.error_rate, self.seed)
+
+    def run_universe(self, size):
+        """Measure each stage for a fresh universe of the given size.
+
+        Every watermark is aged past its max age before the report, so the report re-ingests the whole
+        universe through ingest_many the way a worker does for stale symbols instead of rendering stored data.
+        """
+        symbols = synthetic_symbols(size)
+        with tempfile.TemporaryDirectory() as directory, self.provider_settings(directory):
+            write_fixtures(ProviderRecorder(), symbols, self.seed)
+            Stock.objects.all().delete()
+            stock_service = StockService()
+            email_service = EmailService()
+            results = {
+                'create_stock': measure(lambda: [stock_service.create_stock(symbol) for symbol in symbols]),
+                'update_metrics': measure(stock_service.update_metrics),
+            }
+            DatasetRefresh.objects.update(lastRefreshed=timezone.now() - timedelta(days=365))
+            results['send_stock_report'] = measure(lambda: email_service.send_stock_report(symbols))
+            return results
+
+    def run(self):
+        """Measure every universe size, keyed by size as a string so results round-trip through JSON"""
+        return {str(size): self.run_universe(size) for size in self.sizes}
@@ -0,0 +1,65 @@
+import time
+from datetime import datetime, time as dt_time, timedelta
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+from django.conf import settings
+from django.core.cache import caches
+
+MARKET_TIMEZONE = ZoneInfo('America/New_York')
+MARKET_CLOSE = dt_time(16, 0)
+
+
+def seconds_until_market_close(now=None):
+    """Seconds until the next weekday 4pm US/Eastern close"""
+    now = now or datetime.now(MARKET_TIMEZONE)
+    close = datetime.combine(now.date(), MARKET_CLOSE, tzinfo=MARKET_TIMEZONE)
+    if now >= close:
+        close += timedelta(days=1)
+    while close.weekday() >= 5:
+        close += timedelta(days=1)
+    return (close - now).total_seconds()
+
+
+class ProviderCache:
+    """Two-tier cache for provider responses: an in-process LRU in front of a persistent on-disk store"""
+
+    def __init__(self, enabled=None):
+        self.enabled = settings.PROVIDER_CACHE_ENABLED if enabled is None else enabled
+        self.memory = caches['provider_memory']
+        self.disk = caches['provider_disk']
+
+    def make_key(self, provider, function, symbol, params=None):
+        """Build the cache key for one provider call"""
+        return f"{provider}:{function}:{symbol}:{urlencode(sorted((params or {}).items()))}"
+
+    def get_ttl(self, dataset):
+        """Seconds a dataset stays fresh; 'market_close' keeps it until the next close"""
+        ttl = settings.PROVIDER_CACHE_TTLS.get(dataset, settings.PROVIDER_CACHE_DEFAULT_TTL)
+        if ttl == 'market_close':
+            return seconds_until_market_close()
+        return ttl
+
+    def get_or_fetch(self, provider, function, symbol, fetch, dataset=None, params=None):
+        """Return a cached response for the call, or run fetch and cache what it returns"""
+        if not self.enabled:
+            return fetch()
+        key = self.make_key(provider, function, symbol, params)
+        now = time.time()
+
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        entry = self.disk.get(key)
+        if entry is not None:
+            expires, value = entry
+            self.memory.set(key, value, max(expires - now, 0))
+            return value
+
+        value = fetch()
+        # Empty responses are usually transient provider failures, so they're never cached
+        if value is None or getattr(value, 'empty', False) or (isinstance(value, dict) and not value):
+            return value
+        ttl = self.get_ttl(dataset or function)
+        self.memory.set(key, value, ttl)
+        self.disk.set(key, (now + ttl, value), ttl)
+        return value
@@ -0,0 +1,73 @@
+from datetime import date, timedelta
+from itertools import groupby
+from statistics import median
+from django.conf import settings
+from stock_spot.models import QuarterlyEarning
+
+QUARTER_DAYS = 91
+HISTORY_QUARTERS = 4
+
+
+def expected_filing_date(earnings, latest_statement):
+    """Estimate when the first quarter missing from stored statements is (or was) reported.
+
+    earnings are (fiscalDateEnding, reportedDate) pairs ordered newest first and latest_statement is the
+    newest stored quarterly statement period. Returns None when there is no history to go on.
+    """
+    if earnings and (latest_statement is None or earnings[0][0] > latest_statement):
+        # Earnings are out for a quarter whose statements we don't have yet
+        missing = [reported for fiscal_date, reported in earnings if latest_statement is None or fiscal_date > latest_statement]
+        return missing[-1]
+
+    periods = sorted({fiscal_date for fiscal_date, _ in earnings} | ({latest_statement} if latest_statement else set()), reverse=True)
+    if not periods:
+        return None
+    recent = periods[:HISTORY_QUARTERS + 1]
+    spacing = median((newer - older).days for newer, older in zip(recent, recent[1:])) if len(recent) > 1 else QUARTER_DAYS
+    lags = [(reported - fiscal_date).days for fiscal_date, reported in earnings[:HISTORY_QUARTERS]]
+    lag = median(lags) if lags else settings.EARNINGS_DEFAULT_REPORT_LAG_DAYS
+    return periods[0] + timedelta(days=spacing + lag)
+
+
+class EarningsCalendar:
+    """Splits stocks into those near an expected filing and the rest, from stored earnings and statement history"""
+
+    def __init__(self, days_before=None, grace_days=None):
+        self.days_before = settings.EARNINGS_WINDOW_DAYS_BEFORE if days_before is None else days_before
+        self.grace_days = settings.EARNINGS_OVERDUE_GRACE_DAYS if grace_days is None else grace_days
+
+    def earnings_by_stock(self, stocks, today):
+        """Map stock id to its recent (fiscalDateEnding, reportedDate) pairs, newest first, in one query"""
+        rows = (
+            QuarterlyEarning.objects.filter(
+                stock__in=stocks,
+                fiscalDateEnding__gte=today - timedelta(days=QUARTER_DAYS * (HISTORY_QUARTERS + 2))
+            )
+            .order_by('stock_id', '-fiscalDateEnding')
+            .values_list('stock_id', 'fiscalDateEnding', 'reportedDate')
+        )
+        return {
+            stock_id: [(fiscal_date, reported) for _, fiscal_date, reported in group]
+            for stock_id, group in groupby(rows, key=lambda row: row[0])
+        }
+
+    def is_due(self, expected, today):
+        """Whether a filing is imminent or overdue; stocks with no history always are.
+
+        The expected date is for the first quarter missing from stored statements, so once it has passed
+        our statements are behind and the stock stays due until they arrive. The grace period only bounds
+        filings the provider never publishes.
+        """
+        if expected is None:
+            return True
+        return expected - timedelta(days=self.days_before) <= today <= expected + timedelta(days=self.grace_days)
+
+    def split(self, stocks, today=None):
+        """Partition stocks, each annotated with latestStatement, into (due, rest) keeping their order"""
+        today = today or date.today()
+        earnings = self.earnings_by_stock(stocks, today)
+        due, rest = [], []
+        for stock in stocks:
+            expected = expected_filing_date(earnings.get(stock.id, []), stock.latestStatement)
+            (due if self.is_due(expected, today) else rest).append(stock)
+        return due, rest
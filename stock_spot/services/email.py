@@ -1,5 +1,7 @@
 from datetime import date
 from stock_spot.models import Stock
+from stock_spot.services.freshness import stale_symbols
+from stock_spot.services.recording import ProviderRecorder
 from stock_spot.services.stock import StockService
 import requests
 from django.conf import settings
@@ -7,23 +9,31 @@ from django.template.loader import render_to_string
 
 class EmailService:
 
-    def __init__(self):
+    def __init__(self, recorder=None):
         self.base_url = settings.MAILGUN_BASE_URL
         self.domain = settings.MAILGUN_DOMAIN
         self.api_key = settings.MAILGUN_API_KEY
         self.from_email = settings.MAILGUN_FROM_EMAIL
         self.distribution_list = settings.EMAIL_DISTRIBUTION_LIST
+        self.recorder = recorder or ProviderRecorder()
 
-    def send_stock_report(self, stock_symbols):
+    def send_stock_report(self, stock_symbols, on_report=None):
         """Send stock report email with table of stocks."""
         report_date = date.today().strftime('%m-%d-%Y')
         stock_service = StockService()
-        stocks = []
-        # Fetch stock data from API and populate stocks list
-        for symbol in stock_symbols:
-            stock_service.create_stock(symbol)
-            stock = Stock.objects.filter(symbol=symbol).first()
-            stocks.append(stock)
+        # Render from stored data, re-ingesting only symbols that are missing or stale
+        if settings.REPORT_RENDER_FROM_SNAPSHOT:
+            symbols_to_ingest = stale_symbols(stock_symbols)
+        else:
+            symbols_to_ingest = stock_symbols
+        if symbols_to_ingest:
+            stock_service.ingest_many(
+                symbols_to_ingest,
+                on_report=on_report,
+                force=not settings.REPORT_RENDER_FROM_SNAPSHOT
+            )
+        stocks_by_symbol = Stock.objects.in_bulk(stock_symbols, field_name='symbol')
+        stocks = [stocks_by_symbol[symbol] for symbol in stock_symbols if symbol in stocks_by_symbol]
 
         # Render HTML template
         context = {
@@ -32,7 +42,7 @@ class EmailService:
         }
         html_content = render_to_string('stock-spot-email.html', context)
         
-        return requests.post(
+        return self.recorder.call('mailgun', 'messages', self.domain, lambda: requests.post(
             f"{self.base_url}/v3/{self.domain}/messages",
             auth=("api", self.api_key),
             data={
@@ -41,4 +51,4 @@ class EmailService:
                 "subject": f"Stock Report for {report_date}",
                 "html": html_content,
                 "text": f"Please find your stock report for {report_date} below."
-            })
\ No newline at end of file
+            }))
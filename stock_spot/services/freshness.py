@@ -0,0 +1,55 @@
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from stock_spot.models import DatasetRefresh
+
+
+def record_refresh(stock, dataset, latest_fiscal_date=None):
+    """Move a stock's watermark for a dataset forward after it was saved"""
+    DatasetRefresh.objects.update_or_create(
+        stock=stock,
+        dataset=dataset,
+        defaults={'lastRefreshed': timezone.now(), 'latestFiscalDate': latest_fiscal_date}
+    )
+
+
+def record_refreshes(stocks, dataset):
+    """Move the watermark for a dataset forward for many stocks at once"""
+    now = timezone.now()
+    DatasetRefresh.objects.bulk_create(
+        [DatasetRefresh(stock=stock, dataset=dataset, lastRefreshed=now) for stock in stocks],
+        update_conflicts=True,
+        unique_fields=['stock', 'dataset'],
+        update_fields=['lastRefreshed', 'latestFiscalDate'],
+        batch_size=500,
+    )
+
+
+def stale_symbols(symbols, max_ages=None):
+    """Return the symbols missing a stored refresh of any dataset within its max age, in order"""
+    max_ages = max_ages or settings.REPORT_MAX_DATA_AGE
+    now = timezone.now()
+    refreshes = DatasetRefresh.objects.filter(
+        stock__symbol__in=symbols,
+        dataset__in=list(max_ages)
+    ).values_list('stock__symbol', 'dataset', 'lastRefreshed')
+    fresh = Counter(
+        symbol for symbol, dataset, refreshed in refreshes
+        if now - refreshed <= timedelta(seconds=max_ages[dataset])
+    )
+    return [symbol for symbol in symbols if fresh[symbol] < len(max_ages)]
+
+
+def stale_datasets(stock, max_ages=None):
+    """Return the datasets whose stored refresh for the stock is missing or older than its max age"""
+    max_ages = max_ages or settings.INGESTION_MAX_DATA_AGE
+    now = timezone.now()
+    refreshed = dict(
+        DatasetRefresh.objects.filter(stock=stock, dataset__in=list(max_ages))
+        .values_list('dataset', 'lastRefreshed')
+    )
+    return [
+        dataset for dataset, max_age in max_ages.items()
+        if dataset not in refreshed or now - refreshed[dataset] > timedelta(seconds=max_age)
+    ]
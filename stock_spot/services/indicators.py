@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.db import transaction
+from stock_spot.models import DailyPrice, Stock, TechnicalIndicatorPoint
+from stock_spot.services.freshness import record_refreshes
+
+# Every function takes a (days x stocks) float matrix, oldest day first, with NaN before a stock's
+# first close, and returns a matrix of the same shape. The loop runs over days; each step is
+# vectorized across every stock at once.
+
+
+def sma(closes, period):
+    """Simple moving average; NaN until a stock has `period` closes"""
+    valid = ~np.isnan(closes)
+    sums = np.cumsum(np.where(valid, closes, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+    window_sums = sums.copy()
+    window_sums[period:] -= sums[:-period]
+    window_counts = counts.copy()
+    window_counts[period:] -= counts[:-period]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(window_counts == period, window_sums / period, np.nan)
+
+
+def ema(closes, period):
+    """Exponential moving average seeded with each stock's first close"""
+    alpha = 2 / (period + 1)
+    result = np.full(closes.shape, np.nan)
+    current = np.full(closes.shape[1], np.nan)
+    for day, row in enumerate(closes):
+        seeded = ~np.isnan(current)
+        current = np.where(seeded, alpha * row + (1 - alpha) * current, row)
+        result[day] = current
+    return result
+
+
+def rsi(closes, period=14):
+    """Relative strength index with Wilder smoothing, seeded by the mean of the first `period` changes.
+
+    Only gains gives 100, only losses 0 and no change at all 50.
+    """
+    changes = np.diff(closes, axis=0, prepend=np.nan)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+    valid = ~np.isnan(changes)
+
+    result = np.full(closes.shape, np.nan)
+    avg_gain = np.zeros(closes.shape[1])
+    avg_loss = np.zeros(closes.shape[1])
+    seen = np.zeros(closes.shape[1], dtype=int)
+    for day in range(len(closes)):
+        step = valid[day]
+        seen += step
+        warming = step & (seen <= period)
+        smoothing = step & (seen > period)
+        avg_gain = np.where(warming, avg_gain + gains[day] / period, avg_gain)
+        avg_loss = np.where(warming, avg_loss + losses[day] / period, avg_loss)
+        avg_gain = np.where(smoothing, (avg_gain * (period - 1) + gains[day]) / period, avg_gain)
+        avg_loss = np.where(smoothing, (avg_loss * (period - 1) + losses[day]) / period, avg_loss)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            value = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        # Flat closes have neither gains nor losses, which is neutral rather than overbought
+        value = np.where((avg_gain == 0) & (avg_loss == 0), 50.0, value)
+        result[day] = np.where(step & (seen >= period), value, np.nan)
+    return result
+
+
+def macd(closes, fast=12, slow=26, signal=9):
+    """MACD line, signal line and histogram"""
+    line = ema(closes, fast) - ema(closes, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+class IndicatorService:
+    """Computes technical indicators for many stocks at once from stored daily closes"""
+
+    def load_closes(self, stocks):
+        """Read closes for the stocks in one query as a (days x stocks) matrix.
+
+        Gaps inside a stock's history are forward-filled, but days after its last stored close stay NaN so a
+        stock that stopped updating never gets values for days it has no price on.
+        """
+        rows = (
+            DailyPrice.objects.filter(stock__in=stocks, close__isnull=False)
+            .order_by('date')
+            .values_list('date', 'stock_id', 'close')
+        )
+        frame = pd.DataFrame.from_records(list(rows), columns=['date', 'stock_id', 'close'])
+        if frame.empty:
+            return [], np.empty((0, len(stocks)))
+        matrix = (
+            frame.pivot(index='date', columns='stock_id', values='close')
+            .reindex(columns=[stock.id for stock in stocks])
+            .astype('float64')
+        )
+        matrix = matrix.ffill().where(matrix.bfill().notna())
+        return list(matrix.index), matrix.to_numpy()
+
+    def compute(self, closes):
+        """Every indicator's series for a close matrix, keyed by the name it is stored under"""
+        line, signal_line, histogram = macd(closes)
+        return {
+            'RSI': rsi(closes, settings.RSI_PERIOD),
+            'SMA50': sma(closes, 50),
+            'SMA200': sma(closes, 200),
+            'EMA20': ema(closes, 20),
+            'MACD': line,
+            'MACD_SIGNAL': signal_line,
+            'MACD_HIST': histogram,
+        }
+
+    def update(self, symbols=None):
+        """Compute indicators for the symbols (all stocks by default), store each latest value and write RSI to Stock"""
+        stocks = Stock.objects.all() if symbols is None else Stock.objects.filter(symbol__in=symbols)
+        stocks = list(stocks.only('id', 'symbol', 'relativeStrengthIndex'))
+        dates, closes = self.load_closes(stocks)
+        if not dates:
+            return {}
+
+        # Each stock's values are taken and dated at its own last close, not the newest day of any stock
+        has_close = ~np.isnan(closes)
+        last_day = len(dates) - 1 - np.argmax(has_close[::-1], axis=0)
+        columns = np.flatnonzero(has_close.any(axis=0))
+        points = []
+        latest_rsi = {}
+        for indicator, series in self.compute(closes).items():
+            for column in columns:
+                stock, day = stocks[column], last_day[column]
+                value = series[day, column]
+                if np.isnan(value):
+                    continue
+                value = round(float(value), 4)
+                points.append(TechnicalIndicatorPoint(stock=stock, indicator=indicator, date=dates[day], value=value))
+                if indicator == 'RSI':
+                    latest_rsi[stock] = value
+
+        with transaction.atomic():
+            TechnicalIndicatorPoint.objects.bulk_create(
+                points,
+                update_conflicts=True,
+                unique_fields=['stock', 'indicator', 'date'],
+                update_fields=['value'],
+                batch_size=1000,
+            )
+            for stock, value in latest_rsi.items():
+                stock.relativeStrengthIndex = value
+            Stock.objects.bulk_update(list(latest_rsi), ['relativeStrengthIndex'], batch_size=500)
+            record_refreshes(list(latest_rsi), 'relative_strength_index')
+        return {stock.symbol: value for stock, value in latest_rsi.items()}
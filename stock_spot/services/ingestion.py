@@ -0,0 +1,130 @@
+import threading
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from django.conf import settings
+from django.db import connections
+from stock_spot.schemas import IngestionReport
+
+
+class IngestionService:
+    """Service that fetches every provider dataset for a symbol concurrently, then saves them"""
+
+    def __init__(self, yfinance_service, alpha_vantage_service):
+        self.yfinance_service = yfinance_service
+        self.alpha_vantage_service = alpha_vantage_service
+        self.max_workers = settings.INGESTION_MAX_WORKERS
+        # Shared by every symbol ingested through this instance to cap calls in flight per provider
+        self.provider_limits = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in settings.INGESTION_PROVIDER_CONCURRENCY.items()
+        }
+
+    def get_sources(self):
+        """Map each dataset name to its (provider, fetch, save), in the order results are saved"""
+        yfinance = self.yfinance_service
+        alpha_vantage = self.alpha_vantage_service
+        sources = {
+            'stock_info': ('yfinance', yfinance.fetch_stock_info, yfinance.save_stock_info),
+            'annual_balance_sheet': ('yfinance', yfinance.fetch_annual_balance_sheet, yfinance.save_annual_balance_sheet),
+            'quarterly_balance_sheet': ('yfinance', yfinance.fetch_quarterly_balance_sheet, yfinance.save_quarterly_balance_sheet),
+            'annual_cashflow': ('yfinance', yfinance.fetch_annual_cashflow, yfinance.save_annual_cashflow),
+            'quarterly_cashflow': ('yfinance', yfinance.fetch_quarterly_cashflow, yfinance.save_quarterly_cashflow),
+            'annual_income_statement': ('yfinance', yfinance.fetch_annual_income_statement, yfinance.save_annual_income_statement),
+            'quarterly_income_statement': ('yfinance', yfinance.fetch_quarterly_income_statement, yfinance.save_quarterly_income_statement),
+            'relative_strength_index': ('alpha_vantage', alpha_vantage.fetch_relative_strength_index, alpha_vantage.save_relative_strength_index),
+        }
+        # RSI computed locally from stored prices needs no per-symbol fetch
+        if settings.RSI_SOURCE == 'local':
+            del sources['relative_strength_index']
+        return sources
+
+    def get_timeout(self, source):
+        """Seconds a source may run once it holds its provider slot"""
+        return settings.INGESTION_FETCH_TIMEOUTS.get(source, settings.INGESTION_FETCH_TIMEOUT)
+
+    def fetch_all(self, symbol, report, datasets=None):
+        """Run every fetch for the symbol in parallel and collect the results that arrived in time"""
+        sources = self.get_sources()
+        if datasets is not None:
+            sources = {source: spec for source, spec in sources.items() if source in datasets}
+        if not sources:
+            return {}
+        results = {}
+        started = {}
+
+        def run(source, provider, fetch):
+            try:
+                with self.provider_limits.get(provider) or nullcontext():
+                    started[source] = time.monotonic()
+                    return fetch(symbol)
+            finally:
+                # Fetches may touch the database (e.g. rate limiting), so don't leak this thread's connection
+                connections.close_all()
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(sources)),
+            thread_name_prefix=f"ingest-{symbol}"
+        )
+        try:
+            pending = {
+                executor.submit(run, source, provider, fetch): source
+                for source, (provider, fetch, save) in sources.items()
+            }
+            while pending:
+                done, _ = wait(pending, timeout=settings.INGESTION_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = pending.pop(future)
+                    try:
+                        results[source] = future.result()
+                    except Exception as e:
+                        report.failed[source] = str(e)
+                # Time spent queued behind other symbols for a provider slot doesn't count
+                now = time.monotonic()
+                for future, source in list(pending.items()):
+                    timeout = self.get_timeout(source)
+                    if source in started and now - started[source] > timeout:
+                        report.failed[source] = f"timed out after {timeout}s"
+                        del pending[future]
+        finally:
+            # Don't wait on fetches that timed out; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.yfinance_service.release_ticker(symbol)
+        return results
+
+    def save_all(self, stock, results, report):
+        """Save fetched results to the resolved Stock on the calling thread so database access stays single-threaded"""
+        started = time.monotonic()
+        for source, (provider, fetch, save) in self.get_sources().items():
+            if source not in results:
+                continue
+            try:
+                saved = save(stock, results[source])
+            except Exception as e:
+                report.failed[source] = str(e)
+                continue
+            if saved is None:
+                report.failed[source] = "no data saved"
+            else:
+                report.succeeded.append(source)
+        report.elapsed += time.monotonic() - started
+
+    def fetch(self, symbol, datasets=None):
+        """Fetch provider data for a symbol (all datasets by default), returning its report and the fetched results"""
+        started = time.monotonic()
+        report = IngestionReport(symbol=symbol)
+        results = self.fetch_all(symbol, report, datasets)
+        report.elapsed = time.monotonic() - started
+        return report, results
+
+    def ingest(self, stock, datasets=None):
+        """Fetch and save provider data for an existing Stock, returning a per-source report"""
+        report, results = self.fetch(stock.symbol, datasets)
+        self.save_all(stock, results, report)
+        self.log_failures(report)
+        return report
+
+    def log_failures(self, report):
+        """Print every source that failed for the report's symbol"""
+        for source, error in report.failed.items():
+            print(f"Ingestion of {source} failed for {report.symbol}: {error}")
@@ -0,0 +1,92 @@
+from itertools import groupby
+from stock_spot.models import AnnualIncomeStatement, QuarterlyIncomeStatement, Stock
+
+CAGR_SPAN = 4
+
+
+def eps_growth_over_past_year(quarters):
+    """YoY diluted EPS growth from (fiscalDateEnding, dilutedEPS) pairs ordered newest first"""
+    recent_date, recent_eps = quarters[0]
+    if not recent_eps:
+        return None
+    cutoff = recent_date.replace(year=recent_date.year - 1)
+    prior_eps = next((eps for fiscal_date, eps in quarters if fiscal_date <= cutoff), None)
+    if not prior_eps:
+        return None
+    return ((recent_eps - prior_eps) / prior_eps) * 100
+
+
+def earnings_cagr(years):
+    """Compounded annual diluted EPS growth over up to four years from pairs ordered newest first"""
+    span = min(CAGR_SPAN, len(years))
+    recent_date, recent_eps = years[0]
+    cutoff = recent_date.replace(year=recent_date.year - (span - 1))
+    old_eps = [eps for fiscal_date, eps in years if fiscal_date >= cutoff][-1]
+    if not old_eps or not recent_eps or old_eps < 0 or recent_eps < 0:
+        return None
+    return ((float(recent_eps / old_eps) ** (1 / span)) - 1) * 100
+
+
+# Stock field -> (statement model its diluted EPS series is read from, calculation)
+METRICS = {
+    'yoyEPSPercentGrowth': (QuarterlyIncomeStatement, eps_growth_over_past_year),
+    'compoundedAnnualGrowthRate': (AnnualIncomeStatement, earnings_cagr),
+}
+
+
+class MetricsService:
+    """Computes EPS growth metrics for many stocks in a few set-based queries"""
+
+    def fits(self, field_name, value):
+        """Whether a value fits the Stock decimal field it is written to"""
+        field = Stock._meta.get_field(field_name)
+        return abs(value) < 10 ** (field.max_digits - field.decimal_places)
+
+    def series_by_stock(self, model, stocks):
+        """Map stock id to its (fiscalDateEnding, dilutedEPS) pairs, newest first, in one query"""
+        rows = (
+            model.objects.filter(stock__in=stocks)
+            .order_by('stock_id', '-fiscalDateEnding')
+            .values_list('stock_id', 'fiscalDateEnding', 'dilutedEPS')
+        )
+        return {
+            stock_id: [(fiscal_date, eps) for _, fiscal_date, eps in group]
+            for stock_id, group in groupby(rows, key=lambda row: row[0])
+        }
+
+    def update(self, symbols=None, fields=None):
+        """Recompute YoY EPS growth and CAGR (or only the given fields) for the symbols and save them in bulk.
+
+        Returns each symbol's freshly computed values, None where a metric can't be computed.
+        """
+        fields = fields or list(METRICS)
+        stocks = Stock.objects.all() if symbols is None else Stock.objects.filter(symbol__in=symbols)
+        stocks = list(stocks.only('id', 'symbol', *fields))
+        series = {field: self.series_by_stock(METRICS[field][0], stocks) for field in fields}
+
+        changed = []
+        computed = {}
+        for stock in stocks:
+            metrics = dict.fromkeys(fields)
+            for field in fields:
+                if stock.id not in series[field]:
+                    continue
+                try:
+                    metrics[field] = METRICS[field][1](series[field][stock.id])
+                except Exception as e:
+                    print(f"Error calculating {field} for {stock.symbol}: {e}")
+            # Like the per-symbol calculations, a metric that can't be computed keeps its stored value
+            metrics = {
+                field: value if value is not None and self.fits(field, value) else None
+                for field, value in metrics.items()
+            }
+            for field, value in metrics.items():
+                if value is not None:
+                    setattr(stock, field, value)
+            if any(value is not None for value in metrics.values()):
+                changed.append(stock)
+            computed[stock.symbol] = metrics
+
+        if changed:
+            Stock.objects.bulk_update(changed, fields, batch_size=500)
+        return computed
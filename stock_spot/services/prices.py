@@ -0,0 +1,130 @@
+from datetime import date, timedelta
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, OuterRef, Subquery
+from stock_spot.models import DailyPrice, Stock, StockSnapshot
+
+PRICE_COLUMNS = {'Open': 'open', 'High': 'high', 'Low': 'low', 'Close': 'close', 'Volume': 'volume'}
+
+
+def frames_by_symbol(frame, symbols):
+    """Split a multi-ticker download into one OHLCV frame per symbol"""
+    if frame is None or frame.empty:
+        return {}
+    if not isinstance(frame.columns, pd.MultiIndex):
+        # A single ticker may come back without the ticker level
+        return {symbols[0]: frame}
+    tickers = set(frame.columns.get_level_values(0))
+    return {symbol: frame[symbol] for symbol in symbols if symbol in tickers}
+
+
+def frame_to_price_rows(frame):
+    """Convert one symbol's OHLCV frame to (date, values) pairs, skipping days without a close"""
+    frame = frame.reindex(columns=list(PRICE_COLUMNS)).apply(pd.to_numeric, errors='coerce')
+    frame = frame[frame['Close'].notna()]
+    values = frame.to_numpy(dtype='float64').round(4)
+    missing = ~np.isfinite(values)
+    cells = values.astype(object)
+    volume = list(PRICE_COLUMNS).index('Volume')
+    cells[:, volume] = np.where(missing[:, volume], 0, values[:, volume]).astype(np.int64).astype(object)
+    cells[missing] = None
+    names = list(PRICE_COLUMNS.values())
+    return [
+        (timestamp.date(), dict(zip(names, row)))
+        for timestamp, row in zip(frame.index, cells)
+    ]
+
+
+def last_close(frame):
+    """Most recent non-missing close in one symbol's frame, or None"""
+    closes = pd.to_numeric(frame['Close'], errors='coerce').dropna() if 'Close' in frame else None
+    if closes is None or closes.empty:
+        return None
+    return Decimal(str(round(float(closes.iloc[-1]), 2)))
+
+
+class PriceHistoryService:
+    """Keeps DailyPrice history current for many stocks using batched multi-ticker downloads"""
+
+    def __init__(self, yfinance_service):
+        self.yfinance_service = yfinance_service
+        self.batch_size = settings.PRICE_DOWNLOAD_BATCH_SIZE
+
+    def get_start(self, stocks):
+        """Earliest date any of the stocks needs, re-fetching each one's latest stored day in case it was partial"""
+        latest = dict(
+            DailyPrice.objects.filter(stock__in=stocks)
+            .values('stock_id')
+            .annotate(latest=Max('date'))
+            .values_list('stock_id', 'latest')
+        )
+        default_start = date.today() - timedelta(days=settings.PRICE_HISTORY_LOOKBACK_DAYS)
+        return min(latest.get(stock.id, default_start) for stock in stocks)
+
+    def refresh_history(self, symbols=None):
+        """Download and upsert daily bars for the symbols (all stocks by default), returning rows written"""
+        stocks = Stock.objects.all() if symbols is None else Stock.objects.filter(symbol__in=symbols)
+        stocks = list(stocks.only('id', 'symbol'))
+        written = 0
+        for offset in range(0, len(stocks), self.batch_size):
+            batch = stocks[offset:offset + self.batch_size]
+            frame = self.yfinance_service.download_prices(
+                [stock.symbol for stock in batch],
+                start=self.get_start(batch)
+            )
+            written += len(self.save_history(batch, frame))
+        return written
+
+    def refresh_prices(self, symbols=None):
+        """Update currentPrice for the symbols (all stocks by default) from one multi-ticker download per batch"""
+        stocks = Stock.objects.all() if symbols is None else Stock.objects.filter(symbol__in=symbols)
+        stocks = list(stocks.only('id', 'symbol', 'currentPrice', 'startingPrice'))
+        changed = []
+        for offset in range(0, len(stocks), self.batch_size):
+            batch = stocks[offset:offset + self.batch_size]
+            # A few days of daily bars always include the last close, and today's bar tracks the live price
+            frame = self.yfinance_service.download_prices(
+                [stock.symbol for stock in batch],
+                period=settings.PRICE_REFRESH_PERIOD
+            )
+            by_symbol = frames_by_symbol(frame, [stock.symbol for stock in batch])
+            for stock in batch:
+                price = last_close(by_symbol[stock.symbol]) if stock.symbol in by_symbol else None
+                if price is None or price == stock.currentPrice:
+                    continue
+                stock.currentPrice = price
+                if stock.startingPrice is None:
+                    stock.startingPrice = price
+                changed.append(stock)
+            # The same bars keep DailyPrice current for the local indicators
+            self.save_history(batch, frame)
+
+        if changed:
+            with transaction.atomic():
+                Stock.objects.bulk_update(changed, ['currentPrice', 'startingPrice'], batch_size=500)
+                StockSnapshot.objects.filter(stock__in=changed).update(
+                    currentPrice=Subquery(Stock.objects.filter(pk=OuterRef('stock_id')).values('currentPrice')[:1])
+                )
+        return {stock.symbol: stock.currentPrice for stock in changed}
+
+    def save_history(self, stocks, frame):
+        """Upsert every bar of a multi-ticker download in one batched transaction"""
+        by_symbol = frames_by_symbol(frame, [stock.symbol for stock in stocks])
+        records = [
+            DailyPrice(stock=stock, date=day, **values)
+            for stock in stocks if stock.symbol in by_symbol
+            for day, values in frame_to_price_rows(by_symbol[stock.symbol])
+        ]
+        if not records:
+            return []
+        with transaction.atomic():
+            return DailyPrice.objects.bulk_create(
+                records,
+                update_conflicts=True,
+                unique_fields=['stock', 'date'],
+                update_fields=list(PRICE_COLUMNS.values()),
+                batch_size=1000,
+            )
@@ -0,0 +1,59 @@
+import time
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from stock_spot.models import RateLimitBucket
+
+
+class RateLimitExceeded(Exception):
+    """Raised when the next token would arrive later than the limiter is allowed to wait"""
+
+
+class TokenBucketRateLimiter:
+    """Token buckets stored in the database so every worker and process draws on one quota"""
+
+    def __init__(self, name, limits, max_wait):
+        # limits maps a window name to (capacity, period in seconds), e.g. {'minute': (5, 60)}
+        self.name = name
+        self.limits = limits
+        self.max_wait = max_wait
+
+    def acquire(self):
+        """Block until every bucket has a token, consume one from each and return seconds waited"""
+        waited = 0.0
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return waited
+            if waited + wait > self.max_wait:
+                raise RateLimitExceeded(f"{self.name} quota exhausted, next call allowed in {wait:.0f}s")
+            time.sleep(wait)
+            waited += wait
+
+    def _try_acquire(self):
+        """Refill every bucket and take a token from each, or return seconds until all have one"""
+        names = [f"{self.name}:{window}" for window in self.limits]
+        with transaction.atomic():
+            # select_for_update is a no-op on SQLite, so a write that changes nothing takes its database
+            # write lock before the buckets are read; other workers then wait instead of reading stale tokens
+            RateLimitBucket.objects.filter(name__in=names).update(tokens=F('tokens'))
+            now = timezone.now()
+            buckets = []
+            wait = 0.0
+            for name, (capacity, period) in zip(names, self.limits.values()):
+                bucket, created = RateLimitBucket.objects.select_for_update().get_or_create(
+                    name=name,
+                    defaults={'tokens': capacity, 'lastRefill': now}
+                )
+                rate = capacity / period
+                elapsed = max((now - bucket.lastRefill).total_seconds(), 0)
+                bucket.tokens = min(capacity, bucket.tokens + elapsed * rate)
+                bucket.lastRefill = now
+                if bucket.tokens < 1:
+                    wait = max(wait, (1 - bucket.tokens) / rate)
+                buckets.append(bucket)
+            if not wait:
+                for bucket in buckets:
+                    bucket.tokens -= 1
+            RateLimitBucket.objects.bulk_update(buckets, ['tokens', 'lastRefill'])
+            return wait
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import pickle
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+import requests
+from django.conf import settings
+
+MODES = ('live', 'record', 'replay')
+
+
+class ProviderReplayError(requests.ConnectionError):
+    """Raised in place of a provider failure when replaying, so callers handle it like a dropped connection"""
+
+
+class MissingFixture(ProviderReplayError):
+    """Raised when a replayed call was never recorded"""
+
+
+class ProviderRecorder:
+    """Records provider responses to fixture files, or replays them offline with injected latency and errors"""
+
+    def __init__(self, mode=None, directory=None, latency=None, error_rates=None, seed=None):
+        self.mode = mode or settings.PROVIDER_MODE
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown provider mode {self.mode!r}, expected one of {', '.join(MODES)}")
+        self.directory = Path(directory or settings.PROVIDER_FIXTURE_DIR)
+        self.latency = settings.PROVIDER_REPLAY_LATENCY if latency is None else latency
+        self.error_rates = settings.PROVIDER_REPLAY_ERROR_RATES if error_rates is None else error_rates
+        self.seed = settings.PROVIDER_REPLAY_SEED if seed is None else seed
+
+    def path(self, provider, function, symbol, params=None):
+        """Fixture path for one call, without its extension"""
+        name = symbol or '_'
+        if params:
+            name += '-' + hashlib.sha1(urlencode(sorted(params.items())).encode()).hexdigest()[:12]
+        return self.directory / provider / function / name
+
+    def save(self, provider, function, symbol, value, params=None):
+        """Write a response fixture: JSON when it is plain JSON data, a pickle otherwise (DataFrames, responses)"""
+        path = self.path(provider, function, symbol, params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            content, suffix = json.dumps(value).encode(), '.json'
+        except (TypeError, ValueError):
+            content, suffix = pickle.dumps(value), '.pkl'
+        # Written to a temporary file first so concurrent recordings never leave a partial fixture behind
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(content)
+        os.replace(temporary, path.with_name(path.name + suffix))
+
+    def load(self, provider, function, symbol, params=None):
+        """Read a recorded response fixture"""
+        path = self.path(provider, function, symbol, params)
+        # Suffixes are appended rather than swapped in, since symbols like BRK.B contain dots
+        recorded = path.with_name(path.name + '.json')
+        if recorded.exists():
+            return json.loads(recorded.read_bytes())
+        recorded = path.with_name(path.name + '.pkl')
+        if recorded.exists():
+            return pickle.loads(recorded.read_bytes())
+        raise MissingFixture(f"No recorded {provider} {function} response for {symbol}")
+
+    def simulate(self, provider, function, symbol, params=None):
+        """Wait out the configured latency and fail the share of calls set by the provider's error rate.
+
+        Whether a call fails depends only on the seed and the call, so replays are reproducible.
+        """
+        delay = self.latency.get(provider, 0)
+        if delay:
+            time.sleep(delay)
+        key = f"{self.seed}:{provider}:{function}:{symbol}:{urlencode(sorted((params or {}).items()))}"
+        if random.Random(key).random() < self.error_rates.get(provider, 0):
+            raise ProviderReplayError(f"Injected {provider} failure for {function} {symbol}")
+
+    def call(self, provider, function, symbol, fetch, params=None):
+        """Run fetch live, record what it returns, or replay the recorded response depending on the mode"""
+        if self.mode == 'live':
+            return fetch()
+        if self.mode == 'record':
+            value = fetch()
+            self.save(provider, function, symbol, value, params)
+            return value
+        self.simulate(provider, function, symbol, params)
+        return self.load(provider, function, symbol, params)
+
+    def call_batch(self, provider, function, symbols, fetch, split, join, params=None):
+        """Like call for a multi-symbol request, keeping one fixture per symbol so any batch can be replayed.
+
+        split maps the live response to {symbol: part} and join builds a response from such a map.
+        """
+        if self.mode == 'live':
+            return fetch()
+        if self.mode == 'record':
+            value = fetch()
+            for symbol, part in split(value).items():
+                self.save(provider, function, symbol, part, params)
+            return value
+        self.simulate(provider, function, ','.join(symbols), params)
+        parts = {}
+        for symbol in symbols:
+            try:
+                parts[symbol] = self.load(provider, function, symbol, params)
+            except MissingFixture:
+                # A live batch download also just leaves out symbols it has no data for
+                continue
+        return join(parts)
@@ -0,0 +1,71 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from stock_spot.models import ReportJob
+from stock_spot.services.email import EmailService
+
+
+class ReportJobService:
+    """Service for queueing daily report jobs in the database and running them from a worker"""
+
+    def enqueue(self, symbols):
+        """Queue a report for the symbols and return the job"""
+        return ReportJob.objects.create(
+            symbols=symbols,
+            progress={symbol: 'pending' for symbol in symbols}
+        )
+
+    def claim_next(self):
+        """Mark the oldest queued job as running and return it, or None if the queue is empty.
+
+        Jobs left running past REPORT_JOB_TIMEOUT belong to a worker that died, so they are queued again first.
+        """
+        with transaction.atomic():
+            ReportJob.objects.filter(
+                status=ReportJob.RUNNING,
+                startedAt__lt=timezone.now() - timedelta(seconds=settings.REPORT_JOB_TIMEOUT)
+            ).update(status=ReportJob.QUEUED, startedAt=None)
+            job = (
+                ReportJob.objects.select_for_update(skip_locked=True)
+                .filter(status=ReportJob.QUEUED)
+                .order_by('createdAt')
+                .first()
+            )
+            if job is None:
+                return None
+            job.status = ReportJob.RUNNING
+            job.startedAt = timezone.now()
+            job.save(update_fields=['status', 'startedAt'])
+            return job
+
+    def run(self, job):
+        """Ingest the job's symbols, send the report email and record the outcome"""
+        def on_report(report):
+            job.progress[report.symbol] = 'succeeded' if report.ok else 'failed'
+            job.save(update_fields=['progress'])
+
+        try:
+            response = EmailService().send_stock_report(job.symbols, on_report=on_report)
+            # Symbols that were fresh enough to render from stored data were never re-ingested
+            for symbol, state in job.progress.items():
+                if state == 'pending':
+                    job.progress[symbol] = 'fresh'
+            if response.status_code == 200:
+                job.status = ReportJob.SUCCEEDED
+            else:
+                job.status = ReportJob.FAILED
+                job.error = f"Failed to send email: {response.text}"
+        except Exception as e:
+            job.status = ReportJob.FAILED
+            job.error = str(e)
+        job.finishedAt = timezone.now()
+        job.save(update_fields=['status', 'progress', 'error', 'finishedAt'])
+        return job
+
+    def run_next(self):
+        """Claim and run the next queued job, returning it or None when there is nothing to do"""
+        job = self.claim_next()
+        if job is None:
+            return None
+        return self.run(job)
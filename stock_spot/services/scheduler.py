@@ -0,0 +1,130 @@
+import math
+import time
+from datetime import datetime, time as dt_time, timedelta
+from django.conf import settings
+from django.db.models import F, Min, OuterRef, Q, Subquery
+from django.utils import timezone
+from stock_spot.models import QuarterlyIncomeStatement, ScheduledTask, Stock
+from stock_spot.services.cache import MARKET_CLOSE, MARKET_TIMEZONE
+from stock_spot.services.earnings_calendar import EarningsCalendar
+
+MARKET_OPEN = dt_time(9, 30)
+
+STATEMENT_DATASETS = [
+    'annual_balance_sheet',
+    'quarterly_balance_sheet',
+    'annual_cashflow',
+    'quarterly_cashflow',
+    'annual_income_statement',
+    'quarterly_income_statement',
+]
+
+
+def is_market_open(now=None):
+    """Whether US markets are in their regular weekday session (exchange holidays aren't tracked)"""
+    now = (now or timezone.now()).astimezone(MARKET_TIMEZONE)
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def last_market_close(now=None):
+    """The most recent weekday 4pm US/Eastern close at or before now"""
+    now = (now or timezone.now()).astimezone(MARKET_TIMEZONE)
+    close = datetime.combine(now.date(), MARKET_CLOSE, tzinfo=MARKET_TIMEZONE)
+    if now < close:
+        close -= timedelta(days=1)
+    while close.weekday() >= 5:
+        close -= timedelta(days=1)
+    return close
+
+
+class RefreshScheduler:
+    """Runs each refresh task when its cadence says it is due, persisting last runs so restarts don't repeat work"""
+
+    def __init__(self, stock_service, schedule=None):
+        self.stock_service = stock_service
+        self.schedule = schedule or settings.REFRESH_SCHEDULE
+        self.earnings_calendar = EarningsCalendar()
+        self.tasks = {
+            'prices': self.refresh_prices,
+            'indicators': self.refresh_indicators,
+            'statements': self.refresh_statements,
+        }
+
+    def is_due(self, spec, last_run, now):
+        """Whether a task with the given cadence should run now"""
+        if spec.get('market_hours') and not is_market_open(now):
+            return False
+        if 'after_close' in spec:
+            ready = last_market_close(now) + timedelta(seconds=spec['after_close'])
+            return now >= ready and (last_run is None or last_run < ready)
+        return last_run is None or (now - last_run).total_seconds() >= spec['interval']
+
+    def run_due(self, now=None):
+        """Run every due task once, returning a map of task name to its result"""
+        now = now or timezone.now()
+        last_runs = dict(ScheduledTask.objects.values_list('name', 'lastRun'))
+        results = {}
+        for name, spec in self.schedule.items():
+            if not self.is_due(spec, last_runs.get(name), now):
+                continue
+            started = time.monotonic()
+            error = ''
+            try:
+                results[name] = self.tasks[name](spec)
+            except Exception as e:
+                # The run still counts, so a failing provider isn't retried every tick
+                error = str(e)
+                print(f"Error running scheduled {name} refresh: {e}")
+            ScheduledTask.objects.update_or_create(
+                name=name,
+                defaults={'lastRun': now, 'lastDuration': time.monotonic() - started, 'lastError': error}
+            )
+        return results
+
+    def refresh_prices(self, spec):
+        """Update current prices for the whole universe"""
+        return self.stock_service.price_history_service.refresh_prices()
+
+    def refresh_indicators(self, spec):
+        """Capture closing prices, then recompute RSI and the snapshots that expose it"""
+        prices = self.stock_service.price_history_service.refresh_prices()
+        if settings.RSI_SOURCE == 'local':
+            self.stock_service.indicator_service.update()
+            self.stock_service.update_metrics()
+        else:
+            symbols = list(Stock.objects.values_list('symbol', flat=True))
+            self.stock_service.ingest_many(symbols, force=True, only=['relative_strength_index'])
+        return prices
+
+    def share(self, stocks, interval, max_age):
+        """The first (stalest) part of a tier, sized so every stock in it comes round once per max_age"""
+        return stocks[:math.ceil(len(stocks) * interval / max_age)]
+
+    def statement_symbols(self, spec):
+        """Symbols whose statements to refresh this run, stocks near an expected filing first"""
+        stocks = list(
+            Stock.objects.annotate(
+                statementsRefreshed=Min(
+                    'dataset_refreshes__lastRefreshed',
+                    filter=Q(dataset_refreshes__dataset__in=STATEMENT_DATASETS)
+                ),
+                latestStatement=Subquery(
+                    QuarterlyIncomeStatement.objects.filter(stock=OuterRef('pk'))
+                    .order_by('-fiscalDateEnding')
+                    .values('fiscalDateEnding')[:1]
+                )
+            )
+            .order_by(F('statementsRefreshed').asc(nulls_first=True), 'id')
+            .only('id', 'symbol')
+        )
+        # Filings only change statements around reporting dates; everything else is low priority
+        due, rest = self.earnings_calendar.split(stocks)
+        selected = self.share(due, spec['interval'], spec['due_max_age']) + self.share(rest, spec['interval'], spec['max_age'])
+        return [stock.symbol for stock in selected]
+
+    def refresh_statements(self, spec):
+        """Refresh financial statements for this run's share of the universe"""
+        symbols = self.statement_symbols(spec)
+        if not symbols:
+            return {}
+        return self.stock_service.ingest_many(symbols, force=True, only=STATEMENT_DATASETS)
@@ -0,0 +1,190 @@
+import re
+from datetime import date
+from decimal import Decimal
+from django.db import models
+from django.db.models import Q
+from stock_spot.models import StockSnapshot
+from stock_spot.pagination import keyset_paginate
+
+# Short names accepted in filters, sorting and field lists alongside snapshot field names
+FIELD_ALIASES = {
+    'rsi': 'relativeStrengthIndex',
+    'price': 'currentPrice',
+    'yoyEPSGrowth': 'yoyEPSPercentGrowth',
+    'cagr': 'compoundedAnnualGrowthRate',
+}
+
+OPERATORS = {
+    '<': 'lt',
+    '<=': 'lte',
+    '>': 'gt',
+    '>=': 'gte',
+    '=': 'exact',
+    '==': 'exact',
+    '!=': 'exact',
+}
+
+NUMERIC_FIELDS = (models.DecimalField, models.IntegerField, models.FloatField)
+
+TOKEN_PATTERN = re.compile(
+    r'\s*(?:(<=|>=|==|!=|<|>|=)|(\()|(\))|([A-Za-z_][A-Za-z0-9_]*)|(\d{4}-\d{2}-\d{2})|(-?\d+(?:\.\d+)?))'
+)
+
+
+class ScreenError(ValueError):
+    """Raised when a screen's filter, ordering or field list is invalid"""
+
+
+def screenable_fields():
+    """Snapshot fields that can be filtered, sorted and returned"""
+    return [field.name for field in StockSnapshot._meta.concrete_fields if field.name not in ('id', 'stock')]
+
+
+def resolve_field(name):
+    """Map an alias or snapshot field name to the snapshot field"""
+    field = FIELD_ALIASES.get(name, name)
+    if field not in screenable_fields():
+        raise ScreenError(f"Unknown field: {name}")
+    return field
+
+
+def tokenize(expression):
+    """Split a filter expression into operator, parenthesis, word, date and number tokens"""
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if not match:
+            raise ScreenError(f"Unexpected input at position {position}: {expression[position:]!r}")
+        operator, open_paren, close_paren, word, date, number = match.groups()
+        if operator:
+            tokens.append(('op', operator))
+        elif open_paren or close_paren:
+            tokens.append(('paren', open_paren or close_paren))
+        elif word:
+            tokens.append(('word', word))
+        elif date:
+            tokens.append(('date', date))
+        else:
+            tokens.append(('number', number))
+        position = match.end()
+    return tokens
+
+
+class FilterCompiler:
+    """Compiles a filter expression such as 'rsi < 30 and (cagr > 15 or price >= 10)' into a Q object
+
+    Grammar: or_expr := and_expr ('or' and_expr)*; and_expr := term ('and' term)*;
+    term := 'not' term | '(' or_expr ')' | field operator (number | YYYY-MM-DD | 'null')
+    """
+
+    def __init__(self, expression):
+        self.tokens = tokenize(expression)
+        self.position = 0
+
+    def compile(self):
+        if not self.tokens:
+            return Q()
+        q = self.or_expr()
+        if self.position != len(self.tokens):
+            raise ScreenError(f"Unexpected token: {self.tokens[self.position][1]}")
+        return q
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, kind=None):
+        token = self.peek()
+        if token[0] is None or (kind and token[0] != kind):
+            raise ScreenError(f"Expected {kind or 'more input'}, got {token[1] or 'end of filter'}")
+        self.position += 1
+        return token[1]
+
+    def keyword(self, word):
+        kind, value = self.peek()
+        if kind == 'word' and value.lower() == word:
+            self.position += 1
+            return True
+        return False
+
+    # Under 'not' each comparison is negated and, by De Morgan, 'and' and 'or' swap
+    def or_expr(self, negated=False):
+        q = self.and_expr(negated)
+        while self.keyword('or'):
+            right = self.and_expr(negated)
+            q = q & right if negated else q | right
+        return q
+
+    def and_expr(self, negated=False):
+        q = self.term(negated)
+        while self.keyword('and'):
+            right = self.term(negated)
+            q = q | right if negated else q & right
+        return q
+
+    def term(self, negated=False):
+        if self.keyword('not'):
+            return self.term(not negated)
+        if self.peek() == ('paren', '('):
+            self.take()
+            q = self.or_expr(negated)
+            if self.take('paren') != ')':
+                raise ScreenError("Expected )")
+            return q
+        name = self.take('word')
+        field = resolve_field(name)
+        operator = self.take('op')
+        # '!=' and a negated comparison both mean the opposite of the plain lookup
+        inverted = (operator == '!=') != negated
+        if self.keyword('null'):
+            if operator not in ('=', '==', '!='):
+                raise ScreenError("null can only be compared with = or !=")
+            q = Q(**{f"{field}__isnull": True})
+            return ~q if inverted else q
+        q = Q(**{f"{field}__{OPERATORS[operator]}": self.value(name, field)})
+        if inverted:
+            # A bare ~Q also matches nulls; a stock without the value neither equals nor differs from it
+            return ~q & Q(**{f"{field}__isnull": False})
+        return q
+
+    def value(self, name, field):
+        """Read the literal compared with a field, which must be a date for date fields and a number otherwise"""
+        model_field = StockSnapshot._meta.get_field(field)
+        kind, token = self.peek()
+        if isinstance(model_field, models.DateField):
+            if kind != 'date':
+                raise ScreenError(f"{name} must be compared with a YYYY-MM-DD date")
+            self.take()
+            try:
+                return date.fromisoformat(token)
+            except ValueError as e:
+                raise ScreenError(f"Invalid date: {token}") from e
+        if not isinstance(model_field, NUMERIC_FIELDS):
+            raise ScreenError(f"{name} can only be compared with null")
+        if kind != 'number':
+            raise ScreenError(f"{name} must be compared with a number")
+        self.take()
+        return Decimal(token)
+
+
+class ScreeningService:
+    """Runs stock screens against the StockSnapshot table as a single query"""
+
+    def screen(self, expression='', order='symbol', fields=None, cursor=None, limit=50):
+        """Return the page of snapshots matching the expression and the cursor for the next page"""
+        q = FilterCompiler(expression or '').compile()
+        descending = order.startswith('-')
+        order_field = resolve_field(order.lstrip('-'))
+        fields = [resolve_field(field) for field in fields] if fields else screenable_fields()
+        if 'symbol' not in fields:
+            fields.insert(0, 'symbol')
+
+        queryset = StockSnapshot.objects.filter(q).values('pk', order_field, *fields)
+        rows, next_cursor = keyset_paginate(
+            queryset,
+            f"{'-' if descending else ''}{order_field}",
+            cursor=cursor,
+            limit=limit
+        )
+        return [{field: row[field] for field in fields} for row in rows], next_cursor
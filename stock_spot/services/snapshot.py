@@ -0,0 +1,68 @@
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from stock_spot.models import (
+    Stock, StockSnapshot,
+    QuarterlyIncomeStatement, AnnualIncomeStatement,
+    QuarterlyBalanceSheet,
+    QuarterlyCashFlow, AnnualCashFlow
+)
+
+# Snapshot field -> (statement model, statement field), each read from the stock's latest period
+LATEST_PERIOD_FIELDS = {
+    'latestQuarterEnding': (QuarterlyIncomeStatement, 'fiscalDateEnding'),
+    'quarterlyRevenue': (QuarterlyIncomeStatement, 'totalRevenue'),
+    'quarterlyNetIncome': (QuarterlyIncomeStatement, 'netIncome'),
+    'quarterlyDilutedEPS': (QuarterlyIncomeStatement, 'dilutedEPS'),
+    'quarterlyFreeCashFlow': (QuarterlyCashFlow, 'freeCashFlow'),
+    'latestYearEnding': (AnnualIncomeStatement, 'fiscalDateEnding'),
+    'annualRevenue': (AnnualIncomeStatement, 'totalRevenue'),
+    'annualNetIncome': (AnnualIncomeStatement, 'netIncome'),
+    'annualDilutedEPS': (AnnualIncomeStatement, 'dilutedEPS'),
+    'annualFreeCashFlow': (AnnualCashFlow, 'freeCashFlow'),
+    'balanceSheetEnding': (QuarterlyBalanceSheet, 'fiscalDateEnding'),
+    'totalDebt': (QuarterlyBalanceSheet, 'totalDebt'),
+    'stockholdersEquity': (QuarterlyBalanceSheet, 'stockholdersEquity'),
+}
+
+# Snapshot fields copied straight from Stock
+STOCK_FIELDS = ['currentPrice', 'relativeStrengthIndex', 'yoyEPSPercentGrowth', 'compoundedAnnualGrowthRate']
+
+
+class SnapshotService:
+    """Maintains one StockSnapshot row per stock with its latest fundamentals"""
+
+    def latest(self, model, field):
+        """Correlated subquery for a field of the stock's latest period, served by the unique (stock, fiscalDateEnding) index"""
+        return Subquery(
+            model.objects.filter(stock=OuterRef('pk'))
+            .order_by('-fiscalDateEnding')
+            .values(field)[:1]
+        )
+
+    def refresh(self, symbols=None):
+        """Rebuild snapshots for the symbols (all stocks by default) from one query and one upsert"""
+        stocks = Stock.objects.all() if symbols is None else Stock.objects.filter(symbol__in=symbols)
+        rows = stocks.annotate(**{
+            f"snapshot_{name}": self.latest(model, field)
+            for name, (model, field) in LATEST_PERIOD_FIELDS.items()
+        }).values('pk', 'symbol', *STOCK_FIELDS, *(f"snapshot_{name}" for name in LATEST_PERIOD_FIELDS))
+
+        snapshots = [
+            StockSnapshot(
+                stock_id=row['pk'],
+                symbol=row['symbol'],
+                **{name: row[name] for name in STOCK_FIELDS},
+                **{name: row[f"snapshot_{name}"] for name in LATEST_PERIOD_FIELDS}
+            )
+            for row in rows
+        ]
+        if not snapshots:
+            return []
+        with transaction.atomic():
+            return StockSnapshot.objects.bulk_create(
+                snapshots,
+                update_conflicts=True,
+                unique_fields=['stock'],
+                update_fields=['symbol', *STOCK_FIELDS, *LATEST_PERIOD_FIELDS, 'lastUpdated'],
+                batch_size=500,
+            )
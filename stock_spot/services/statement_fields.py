@@ -0,0 +1,409 @@
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+
+# Each statement model maps yfinance row labels to model fields and the type each value is coerced to.
+# Labels are kept exactly as yfinance reports them, typos included.
+
+QUARTERLY_INCOME_STATEMENT_FIELDS = (
+    ('Total Revenue', 'totalRevenue', int),
+    ('Operating Revenue', 'operatingRevenue', int),
+    ('Cost Of Revenue', 'costOfRevenue', int),
+    ('Gross Profit', 'grossProfit', int),
+    ('Operating Expense', 'operatingExpense', int),
+    ('Research And Development', 'researchAndDevelopment', int),
+    ('Selling General And Administration', 'sellingGeneralAndAdministration', int),
+    ('Total Expenses', 'totalExpenses', int),
+    ('Operating Income', 'operatingIncome', int),
+    ('Total Operating Income As Reported', 'totalOperatingIncomeAsReported', int),
+    ('Interest Income', 'interestIncome', int),
+    ('Interest Expense', 'interestExpense', int),
+    ('Net Interest Income', 'netInterestIncome', int),
+    ('Interest Income Non Operating', 'interestIncomeNonOperating', int),
+    ('Interest Expense Non Operating', 'interestExpenseNonOperating', int),
+    ('Net Non Operating Interest Income Expense', 'netNonOperatingInterestIncomeExpense', int),
+    ('Other Income Expense', 'otherIncomeExpense', int),
+    ('Other Non Operating Income Expenses', 'otherNonOperatingIncomeExpenses', int),
+    ('Special Income Charges', 'specialIncomeCharges', int),
+    ('Restructuring And Mergern Acquisition', 'restructuringAndMergerAcquisition', int),
+    ('Pretax Income', 'pretaxIncome', int),
+    ('Tax Provision', 'taxProvision', int),
+    ('Tax Rate For Calcs', 'taxRateForCalcs', float),
+    ('Tax Effect Of Unusual Items', 'taxEffectOfUnusualItems', int),
+    ('Net Income', 'netIncome', int),
+    ('Net Income Continuous Operations', 'netIncomeContinuousOperations', int),
+    ('Net Income Including Noncontrolling Interests', 'netIncomeIncludingNoncontrollingInterests', int),
+    ('Net Income Common Stockholders', 'netIncomeCommonStockholders', int),
+    ('Net Income From Continuing Operation Net Minority Interest', 'netIncomeFromContinuingOperationNetMinorityInterest', int),
+    ('Net Income From Continuing And Discontinued Operation', 'netIncomeFromContinuingAndDiscontinuedOperation', int),
+    ('Minority Interests', 'minorityInterests', int),
+    ('Diluted NI Availto Com Stockholders', 'dilutedNIAvailableToComStockholders', int),
+    ('Basic EPS', 'basicEPS', float),
+    ('Diluted EPS', 'dilutedEPS', float),
+    ('Basic Average Shares', 'basicAverageShares', int),
+    ('Diluted Average Shares', 'dilutedAverageShares', int),
+    ('EBITDA', 'ebitda', int),
+    ('EBIT', 'ebit', int),
+    ('Normalized EBITDA', 'normalizedEBITDA', int),
+    ('Reconciled Depreciation', 'reconciledDepreciation', int),
+    ('Reconciled Cost Of Revenue', 'reconciledCostOfRevenue', int),
+    ('Normalized Income', 'normalizedIncome', int),
+    ('Total Unusual Items', 'totalUnusualItems', int),
+    ('Total Unusual Items Excluding Goodwill', 'totalUnusualItemsExcludingGoodwill', int),
+    ('Rent Expense Supplemental', 'rentExpenseSupplemental', int),
+    ('Otherunder Preferred Stock Dividend', 'otherUnderPreferredStockDividend', int),
+)
+
+ANNUAL_INCOME_STATEMENT_FIELDS = (
+    ('Total Revenue', 'totalRevenue', int),
+    ('Operating Revenue', 'operatingRevenue', int),
+    ('Cost Of Revenue', 'costOfRevenue', int),
+    ('Gross Profit', 'grossProfit', int),
+    ('Operating Expense', 'operatingExpense', int),
+    ('Research And Development', 'researchAndDevelopment', int),
+    ('Selling General And Administration', 'sellingGeneralAndAdministration', int),
+    ('Total Expenses', 'totalExpenses', int),
+    ('Operating Income', 'operatingIncome', int),
+    ('Total Operating Income As Reported', 'totalOperatingIncomeAsReported', int),
+    ('Interest Income', 'interestIncome', int),
+    ('Interest Expense', 'interestExpense', int),
+    ('Net Interest Income', 'netInterestIncome', int),
+    ('Interest Income Non Operating', 'interestIncomeNonOperating', int),
+    ('Interest Expense Non Operating', 'interestExpenseNonOperating', int),
+    ('Net Non Operating Interest Income Expense', 'netNonOperatingInterestIncomeExpense', int),
+    ('Other Income Expense', 'otherIncomeExpense', int),
+    ('Other Non Operating Income Expenses', 'otherNonOperatingIncomeExpenses', int),
+    ('Special Income Charges', 'specialIncomeCharges', int),
+    ('Restructuring And Mergern Acquisition', 'restructuringAndMergerAcquisition', int),
+    ('Pretax Income', 'pretaxIncome', int),
+    ('Tax Provision', 'taxProvision', int),
+    ('Tax Rate For Calcs', 'taxRateForCalcs', float),
+    ('Tax Effect Of Unusual Items', 'taxEffectOfUnusualItems', int),
+    ('Net Income', 'netIncome', int),
+    ('Net Income Continuous Operations', 'netIncomeContinuousOperations', int),
+    ('Net Income Including Noncontrolling Interests', 'netIncomeIncludingNoncontrollingInterests', int),
+    ('Net Income Common Stockholders', 'netIncomeCommonStockholders', int),
+    ('Net Income From Continuing Operation Net Minority Interest', 'netIncomeFromContinuingOperationNetMinorityInterest', int),
+    ('Net Income From Continuing And Discontinued Operation', 'netIncomeFromContinuingAndDiscontinuedOperation', int),
+    ('Minority Interests', 'minorityInterests', int),
+    ('Diluted NI Availto Com Stockholders', 'dilutedNIAvailableToComStockholders', int),
+    ('Basic EPS', 'basicEPS', float),
+    ('Diluted EPS', 'dilutedEPS', float),
+    ('Basic Average Shares', 'basicAverageShares', int),
+    ('Diluted Average Shares', 'dilutedAverageShares', int),
+    ('Average Dilution Earnings', 'averageDilutionEarnings', int),
+    ('EBITDA', 'ebitda', int),
+    ('EBIT', 'ebit', int),
+    ('Normalized EBITDA', 'normalizedEBITDA', int),
+    ('Reconciled Depreciation', 'reconciledDepreciation', int),
+    ('Reconciled Cost Of Revenue', 'reconciledCostOfRevenue', int),
+    ('Normalized Income', 'normalizedIncome', int),
+    ('Total Unusual Items', 'totalUnusualItems', int),
+    ('Total Unusual Items Excluding Goodwill', 'totalUnusualItemsExcludingGoodwill', int),
+    ('Rent Expense Supplemental', 'rentExpenseSupplemental', int),
+    ('Otherunder Preferred Stock Dividend', 'otherUnderPreferredStockDividend', int),
+)
+
+QUARTERLY_BALANCE_SHEET_FIELDS = (
+    ('Treasury Shares Number', 'treasurySharesNumber', int),
+    ('Ordinary Shares Number', 'ordinarySharesNumber', int),
+    ('Share Issued', 'shareIssued', int),
+    ('Total Debt', 'totalDebt', int),
+    ('Tangible Book Value', 'tangibleBookValue', int),
+    ('Invested Capital', 'investedCapital', int),
+    ('Working Capital', 'workingCapital', int),
+    ('Net Tangible Assets', 'netTangibleAssets', int),
+    ('Capital Lease Obligations', 'capitalLeaseObligations', int),
+    ('Common Stock Equity', 'commonStockEquity', int),
+    ('Total Capitalization', 'totalCapitalization', int),
+    ('Total Equity Gross Minority Interest', 'totalEquityGrossMinorityInterest', int),
+    ('Minority Interest', 'minorityInterest', int),
+    ('Stockholders Equity', 'stockholdersEquity', int),
+    ('Gains Losses Not Affecting Retained Earnings', 'gainsLossesNotAffectingRetainedEarnings', int),
+    ('Other Equity Adjustments', 'otherEquityAdjustments', int),
+    ('Retained Earnings', 'retainedEarnings', int),
+    ('Additional Paid In Capital', 'additionalPaidInCapital', int),
+    ('Capital Stock', 'capitalStock', int),
+    ('Common Stock', 'commonStock', int),
+    ('Preferred Stock', 'preferredStock', int),
+    ('Total Liabilities Net Minority Interest', 'totalLiabilitiesNetMinorityInterest', int),
+    ('Total Non Current Liabilities Net Minority Interest', 'totalNonCurrentLiabilitiesNetMinorityInterest', int),
+    ('Other Non Current Liabilities', 'otherNonCurrentLiabilities', int),
+    ('Non Current Deferred Liabilities', 'nonCurrentDeferredLiabilities', int),
+    ('Non Current Deferred Revenue', 'nonCurrentDeferredRevenue', int),
+    ('Long Term Debt And Capital Lease Obligation', 'longTermDebtAndCapitalLeaseObligation', int),
+    ('Long Term Capital Lease Obligation', 'longTermCapitalLeaseObligation', int),
+    ('Long Term Debt', 'longTermDebt', int),
+    ('Long Term Provisions', 'longTermProvisions', int),
+    ('Current Liabilities', 'currentLiabilities', int),
+    ('Other Current Liabilities', 'otherCurrentLiabilities', int),
+    ('Current Deferred Liabilities', 'currentDeferredLiabilities', int),
+    ('Current Deferred Revenue', 'currentDeferredRevenue', int),
+    ('Current Debt And Capital Lease Obligation', 'currentDebtAndCapitalLeaseObligation', int),
+    ('Current Capital Lease Obligation', 'currentCapitalLeaseObligation', int),
+    ('Current Debt', 'currentDebt', int),
+    ('Other Current Borrowings', 'otherCurrentBorrowings', int),
+    ('Line Of Credit', 'lineOfCredit', int),
+    ('Current Provisions', 'currentProvisions', int),
+    ('Payables And Accrued Expenses', 'payablesAndAccruedExpenses', int),
+    ('Current Accrued Expenses', 'currentAccruedExpenses', int),
+    ('Payables', 'payables', int),
+    ('Total Tax Payable', 'totalTaxPayable', int),
+    ('Accounts Payable', 'accountsPayable', int),
+    ('Total Assets', 'totalAssets', int),
+    ('Total Non Current Assets', 'totalNonCurrentAssets', int),
+    ('Other Non Current Assets', 'otherNonCurrentAssets', int),
+    ('Non Current Deferred Assets', 'nonCurrentDeferredAssets', int),
+    ('Non Current Deferred Taxes Assets', 'nonCurrentDeferredTaxesAssets', int),
+    ('Investments And Advances', 'investmentsAndAdvances', int),
+    ('Other Investments', 'otherInvestments', int),
+    ('Goodwill And Other Intangible Assets', 'goodwillAndOtherIntangibleAssets', int),
+    ('Other Intangible Assets', 'otherIntangibleAssets', int),
+    ('Goodwill', 'goodwill', int),
+    ('Net PPE', 'netPPE', int),
+    ('Accumulated Depreciation', 'accumulatedDepreciation', int),
+    ('Gross PPE', 'grossPPE', int),
+    ('Leases', 'leases', int),
+    ('Construction In Progress', 'constructionInProgress', int),
+    ('Other Properties', 'otherProperties', int),
+    ('Machinery Furniture Equipment', 'machineryFurnitureEquipment', int),
+    ('Land And Improvements', 'landAndImprovements', int),
+    ('Properties', 'properties', int),
+    ('Current Assets', 'currentAssets', int),
+    ('Other Current Assets', 'otherCurrentAssets', int),
+    ('Inventory', 'inventory', int),
+    ('Other Inventories', 'otherInventories', int),
+    ('Finished Goods', 'finishedGoods', int),
+    ('Work In Process', 'workInProcess', int),
+    ('Raw Materials', 'rawMaterials', int),
+    ('Receivables', 'receivables', int),
+    ('Accounts Receivable', 'accountsReceivable', int),
+    ('Cash Cash Equivalents And Short Term Investments', 'cashCashEquivalentsAndShortTermInvestments', int),
+    ('Other Short Term Investments', 'otherShortTermInvestments', int),
+    ('Cash And Cash Equivalents', 'cashAndCashEquivalents', int),
+    ('Cash Equivalents', 'cashEquivalents', int),
+    ('Cash Financial', 'cashFinancial', int),
+)
+
+ANNUAL_BALANCE_SHEET_FIELDS = (
+    ('Treasury Shares Number', 'treasurySharesNumber', int),
+    ('Ordinary Shares Number', 'ordinarySharesNumber', int),
+    ('Share Issued', 'shareIssued', int),
+    ('Total Debt', 'totalDebt', int),
+    ('Tangible Book Value', 'tangibleBookValue', int),
+    ('Invested Capital', 'investedCapital', int),
+    ('Working Capital', 'workingCapital', int),
+    ('Net Tangible Assets', 'netTangibleAssets', int),
+    ('Capital Lease Obligations', 'capitalLeaseObligations', int),
+    ('Common Stock Equity', 'commonStockEquity', int),
+    ('Total Capitalization', 'totalCapitalization', int),
+    ('Total Equity Gross Minority Interest', 'totalEquityGrossMinorityInterest', int),
+    ('Minority Interest', 'minorityInterest', int),
+    ('Stockholders Equity', 'stockholdersEquity', int),
+    ('Gains Losses Not Affecting Retained Earnings', 'gainsLossesNotAffectingRetainedEarnings', int),
+    ('Other Equity Adjustments', 'otherEquityAdjustments', int),
+    ('Retained Earnings', 'retainedEarnings', int),
+    ('Additional Paid In Capital', 'additionalPaidInCapital', int),
+    ('Capital Stock', 'capitalStock', int),
+    ('Common Stock', 'commonStock', int),
+    ('Preferred Stock', 'preferredStock', int),
+    ('Total Liabilities Net Minority Interest', 'totalLiabilitiesNetMinorityInterest', int),
+    ('Total Non Current Liabilities Net Minority Interest', 'totalNonCurrentLiabilitiesNetMinorityInterest', int),
+    ('Other Non Current Liabilities', 'otherNonCurrentLiabilities', int),
+    ('Preferred Securities Outside Stock Equity', 'preferredSecuritiesOutsideStockEquity', int),
+    ('Non Current Accrued Expenses', 'nonCurrentAccruedExpenses', int),
+    ('Non Current Deferred Liabilities', 'nonCurrentDeferredLiabilities', int),
+    ('Non Current Deferred Revenue', 'nonCurrentDeferredRevenue', int),
+    ('Non Current Deferred Taxes Liabilities', 'nonCurrentDeferredTaxesLiabilities', int),
+    ('Long Term Debt And Capital Lease Obligation', 'longTermDebtAndCapitalLeaseObligation', int),
+    ('Long Term Capital Lease Obligation', 'longTermCapitalLeaseObligation', int),
+    ('Long Term Debt', 'longTermDebt', int),
+    ('Long Term Provisions', 'longTermProvisions', int),
+    ('Current Liabilities', 'currentLiabilities', int),
+    ('Other Current Liabilities', 'otherCurrentLiabilities', int),
+    ('Current Deferred Liabilities', 'currentDeferredLiabilities', int),
+    ('Current Deferred Revenue', 'currentDeferredRevenue', int),
+    ('Current Debt And Capital Lease Obligation', 'currentDebtAndCapitalLeaseObligation', int),
+    ('Current Capital Lease Obligation', 'currentCapitalLeaseObligation', int),
+    ('Current Debt', 'currentDebt', int),
+    ('Other Current Borrowings', 'otherCurrentBorrowings', int),
+    ('Line Of Credit', 'lineOfCredit', int),
+    ('Current Provisions', 'currentProvisions', int),
+    ('Payables And Accrued Expenses', 'payablesAndAccruedExpenses', int),
+    ('Current Accrued Expenses', 'currentAccruedExpenses', int),
+    ('Interest Payable', 'interestPayable', int),
+    ('Payables', 'payables', int),
+    ('Total Tax Payable', 'totalTaxPayable', int),
+    ('Accounts Payable', 'accountsPayable', int),
+    ('Total Assets', 'totalAssets', int),
+    ('Total Non Current Assets', 'totalNonCurrentAssets', int),
+    ('Other Non Current Assets', 'otherNonCurrentAssets', int),
+    ('Non Current Deferred Assets', 'nonCurrentDeferredAssets', int),
+    ('Non Current Deferred Taxes Assets', 'nonCurrentDeferredTaxesAssets', int),
+    ('Goodwill And Other Intangible Assets', 'goodwillAndOtherIntangibleAssets', int),
+    ('Other Intangible Assets', 'otherIntangibleAssets', int),
+    ('Goodwill', 'goodwill', int),
+    ('Net PPE', 'netPPE', int),
+    ('Accumulated Depreciation', 'accumulatedDepreciation', int),
+    ('Gross PPE', 'grossPPE', int),
+    ('Leases', 'leases', int),
+    ('Construction In Progress', 'constructionInProgress', int),
+    ('Other Properties', 'otherProperties', int),
+    ('Machinery Furniture Equipment', 'machineryFurnitureEquipment', int),
+    ('Land And Improvements', 'landAndImprovements', int),
+    ('Properties', 'properties', int),
+    ('Current Assets', 'currentAssets', int),
+    ('Other Current Assets', 'otherCurrentAssets', int),
+    ('Prepaid Assets', 'prepaidAssets', int),
+    ('Inventory', 'inventory', int),
+    ('Other Inventories', 'otherInventories', int),
+    ('Finished Goods', 'finishedGoods', int),
+    ('Work In Process', 'workInProcess', int),
+    ('Raw Materials', 'rawMaterials', int),
+    ('Receivables', 'receivables', int),
+    ('Accounts Receivable', 'accountsReceivable', int),
+    ('Cash Cash Equivalents And Short Term Investments', 'cashCashEquivalentsAndShortTermInvestments', int),
+    ('Other Short Term Investments', 'otherShortTermInvestments', int),
+    ('Cash And Cash Equivalents', 'cashAndCashEquivalents', int),
+    ('Cash Equivalents', 'cashEquivalents', int),
+    ('Cash Financial', 'cashFinancial', int),
+)
+
+QUARTERLY_CASHFLOW_FIELDS = (
+    ('Free Cash Flow', 'freeCashFlow', int),
+    ('Capital Expenditure', 'capitalExpenditure', int),
+    ('End Cash Position', 'endCashPosition', int),
+    ('Beginning Cash Position', 'beginningCashPosition', int),
+    ('Effect Of Exchange Rate Changes', 'effectOfExchangeRateChanges', int),
+    ('Changes In Cash', 'changesInCash', int),
+    ('Financing Cash Flow', 'financingCashFlow', int),
+    ('Cash Flow From Continuing Financing Activities', 'cashFlowFromContinuingFinancingActivities', int),
+    ('Net Other Financing Charges', 'netOtherFinancingCharges', int),
+    ('Proceeds From Stock Option Exercised', 'proceedsFromStockOptionExercised', int),
+    ('Net Issuance Payments Of Debt', 'netIssuancePaymentsOfDebt', int),
+    ('Net Long Term Debt Issuance', 'netLongTermDebtIssuance', int),
+    ('Long Term Debt Payments', 'longTermDebtPayments', int),
+    ('Long Term Debt Issuance', 'longTermDebtIssuance', int),
+    ('Repayment Of Debt', 'repaymentOfDebt', int),
+    ('Issuance Of Debt', 'issuanceOfDebt', int),
+    ('Investing Cash Flow', 'investingCashFlow', int),
+    ('Cash Flow From Continuing Investing Activities', 'cashFlowFromContinuingInvestingActivities', int),
+    ('Net Investment Purchase And Sale', 'netInvestmentPurchaseAndSale', int),
+    ('Sale Of Investment', 'saleOfInvestment', int),
+    ('Purchase Of Investment', 'purchaseOfInvestment', int),
+    ('Net Business Purchase And Sale', 'netBusinessPurchaseAndSale', int),
+    ('Net PPE Purchase And Sale', 'netPPEPurchaseAndSale', int),
+    ('Purchase Of PPE', 'purchaseOfPPE', int),
+    ('Operating Cash Flow', 'operatingCashFlow', int),
+    ('Cash Flow From Continuing Operating Activities', 'cashFlowFromContinuingOperatingActivities', int),
+    ('Net Income From Continuing Operations', 'netIncomeFromContinuingOperations', int),
+    ('Change In Working Capital', 'changeInWorkingCapital', int),
+    ('Change In Other Working Capital', 'changeInOtherWorkingCapital', int),
+    ('Change In Other Current Assets', 'changeInOtherCurrentAssets', int),
+    ('Change In Payables And Accrued Expense', 'changeInPayablesAndAccruedExpense', int),
+    ('Change In Prepaid Assets', 'changeInPrepaidAssets', int),
+    ('Change In Inventory', 'changeInInventory', int),
+    ('Change In Receivables', 'changeInReceivables', int),
+    ('Changes In Account Receivables', 'changesInAccountReceivables', int),
+    ('Other Non Cash Items', 'otherNonCashItems', int),
+    ('Stock Based Compensation', 'stockBasedCompensation', int),
+    ('Asset Impairment Charge', 'assetImpairmentCharge', int),
+    ('Deferred Tax', 'deferredTax', int),
+    ('Deferred Income Tax', 'deferredIncomeTax', int),
+    ('Depreciation Amortization Depletion', 'depreciationAmortizationDepletion', int),
+    ('Depreciation And Amortization', 'depreciationAndAmortization', int),
+    ('Depreciation', 'depreciation', int),
+    ('Operating Gains Losses', 'operatingGainsLosses', int),
+    ('Net Foreign Currency Exchange Gain Loss', 'netForeignCurrencyExchangeGainLoss', int),
+    ('Gain Loss On Sale Of PPE', 'gainLossOnSaleOfPPE', int),
+)
+
+ANNUAL_CASHFLOW_FIELDS = (
+    ('Free Cash Flow', 'freeCashFlow', int),
+    ('Capital Expenditure', 'capitalExpenditure', int),
+    ('Interest Paid Supplemental Data', 'interestPaidSupplementalData', int),
+    ('Income Tax Paid Supplemental Data', 'incomeTaxPaidSupplementalData', int),
+    ('End Cash Position', 'endCashPosition', int),
+    ('Beginning Cash Position', 'beginningCashPosition', int),
+    ('Effect Of Exchange Rate Changes', 'effectOfExchangeRateChanges', int),
+    ('Changes In Cash', 'changesInCash', int),
+    ('Financing Cash Flow', 'financingCashFlow', int),
+    ('Cash Flow From Continuing Financing Activities', 'cashFlowFromContinuingFinancingActivities', int),
+    ('Net Other Financing Charges', 'netOtherFinancingCharges', int),
+    ('Proceeds From Stock Option Exercised', 'proceedsFromStockOptionExercised', int),
+    ('Net Common Stock Issuance', 'netCommonStockIssuance', int),
+    ('Common Stock Issuance', 'commonStockIssuance', int),
+    ('Issuance Of Capital Stock', 'issuanceOfCapitalStock', int),
+    ('Net Issuance Payments Of Debt', 'netIssuancePaymentsOfDebt', int),
+    ('Net Long Term Debt Issuance', 'netLongTermDebtIssuance', int),
+    ('Long Term Debt Payments', 'longTermDebtPayments', int),
+    ('Long Term Debt Issuance', 'longTermDebtIssuance', int),
+    ('Repayment Of Debt', 'repaymentOfDebt', int),
+    ('Issuance Of Debt', 'issuanceOfDebt', int),
+    ('Investing Cash Flow', 'investingCashFlow', int),
+    ('Cash Flow From Continuing Investing Activities', 'cashFlowFromContinuingInvestingActivities', int),
+    ('Net Other Investing Changes', 'netOtherInvestingChanges', int),
+    ('Net Investment Purchase And Sale', 'netInvestmentPurchaseAndSale', int),
+    ('Sale Of Investment', 'saleOfInvestment', int),
+    ('Purchase Of Investment', 'purchaseOfInvestment', int),
+    ('Net Business Purchase And Sale', 'netBusinessPurchaseAndSale', int),
+    ('Sale Of Business', 'saleOfBusiness', int),
+    ('Purchase Of Business', 'purchaseOfBusiness', int),
+    ('Net Intangibles Purchase And Sale', 'netIntangiblesPurchaseAndSale', int),
+    ('Sale Of Intangibles', 'saleOfIntangibles', int),
+    ('Purchase Of Intangibles', 'purchaseOfIntangibles', int),
+    ('Net PPE Purchase And Sale', 'netPPEPurchaseAndSale', int),
+    ('Purchase Of PPE', 'purchaseOfPPE', int),
+    ('Operating Cash Flow', 'operatingCashFlow', int),
+    ('Cash Flow From Continuing Operating Activities', 'cashFlowFromContinuingOperatingActivities', int),
+    ('Net Income From Continuing Operations', 'netIncomeFromContinuingOperations', int),
+    ('Change In Working Capital', 'changeInWorkingCapital', int),
+    ('Change In Other Working Capital', 'changeInOtherWorkingCapital', int),
+    ('Change In Other Current Liabilities', 'changeInOtherCurrentLiabilities', int),
+    ('Change In Other Current Assets', 'changeInOtherCurrentAssets', int),
+    ('Change In Payables And Accrued Expense', 'changeInPayablesAndAccruedExpense', int),
+    ('Change In Payable', 'changeInPayable', int),
+    ('Change In Account Payable', 'changeInAccountPayable', int),
+    ('Change In Prepaid Assets', 'changeInPrepaidAssets', int),
+    ('Change In Inventory', 'changeInInventory', int),
+    ('Change In Receivables', 'changeInReceivables', int),
+    ('Changes In Account Receivables', 'changesInAccountReceivables', int),
+    ('Other Non Cash Items', 'otherNonCashItems', int),
+    ('Stock Based Compensation', 'stockBasedCompensation', int),
+    ('Asset Impairment Charge', 'assetImpairmentCharge', int),
+    ('Deferred Tax', 'deferredTax', int),
+    ('Deferred Income Tax', 'deferredIncomeTax', int),
+    ('Depreciation Amortization Depletion', 'depreciationAmortizationDepletion', int),
+    ('Depreciation And Amortization', 'depreciationAndAmortization', int),
+    ('Depreciation', 'depreciation', int),
+    ('Operating Gains Losses', 'operatingGainsLosses', int),
+    ('Net Foreign Currency Exchange Gain Loss', 'netForeignCurrencyExchangeGainLoss', int),
+    ('Gain Loss On Sale Of PPE', 'gainLossOnSaleOfPPE', int),
+)
+
+
+def frame_to_rows(data, fields):
+    """Convert a yfinance statement DataFrame into one row of model values per fiscal date"""
+    labels = [label for label, field, kind in fields]
+    # Rows missing from the statement come back as NaN and anything non-numeric is coerced to NaN
+    frame = data.reindex(labels).apply(pd.to_numeric, errors='coerce')
+    values = frame.to_numpy(dtype='float64')
+    missing = ~np.isfinite(values)
+
+    cells = values.astype(object)
+    int_rows = [i for i, (label, field, kind) in enumerate(fields) if kind is int]
+    cells[int_rows] = np.where(missing[int_rows], 0, values[int_rows]).astype(np.int64).astype(object)
+    cells[missing] = None
+
+    names = [field for label, field, kind in fields]
+    return {
+        timestamp.date(): dict(zip(names, column))
+        for timestamp, column in zip(frame.columns, cells.T)
+    }
+
+
+def hash_row(values):
+    """Stable content hash of a converted statement row, used to skip unchanged periods"""
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
@@ -1,6 +1,16 @@
 import time
-from stock_spot.models import AnnualEarning, AnnualIncomeStatement, QuarterlyIncomeStatement, Stock, QuarterlyEarning
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.conf import settings
+from django.db import transaction
+from stock_spot.models import Stock, StockSnapshot
 from stock_spot.services.alpha_vantage import AlphaVantageService
+from stock_spot.schemas import IngestionReport
+from stock_spot.services.freshness import stale_datasets
+from stock_spot.services.indicators import IndicatorService
+from stock_spot.services.ingestion import IngestionService
+from stock_spot.services.metrics import MetricsService
+from stock_spot.services.prices import PriceHistoryService
+from stock_spot.services.snapshot import SnapshotService
 from stock_spot.services.yfinance import YFinanceService
 
 
@@ -10,6 +20,11 @@ class StockService:
     def __init__(self):
         self.alpha_vantage_service = AlphaVantageService()
         self.yfinance_service = YFinanceService()
+        self.ingestion_service = IngestionService(self.yfinance_service, self.alpha_vantage_service)
+        self.metrics_service = MetricsService()
+        self.snapshot_service = SnapshotService()
+        self.price_history_service = PriceHistoryService(self.yfinance_service)
+        self.indicator_service = IndicatorService()
 
     def get_stock_by_symbol(self, symbol):
         """Retrieve stock from database by symbol"""
@@ -24,99 +39,98 @@ class StockService:
         return Stock.objects.get(symbol=symbol).relativeStrengthIndex
 
     def create_stock(self, symbol):
-        """Create a new stock entry"""
-        new_stock = Stock.objects.create(
-            name=None,
-            symbol=symbol,
-            startingPrice=None,
-            currentPrice=None,
-            priceWhenBought=None,
-            isBought=False,
-            sharesOwned=None,
-            relativeStrengthIndex=None,
-            yoyEPSPercentGrowth=None,
-            compoundedAnnualGrowthRate=None
-        )
-        new_stock.save()
-
-        # Fetch and save external data (with delays to avoid API rate limiting)
-        self.yfinance_service.get_stock_info(symbol)
-        self.yfinance_service.get_annual_balance_sheet_data(symbol)
-        self.yfinance_service.get_quarterly_balance_sheet_data(symbol)
-        self.yfinance_service.get_annual_cashflow_data(symbol)
-        self.yfinance_service.get_quarterly_cashflow_data(symbol)
-        self.yfinance_service.get_annual_income_statement_data(symbol)
-        self.yfinance_service.get_quarterly_income_statement_data(symbol)
-        self.alpha_vantage_service.get_relative_strength_index_data(symbol)
+        """Create a new stock entry, or refresh it if the symbol is already known"""
+        return self.upsert_stock(symbol)
+
+    def upsert_stock(self, symbol, force=False):
+        """Resolve the Stock for a symbol once, creating it if needed, and refresh only its stale datasets"""
+        stock, created = Stock.objects.get_or_create(symbol=symbol, defaults={'isBought': False})
+        datasets = None if created or force else stale_datasets(stock)
+        if datasets == []:
+            return stock
+
+        # Fetch external data concurrently, then save it
+        self.ingestion_service.ingest(stock, datasets)
 
         # Calculate metrics
-        self.calculate_eps_growth_over_past_year(symbol)
-        self.calculate_earnings_CAGR(symbol)
-        return new_stock
+        self.update_technicals([symbol])
+        self.update_metrics([symbol])
+        stock.refresh_from_db(fields=['relativeStrengthIndex', 'yoyEPSPercentGrowth', 'compoundedAnnualGrowthRate'])
+        return stock
 
-    def calculate_eps_growth_over_past_year(self, symbol):
-        """Calculate year-over-year EPS growth from most recent quarterly earnings"""
+    def ingest_many(self, symbols, max_workers=None, on_report=None, force=False, only=None):
+        """Ingest many symbols in parallel (optionally only some datasets), returning a map of symbol to IngestionReport"""
+        max_workers = max_workers or settings.INGESTION_MAX_SYMBOL_WORKERS
+        symbols = list(dict.fromkeys(symbols))
+        stocks = {}
+        for symbol in symbols:
+            stocks[symbol], created = Stock.objects.get_or_create(symbol=symbol, defaults={'isBought': False})
+        datasets = {
+            symbol: None if force else stale_datasets(stock)
+            for symbol, stock in stocks.items()
+        }
+        if only is not None:
+            datasets = {
+                symbol: [dataset for dataset in only if stale is None or dataset in stale]
+                for symbol, stale in datasets.items()
+            }
+
+        reports = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ingest-many') as executor:
+            futures = {
+                executor.submit(self.ingestion_service.fetch, symbol, datasets[symbol]): symbol
+                for symbol in symbols
+            }
+            # Fetches overlap across symbols; saves run here as each symbol completes
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    report, results = future.result()
+                    self.ingestion_service.save_all(stocks[symbol], results, report)
+                except Exception as e:
+                    report = IngestionReport(symbol=symbol, failed={'ingestion': str(e)})
+                self.ingestion_service.log_failures(report)
+                reports[symbol] = report
+                if on_report:
+                    on_report(report)
+        # Prices, indicators and metrics for the whole batch are computed together once every symbol is saved
+        self.update_technicals(symbols)
+        self.update_metrics(symbols)
+        return reports
+
+    def update_technicals(self, symbols=None):
+        """Refresh daily price history and recompute indicators locally when RSI isn't fetched from Alpha Vantage"""
+        if settings.RSI_SOURCE != 'local':
+            return None
         try:
-            mostRecentQuarterlyEarning = QuarterlyIncomeStatement.objects.filter(stock__symbol=symbol).order_by('-fiscalDateEnding').first()
-            if not mostRecentQuarterlyEarning or not mostRecentQuarterlyEarning.dilutedEPS:
-                return None
-            priorYearQuarterlyEarning = QuarterlyIncomeStatement.objects.filter(
-                stock__symbol=symbol,
-                fiscalDateEnding__lte=mostRecentQuarterlyEarning.fiscalDateEnding.replace(year=mostRecentQuarterlyEarning.fiscalDateEnding.year - 1)
-            ).order_by('-fiscalDateEnding').first()
-            if not priorYearQuarterlyEarning or not priorYearQuarterlyEarning.dilutedEPS:
-                return None
-            mostRecentQuarterlyEPS = mostRecentQuarterlyEarning.dilutedEPS
-            priorYearQuarterlyEPS = priorYearQuarterlyEarning.dilutedEPS
-            yoyEPSGrowth = ((mostRecentQuarterlyEPS-priorYearQuarterlyEPS)/priorYearQuarterlyEPS)*100
-            stock = Stock.objects.get(symbol=symbol)
-            stock.yoyEPSPercentGrowth = yoyEPSGrowth
-            stock.save()
-            return yoyEPSGrowth
+            self.price_history_service.refresh_history(symbols)
+            return self.indicator_service.update(symbols)
         except Exception as e:
-            print(f"Error calculating YoY EPS growth for {symbol}: {e}")
+            print(f"Error updating prices and indicators: {e}")
             return None
 
+    def update_metrics(self, symbols=None):
+        """Recompute YoY EPS growth and CAGR for the symbols (all stocks by default) in bulk and rebuild their snapshots"""
+        with transaction.atomic():
+            metrics = self.metrics_service.update(symbols)
+            self.snapshot_service.refresh(symbols)
+        return metrics
+
+    def calculate_metric(self, symbol, field):
+        """Recompute and save one metric for a symbol, returning it or None when it can't be computed"""
+        with transaction.atomic():
+            value = self.metrics_service.update([symbol], [field]).get(symbol, {}).get(field)
+            if value is not None:
+                StockSnapshot.objects.filter(stock__symbol=symbol).update(**{field: value})
+        return value
+
+    def calculate_eps_growth_over_past_year(self, symbol):
+        """Calculate year-over-year EPS growth from most recent quarterly earnings"""
+        return self.calculate_metric(symbol, 'yoyEPSPercentGrowth')
 
     def calculate_earnings_CAGR(self, symbol):
         """Calculate compounded annual earnings growth rate from 4-5 year interval"""
-        try:
-            span = 4
-            annualEarningsDataCount = AnnualIncomeStatement.objects.filter(stock__symbol=symbol).count()
-            if(span > annualEarningsDataCount):
-                span = annualEarningsDataCount
-            mostRecentAnnualEarning = AnnualIncomeStatement.objects.filter(stock__symbol=symbol).order_by('-fiscalDateEnding').first()
-            if not mostRecentAnnualEarning:
-                return None
-            nYearsAgoAnnualEarning = AnnualIncomeStatement.objects.filter(
-                stock__symbol=symbol,
-                fiscalDateEnding__gte=mostRecentAnnualEarning.fiscalDateEnding.replace(year=mostRecentAnnualEarning.fiscalDateEnding.year - (span-1))
-            ).order_by('-fiscalDateEnding').last()
-            if not nYearsAgoAnnualEarning:
-                return None
-            
-            print(mostRecentAnnualEarning.dilutedEPS)
-            print(nYearsAgoAnnualEarning.dilutedEPS)
-            # Validate EPS values before calculation
-            if not nYearsAgoAnnualEarning.dilutedEPS or nYearsAgoAnnualEarning.dilutedEPS == 0:
-                print(f"Cannot calculate CAGR for {symbol}: historical EPS is zero or null")
-                return None
-            if not mostRecentAnnualEarning.dilutedEPS:
-                print(f"Cannot calculate CAGR for {symbol}: recent EPS is null")
-                return None
-            # CAGR with negative values requires different handling
-            if nYearsAgoAnnualEarning.dilutedEPS < 0 or mostRecentAnnualEarning.dilutedEPS < 0:
-                print(f"Cannot calculate CAGR for {symbol}: negative EPS values present")
-                return None
-            
-            cagr = ((float(mostRecentAnnualEarning.dilutedEPS/nYearsAgoAnnualEarning.dilutedEPS) ** (1/span)) - 1) * 100
-            stock = Stock.objects.get(symbol=symbol)
-            stock.compoundedAnnualGrowthRate = cagr
-            stock.save()
-            return cagr
-        except Exception as e:
-            print(f"Error calculating earnings CAGR for {symbol}: {e}")
-            return None
+        return self.calculate_metric(symbol, 'compoundedAnnualGrowthRate')
 
     # TODO: Implement additional methods
     # def calculate_cagr(stock):
@@ -0,0 +1,107 @@
+import json
+from datetime import date
+import numpy as np
+import pandas as pd
+import requests
+from django.conf import settings
+from django.test.utils import override_settings
+from stock_spot.services.statement_fields import (
+    QUARTERLY_INCOME_STATEMENT_FIELDS, ANNUAL_INCOME_STATEMENT_FIELDS,
+    QUARTERLY_BALANCE_SHEET_FIELDS, ANNUAL_BALANCE_SHEET_FIELDS,
+    QUARTERLY_CASHFLOW_FIELDS, ANNUAL_CASHFLOW_FIELDS
+)
+
+# Dataset -> (row labels, months between periods, periods per statement), shaped like yfinance statements
+STATEMENTS = {
+    'annual_income_statement': (ANNUAL_INCOME_STATEMENT_FIELDS, 12, 4),
+    'quarterly_income_statement': (QUARTERLY_INCOME_STATEMENT_FIELDS, 3, 6),
+    'annual_balance_sheet': (ANNUAL_BALANCE_SHEET_FIELDS, 12, 4),
+    'quarterly_balance_sheet': (QUARTERLY_BALANCE_SHEET_FIELDS, 3, 6),
+    'annual_cashflow': (ANNUAL_CASHFLOW_FIELDS, 12, 4),
+    'quarterly_cashflow': (QUARTERLY_CASHFLOW_FIELDS, 3, 6),
+}
+RSI_PARAMS = {'interval': 'daily', 'time_period': 14, 'series_type': 'close'}
+PRICE_DAYS = 300
+
+
+def synthetic_symbols(count):
+    """Symbols for a synthetic universe, short enough for Stock.symbol"""
+    return [f"B{index:04d}" for index in range(count)]
+
+
+def period_ends(today, months, count):
+    """The count most recent month-end period dates spaced months apart, newest first"""
+    end = pd.Timestamp(today) - pd.offsets.MonthEnd(1)
+    return pd.DatetimeIndex([end - pd.DateOffset(months=months * index) + pd.offsets.MonthEnd(0) for index in range(count)])
+
+
+def statement_frame(rng, fields, months, count, today):
+    """A yfinance-style statement with one row per label and one column per fiscal period"""
+    values = np.empty((len(fields), count))
+    for row, (label, field, kind) in enumerate(fields):
+        values[row] = rng.uniform(1e6, 1e9, count).round() if kind is int else rng.uniform(0.1, 10, count).round(4)
+    return pd.DataFrame(values, index=[label for label, field, kind in fields], columns=period_ends(today, months, count))
+
+
+def price_frame(rng, price, today):
+    """Daily OHLCV bars following a random walk that ends near price"""
+    walk = np.cumsum(rng.normal(0, 0.015, PRICE_DAYS))
+    closes = price * np.exp(walk - walk[-1])
+    return pd.DataFrame({
+        'Open': closes * rng.uniform(0.99, 1.01, PRICE_DAYS),
+        'High': closes * 1.02,
+        'Low': closes * 0.98,
+        'Close': closes,
+        'Adj Close': closes,
+        'Volume': rng.integers(1e5, 1e7, PRICE_DAYS),
+    }, index=pd.bdate_range(end=pd.Timestamp(today), periods=PRICE_DAYS))
+
+
+def rsi_payload(rng, today):
+    """An Alpha Vantage RSI response covering the last few months"""
+    days = pd.bdate_range(end=pd.Timestamp(today), periods=60)
+    return {
+        'Technical Analysis: RSI': {
+            day.strftime('%Y-%m-%d'): {'RSI': f"{value:.4f}"}
+            for day, value in zip(days, rng.uniform(20, 80, len(days)))
+        }
+    }
+
+
+def mailgun_response():
+    """A successful Mailgun send response"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({'id': '<synthetic@stock-spot>', 'message': 'Queued. Thank you.'}).encode()
+    return response
+
+
+def write_fixtures(recorder, symbols, seed=0):
+    """Record a synthetic response for every provider call the pipeline makes for the symbols"""
+    rng = np.random.default_rng(seed)
+    today = date.today()
+    for symbol in symbols:
+        price = round(float(rng.uniform(10, 500)), 2)
+        recorder.save('yfinance', 'stock_info', symbol, {
+            'shortName': f"Synthetic {symbol}",
+            'longBusinessSummary': f"Synthetic company {symbol} used for benchmarking.",
+            'currentPrice': price,
+        })
+        for dataset, (fields, months, count) in STATEMENTS.items():
+            recorder.save('yfinance', dataset, symbol, statement_frame(rng, fields, months, count, today))
+        recorder.save('yfinance', 'download', symbol, price_frame(rng, price, today), {'interval': '1d'})
+        recorder.save('alpha_vantage', 'RSI', symbol, rsi_payload(rng, today), RSI_PARAMS)
+    recorder.save('mailgun', 'messages', settings.MAILGUN_DOMAIN, mailgun_response())
+
+
+def replay_settings(directory, latency=0, error_rate=0, seed=0):
+    """Settings that replay every provider from the fixtures in directory"""
+    providers = ('yfinance', 'alpha_vantage', 'mailgun')
+    return override_settings(
+        PROVIDER_MODE='replay',
+        PROVIDER_FIXTURE_DIR=directory,
+        PROVIDER_CACHE_ENABLED=False,
+        PROVIDER_REPLAY_LATENCY={provider: latency for provider in providers},
+        PROVIDER_REPLAY_ERROR_RATES={provider: error_rate for provider in providers},
+        PROVIDER_REPLAY_SEED=seed,
+    )
@@ -1,3 +1,1027 @@
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+import numpy as np
+import pandas as pd
+from django.test.utils import override_settings
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from stock_spot.models import (
+    AnnualIncomeStatement, DailyPrice, DatasetRefresh, QuarterlyEarning, QuarterlyIncomeStatement, ReportJob,
+    ScheduledTask, Stock, StockSnapshot, TechnicalIndicatorPoint
+)
+from stock_spot.services.alpha_vantage import AlphaVantageService
+from stock_spot.services.benchmark import IngestionBenchmark, find_regressions
+from stock_spot.services.earnings_calendar import EarningsCalendar, expected_filing_date
+from stock_spot.services.ingestion import IngestionService
+from stock_spot.services.indicators import IndicatorService, ema, macd, rsi, sma
+from stock_spot.services.report_jobs import ReportJobService
+from stock_spot.services.rate_limit import RateLimitExceeded, TokenBucketRateLimiter
+from stock_spot.services.cache import MARKET_TIMEZONE
+from stock_spot.services.scheduler import RefreshScheduler, is_market_open, last_market_close
+from stock_spot.services.screening import FilterCompiler, ScreenError, tokenize
+from stock_spot.renderers import pyarrow
+from stock_spot.pagination import CursorError, keyset_paginate
+from stock_spot.services.recording import ProviderRecorder
+from stock_spot.services.statement_fields import QUARTERLY_INCOME_STATEMENT_FIELDS, frame_to_rows, hash_row
+from stock_spot.services.stock import StockService
+from stock_spot.services.synthetic import replay_settings, statement_frame, write_fixtures
+from stock_spot.services.yfinance import YFinanceService
 
-# Create your tests here.
+
+@contextmanager
+def replayed_providers(symbols, latency=0):
+    """Replay every provider from synthetic fixtures for the symbols, written to a temporary directory"""
+    with tempfile.TemporaryDirectory() as directory, replay_settings(directory, latency):
+        write_fixtures(ProviderRecorder(), symbols)
+        yield
+
+
+class StatementIndexQueryPlanTests(TestCase):
+    """The hot per-stock statement and earnings queries must be served by an index, not a table scan
+
+    Each test EXPLAINs the query on the test database. SQLite must SEARCH an index with no temp B-tree
+    sort for the ORDER BY; PostgreSQL, with sequential scans disabled, must use an Index or Index Only Scan.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.stocks = [Stock.objects.create(symbol=f"T{i}", isBought=False) for i in range(3)]
+        for stock in cls.stocks:
+            for year in range(2015, 2025):
+                AnnualIncomeStatement.objects.create(stock=stock, fiscalDateEnding=date(year, 12, 31), dilutedEPS=1)
+                for month in (3, 6, 9, 12):
+                    QuarterlyIncomeStatement.objects.create(stock=stock, fiscalDateEnding=date(year, month, 28), dilutedEPS=1)
+
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            # Tiny test tables would otherwise always be sequentially scanned
+            with connection.cursor() as cursor:
+                cursor.execute('SET enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset):
+        plan = queryset.explain()
+        if connection.vendor == 'sqlite':
+            self.assertRegex(plan, r'SEARCH .*USING (COVERING )?INDEX', plan)
+        else:
+            self.assertRegex(plan, r'Index( Only)? Scan', plan)
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
+
+    def test_latest_quarter_lookup_uses_index(self):
+        queryset = QuarterlyIncomeStatement.objects.filter(stock=self.stocks[0]).order_by('-fiscalDateEnding')[:1]
+        self.assertUsesIndex(queryset)
+
+    def test_latest_year_lookup_uses_index(self):
+        queryset = AnnualIncomeStatement.objects.filter(stock=self.stocks[0]).order_by('-fiscalDateEnding')[:1]
+        self.assertUsesIndex(queryset)
+
+    def test_metrics_series_query_uses_index(self):
+        for model in (QuarterlyIncomeStatement, AnnualIncomeStatement):
+            queryset = (
+                model.objects.filter(stock__in=self.stocks)
+                .order_by('stock_id', '-fiscalDateEnding')
+                .values_list('stock_id', 'fiscalDateEnding', 'dilutedEPS')
+            )
+            self.assertUsesIndex(queryset)
+
+    def test_earnings_series_query_uses_index(self):
+        queryset = (
+            QuarterlyEarning.objects.filter(stock__in=self.stocks, fiscalDateEnding__gte=date(2020, 1, 1))
+            .order_by('stock_id', '-fiscalDateEnding')
+            .values_list('stock_id', 'fiscalDateEnding', 'reportedDate')
+        )
+        self.assertUsesIndex(queryset)
+
+
+class IngestionBenchmarkTests(TestCase):
+    """The benchmark runs the whole pipeline offline and flags metrics that regress past the threshold"""
+
+    def test_small_universe_runs_against_replayed_providers(self):
+        results = IngestionBenchmark([3]).run()
+        self.assertEqual(set(results['3']), {'create_stock', 'update_metrics', 'send_stock_report'})
+        self.assertGreater(results['3']['create_stock']['rows_written'], 0)
+        # The report re-ingests the stale universe rather than only rendering stored data
+        self.assertGreater(results['3']['send_stock_report']['rows_written'], 0)
+        self.assertEqual(StockSnapshot.objects.filter(currentPrice__isnull=False).count(), 3)
+
+    def test_find_regressions_checks_machine_independent_metrics_by_default(self):
+        baseline = {'10': {'create_stock': {'seconds': 1.0, 'queries': 100, 'rows_written': 50, 'rows_per_second': 1000, 'peak_memory_mb': 10}}}
+        results = {'10': {'create_stock': {'seconds': 3.0, 'queries': 150, 'rows_written': 50, 'rows_per_second': 100, 'peak_memory_mb': 5}}}
+        regressions = find_regressions(results, baseline, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('10 symbols, create_stock: queries'))
+
+    def test_find_regressions_checks_timing_when_asked(self):
+        baseline = {'10': {'create_stock': {'seconds': 1.0, 'queries': 100, 'rows_per_second': 1000, 'peak_memory_mb': 10}}}
+        results = {'10': {'create_stock': {'seconds': 1.1, 'queries': 100, 'rows_per_second': 500, 'peak_memory_mb': 5}}}
+        regressions = find_regressions(results, baseline, 0.25, timing=True)
+        self.assertEqual(regressions, ['10 symbols, create_stock: rows_per_second 500 vs baseline 1000 (-50%)'])
+
+
+@override_settings(EARNINGS_DEFAULT_REPORT_LAG_DAYS=40)
+class EarningsCalendarTests(TestCase):
+    """Statement refreshes are prioritized for stocks whose next filing is imminent or already out"""
+
+    def test_reported_quarter_missing_from_statements_uses_its_report_date(self):
+        earnings = [(date(2026, 6, 30), date(2026, 7, 30)), (date(2026, 3, 31), date(2026, 4, 30))]
+        self.assertEqual(expected_filing_date(earnings, date(2026, 3, 31)), date(2026, 7, 30))
+
+    def test_oldest_missing_quarter_is_used_when_several_are_reported(self):
+        earnings = [(date(2026, 6, 30), date(2026, 7, 30)), (date(2026, 3, 31), date(2026, 4, 30))]
+        self.assertEqual(expected_filing_date(earnings, date(2025, 12, 31)), date(2026, 4, 30))
+
+    def test_next_filing_follows_period_spacing_and_report_lag(self):
+        earnings = [
+            (date(2026, 6, 30), date(2026, 7, 25)),
+            (date(2026, 3, 31), date(2026, 4, 25)),
+            (date(2025, 12, 31), date(2026, 1, 25)),
+        ]
+        # Median spacing of 90-91 days plus the 25 day median lag after the latest period
+        self.assertEqual(expected_filing_date(earnings, date(2026, 6, 30)), date(2026, 10, 23))
+
+    def test_statements_only_history_uses_default_lag(self):
+        # One quarter after the latest statement plus the 40 day default lag
+        self.assertEqual(expected_filing_date([], date(2026, 6, 30)), date(2026, 11, 8))
+        self.assertIsNone(expected_filing_date([], None))
+
+    def test_overdue_filing_stays_due(self):
+        calendar = EarningsCalendar(days_before=3, grace_days=120)
+        self.assertTrue(calendar.is_due(date(2026, 7, 30), date(2026, 10, 17)))
+        self.assertTrue(calendar.is_due(date(2026, 10, 19), date(2026, 10, 17)))
+        self.assertFalse(calendar.is_due(date(2026, 10, 24), date(2026, 10, 17)))
+        self.assertFalse(calendar.is_due(date(2026, 5, 1), date(2026, 10, 17)))
+        self.assertTrue(calendar.is_due(None, date(2026, 10, 17)))
+
+    def test_split_keeps_order_and_puts_behind_stocks_first_tier(self):
+        behind, current, new = (Stock.objects.create(symbol=symbol, isBought=False) for symbol in ('BHND', 'CURR', 'NEW'))
+        QuarterlyEarning.objects.create(stock=behind, fiscalDateEnding=date(2026, 6, 30), reportedDate=date(2026, 7, 30), reportTime='post-market')
+        QuarterlyEarning.objects.create(stock=current, fiscalDateEnding=date(2026, 6, 30), reportedDate=date(2026, 7, 30), reportTime='post-market')
+        QuarterlyEarning.objects.create(stock=current, fiscalDateEnding=date(2026, 3, 31), reportedDate=date(2026, 4, 30), reportTime='post-market')
+        behind.latestStatement = date(2026, 3, 31)
+        current.latestStatement = date(2026, 6, 30)
+        new.latestStatement = None
+
+        due, rest = EarningsCalendar(days_before=3, grace_days=120).split([behind, current, new], today=date(2026, 10, 17))
+        self.assertEqual(due, [behind, new])
+        self.assertEqual(rest, [current])
+
+
+class StatementListPaginationTests(TestCase):
+    """Statement listings page by seeking on (fiscalDateEnding, id), even when periods repeat across stocks"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(4):
+            stock = Stock.objects.create(symbol=f"P{index}", isBought=False)
+            for month in (3, 6, 9):
+                QuarterlyIncomeStatement.objects.create(stock=stock, fiscalDateEnding=date(2026, month, 30), totalRevenue=index)
+
+    def test_pages_cover_every_row_once_newest_first_without_offsets(self):
+        url = '/api/stocks/api/statements/quarterly_income_statement/?limit=5'
+        seen = []
+        with CaptureQueriesContext(connection) as queries:
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn('previous', response.json())
+                seen += [(row['fiscalDateEnding'], row['id']) for row in response.json()['results']]
+                url = response.json()['next']
+        self.assertEqual(len(seen), 12)
+        self.assertEqual(seen, sorted(seen, reverse=True))
+        self.assertFalse(any('OFFSET' in query['sql'] for query in queries.captured_queries))
+
+    def test_rows_from_every_stock_carry_their_symbol(self):
+        response = self.client.get('/api/stocks/api/statements/quarterly_income_statement/?limit=4&fields=symbol,totalRevenue')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{'symbol': f"P{index}", 'totalRevenue': index} for index in (3, 2, 1, 0)]
+        )
+
+    def test_symbol_filter(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/stocks/api/statements/quarterly_income_statement/?symbol=p1')
+        self.assertEqual({row['symbol'] for row in response.json()['results']}, {'P1'})
+        self.assertEqual(len(response.json()['results']), 3)
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get('/api/stocks/api/statements/quarterly_income_statement/?cursor=bogus')
+        self.assertEqual(response.status_code, 404)
+
+
+class UpsertStockTests(TestCase):
+    """upsert_stock returns the stock with the values computed after ingestion, including local RSI"""
+
+    def test_new_stock_comes_back_with_local_rsi(self):
+        with replayed_providers(['NEW1']):
+            stock = StockService().create_stock('NEW1')
+        self.assertIsNotNone(stock.relativeStrengthIndex)
+        self.assertEqual(stock.relativeStrengthIndex, Stock.objects.get(symbol='NEW1').relativeStrengthIndex)
+
+
+def wilder_rsi(closes, period=14):
+    """Textbook Wilder RSI for one series of closes, None until there are `period` changes"""
+    changes = [newer - older for older, newer in zip(closes, closes[1:])]
+    result = [None] * len(closes)
+    if len(changes) < period:
+        return result
+    avg_gain = sum(max(change, 0) for change in changes[:period]) / period
+    avg_loss = sum(max(-change, 0) for change in changes[:period]) / period
+    for day in range(period, len(closes)):
+        if day > period:
+            change = changes[day - 1]
+            avg_gain = (avg_gain * (period - 1) + max(change, 0)) / period
+            avg_loss = (avg_loss * (period - 1) + max(-change, 0)) / period
+        if avg_gain == avg_loss == 0:
+            result[day] = 50.0
+        else:
+            result[day] = 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+    return result
+
+
+class IndicatorTests(TestCase):
+    """The vectorized indicators match per-series reference formulas, including stocks with shorter histories"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (80, 3)), axis=0))
+        # The second stock only starts trading on day 30
+        self.closes[:30, 1] = np.nan
+
+    def test_rsi_matches_wilder_reference(self):
+        result = rsi(self.closes, 14)
+        for column in range(self.closes.shape[1]):
+            series = self.closes[:, column]
+            start = int(np.argmax(~np.isnan(series)))
+            expected = [None] * start + wilder_rsi(list(series[start:]), 14)
+            for day, value in enumerate(expected):
+                if value is None:
+                    self.assertTrue(np.isnan(result[day, column]))
+                else:
+                    self.assertAlmostEqual(result[day, column], value, places=8)
+
+    def test_sma_and_ema_match_reference(self):
+        series = self.closes[:, 1]
+        averages = sma(self.closes, 20)[:, 1]
+        smoothed = ema(self.closes, 20)[:, 1]
+        self.assertTrue(np.isnan(averages[:49]).all())
+        for day in range(49, len(series)):
+            self.assertAlmostEqual(averages[day], series[day - 19:day + 1].mean(), places=8)
+        expected = series[30]
+        for day in range(30, len(series)):
+            expected = series[day] if day == 30 else 2 / 21 * series[day] + (1 - 2 / 21) * expected
+            self.assertAlmostEqual(smoothed[day], expected, places=8)
+
+    def test_macd_is_ema_difference_with_signal(self):
+        line, signal_line, histogram = macd(self.closes)
+        np.testing.assert_allclose(line, ema(self.closes, 12) - ema(self.closes, 26))
+        np.testing.assert_allclose(signal_line, ema(line, 9))
+        np.testing.assert_allclose(histogram, line - signal_line)
+
+
+class IndicatorServiceTests(TestCase):
+    """Stored indicator points are dated at each stock's own last close"""
+
+    def test_stale_stock_is_dated_at_its_last_close(self):
+        start = date(2026, 1, 1)
+        closes = 100 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.02, 40)))
+        fresh = Stock.objects.create(symbol='FRESH', isBought=False)
+        stale = Stock.objects.create(symbol='STALE', isBought=False)
+        for day, close in enumerate(closes):
+            DailyPrice.objects.create(stock=fresh, date=start + timedelta(days=day), close=round(close, 4))
+            if day < 30:
+                DailyPrice.objects.create(stock=stale, date=start + timedelta(days=day), close=round(close, 4))
+
+        # Stocks, closes, then points, RSI and watermarks as one bulk statement each inside a savepoint
+        with self.assertNumQueries(7):
+            latest = IndicatorService().update()
+
+        stored = [round(float(close), 4) for close in closes]
+        self.assertAlmostEqual(latest['FRESH'], wilder_rsi(stored)[-1], places=3)
+        self.assertAlmostEqual(latest['STALE'], wilder_rsi(stored[:30])[-1], places=3)
+        self.assertEqual(
+            set(TechnicalIndicatorPoint.objects.filter(stock=stale).values_list('date', flat=True)),
+            {start + timedelta(days=29)}
+        )
+        self.assertEqual(
+            set(TechnicalIndicatorPoint.objects.filter(stock=fresh).values_list('date', flat=True)),
+            {start + timedelta(days=39)}
+        )
+        self.assertEqual(DatasetRefresh.objects.filter(dataset='relative_strength_index').count(), 2)
+
+    def test_flat_and_rising_closes_are_stored(self):
+        start = date(2026, 1, 1)
+        flat = Stock.objects.create(symbol='FLAT', isBought=False)
+        rising = Stock.objects.create(symbol='RISE', isBought=False)
+        for day in range(30):
+            DailyPrice.objects.create(stock=flat, date=start + timedelta(days=day), close=20)
+            DailyPrice.objects.create(stock=rising, date=start + timedelta(days=day), close=20 + day)
+
+        latest = IndicatorService().update()
+
+        self.assertEqual(latest, {'FLAT': 50.0, 'RISE': 100.0})
+        self.assertEqual(Stock.objects.get(symbol='FLAT').relativeStrengthIndex, 50)
+        self.assertEqual(Stock.objects.get(symbol='RISE').relativeStrengthIndex, 100)
+        self.assertEqual(DatasetRefresh.objects.filter(dataset='relative_strength_index').count(), 2)
+
+
+class TokenBucketRateLimiterTests(TestCase):
+    """Buckets refill with time, acquire waits for the next token and gives up past max_wait"""
+
+    def setUp(self):
+        self.now = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+        self.slept = []
+        clock = mock.patch('stock_spot.services.rate_limit.timezone.now', side_effect=lambda: self.now)
+        sleep = mock.patch('stock_spot.services.rate_limit.time.sleep', side_effect=self.sleep)
+        clock.start()
+        sleep.start()
+        self.addCleanup(clock.stop)
+        self.addCleanup(sleep.stop)
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += timedelta(seconds=seconds)
+
+    def test_bucket_refills_at_its_rate(self):
+        limiter = TokenBucketRateLimiter('test', {'minute': (2, 60)}, max_wait=0)
+        self.assertEqual(limiter.acquire(), 0)
+        self.assertEqual(limiter.acquire(), 0)
+        self.now += timedelta(seconds=30)
+        self.assertEqual(limiter.acquire(), 0)
+        self.assertEqual(self.slept, [])
+
+    def test_acquire_waits_for_the_slowest_bucket(self):
+        limiter = TokenBucketRateLimiter('test', {'second': (5, 1), 'minute': (2, 60)}, max_wait=60)
+        limiter.acquire()
+        limiter.acquire()
+        self.assertAlmostEqual(limiter.acquire(), 30)
+        self.assertEqual(len(self.slept), 1)
+
+    def test_acquire_raises_when_wait_exceeds_max_wait(self):
+        limiter = TokenBucketRateLimiter('test', {'minute': (1, 60)}, max_wait=10)
+        limiter.acquire()
+        with self.assertRaises(RateLimitExceeded):
+            limiter.acquire()
+        self.assertEqual(self.slept, [])
+
+    def test_write_lock_is_taken_before_buckets_are_read(self):
+        limiter = TokenBucketRateLimiter('test', {'minute': (2, 60)}, max_wait=0)
+        with CaptureQueriesContext(connection) as queries:
+            limiter.acquire()
+        statements = [query['sql'].split()[0] for query in queries.captured_queries if 'ratelimitbucket' in query['sql']]
+        self.assertEqual(statements[0], 'UPDATE')
+        self.assertIn('SELECT', statements[1:])
+
+
+class ReportJobClaimTests(TestCase):
+    """Jobs orphaned by a dead worker are picked up again once they time out"""
+
+    def test_timed_out_running_job_is_claimed_again(self):
+        service = ReportJobService()
+        orphaned = service.enqueue(['AAA'])
+        queued = service.enqueue(['BBB'])
+        started = service.claim_next().startedAt
+
+        with override_settings(REPORT_JOB_TIMEOUT=3600):
+            ReportJob.objects.filter(pk=orphaned.pk).update(startedAt=started - timedelta(minutes=30))
+            self.assertEqual(service.claim_next(), queued)
+            self.assertIsNone(service.claim_next())
+
+            ReportJob.objects.filter(pk=orphaned.pk).update(startedAt=started - timedelta(hours=2))
+            reclaimed = service.claim_next()
+        self.assertEqual(reclaimed, orphaned)
+        self.assertEqual(reclaimed.status, ReportJob.RUNNING)
+        self.assertGreaterEqual(reclaimed.startedAt, started)
+
+
+class ScreenFilterTests(TestCase):
+    """Filter expressions tokenize, parse with the documented precedence and match the expected snapshots"""
+
+    @classmethod
+    def setUpTestData(cls):
+        rows = [
+            ('AAA', 25, 10, 5, date(2026, 3, 31)),
+            ('BBB', 45, 20, None, date(2026, 6, 30)),
+            ('CCC', 70, 5, 30, None),
+            ('DDD', None, 50, 12, date(2025, 12, 31)),
+        ]
+        for symbol, rsi_value, price, cagr, quarter in rows:
+            stock = Stock.objects.create(symbol=symbol, isBought=False)
+            StockSnapshot.objects.create(
+                stock=stock, symbol=symbol, relativeStrengthIndex=rsi_value, currentPrice=price,
+                compoundedAnnualGrowthRate=cagr, latestQuarterEnding=quarter
+            )
+
+    def screen(self, expression):
+        return sorted(StockSnapshot.objects.filter(FilterCompiler(expression).compile()).values_list('symbol', flat=True))
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('rsi<=30 and (latestQuarterEnding >= 2026-01-01 or price != -1.5)'), [
+            ('word', 'rsi'), ('op', '<='), ('number', '30'), ('word', 'and'), ('paren', '('),
+            ('word', 'latestQuarterEnding'), ('op', '>='), ('date', '2026-01-01'), ('word', 'or'),
+            ('word', 'price'), ('op', '!='), ('number', '-1.5'), ('paren', ')'),
+        ])
+        self.assertEqual(tokenize('  '), [])
+        with self.assertRaises(ScreenError):
+            tokenize('rsi < 30; drop')
+
+    def test_and_binds_tighter_than_or(self):
+        self.assertEqual(self.screen('rsi < 30 or rsi > 60 and price > 10'), ['AAA'])
+        self.assertEqual(self.screen('(rsi < 30 or rsi > 60) and price < 10'), ['CCC'])
+
+    def test_not_and_parentheses(self):
+        self.assertEqual(self.screen('not (rsi < 30 or price >= 20)'), ['CCC'])
+        self.assertEqual(self.screen('not not rsi = 45'), ['BBB'])
+
+    def test_null_comparisons(self):
+        self.assertEqual(self.screen('cagr = null'), ['BBB'])
+        self.assertEqual(self.screen('rsi != null'), ['AAA', 'BBB', 'CCC'])
+
+    def test_negated_comparisons_leave_out_nulls(self):
+        self.assertEqual(self.screen('not rsi < 30'), ['BBB', 'CCC'])
+        self.assertEqual(self.screen('not (rsi < 30 or cagr > 20)'), [])
+        self.assertEqual(self.screen('not (rsi < 30 and price > 40)'), ['AAA', 'BBB', 'CCC'])
+        self.assertEqual(self.screen('not rsi != 45'), ['BBB'])
+        self.assertEqual(self.screen('not rsi = null'), ['AAA', 'BBB', 'CCC'])
+
+    def test_operands_must_match_the_field_type(self):
+        for expression in ('latestQuarterEnding > 5', 'rsi > 2026-01-01', 'symbol = 5', 'latestQuarterEnding > 2026-02-30'):
+            with self.subTest(expression=expression), self.assertRaises(ScreenError):
+                FilterCompiler(expression).compile()
+        self.assertEqual(self.screen('symbol != null and latestQuarterEnding < 2026-01-01'), ['DDD'])
+
+    def test_type_errors_are_bad_requests(self):
+        response = self.client.get('/api/stocks/api/screen/', {'q': 'latestQuarterEnding > 5'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('date', response.json()['error'])
+
+    def test_not_equal_leaves_out_nulls(self):
+        self.assertEqual(self.screen('cagr != 5'), ['CCC', 'DDD'])
+        self.assertEqual(self.screen('rsi != 45'), ['AAA', 'CCC'])
+
+    def test_dates(self):
+        self.assertEqual(self.screen('latestQuarterEnding >= 2026-01-01'), ['AAA', 'BBB'])
+
+    def test_empty_filter_matches_everything(self):
+        self.assertEqual(self.screen(''), ['AAA', 'BBB', 'CCC', 'DDD'])
+
+    def test_invalid_expressions(self):
+        for expression in ('rsi <', 'rsi < 30 and', '(rsi < 30', 'rsi < 30)', 'bogus < 1', 'rsi < null', 'rsi 30', 'rsi < abc'):
+            with self.subTest(expression=expression), self.assertRaises(ScreenError):
+                FilterCompiler(expression).compile()
+
+
+class KeysetPaginateTests(TestCase):
+    """Pages seek on (value, pk) so rows sharing a sort value are neither repeated nor skipped"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index, price in enumerate([10, 20, 20, 20, 30, None, 40]):
+            stock = Stock.objects.create(symbol=f"K{index}", isBought=False)
+            StockSnapshot.objects.create(stock=stock, symbol=f"K{index}", currentPrice=price)
+
+    def pages(self, order_field, limit):
+        symbols, cursor = [], None
+        while True:
+            rows, cursor = keyset_paginate(StockSnapshot.objects.all(), order_field, cursor=cursor, limit=limit)
+            symbols.append([row.symbol for row in rows])
+            if cursor is None:
+                return symbols
+
+    def test_ascending_pages(self):
+        self.assertEqual(self.pages('currentPrice', 2), [['K0', 'K1'], ['K2', 'K3'], ['K4', 'K6']])
+
+    def test_descending_pages(self):
+        self.assertEqual(self.pages('-currentPrice', 2), [['K6', 'K4'], ['K3', 'K2'], ['K1', 'K0']])
+
+    def test_last_page_has_no_cursor(self):
+        rows, cursor = keyset_paginate(StockSnapshot.objects.all(), 'currentPrice', limit=6)
+        self.assertEqual(len(rows), 6)
+        self.assertIsNone(cursor)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(CursorError):
+            keyset_paginate(StockSnapshot.objects.all(), 'currentPrice', cursor='not-a-cursor')
+
+
+def per_symbol_eps_growth(symbol):
+    """The YoY EPS growth calculation as it was done one symbol at a time"""
+    recent = QuarterlyIncomeStatement.objects.filter(stock__symbol=symbol).order_by('-fiscalDateEnding').first()
+    if not recent or not recent.dilutedEPS:
+        return None
+    prior = QuarterlyIncomeStatement.objects.filter(
+        stock__symbol=symbol,
+        fiscalDateEnding__lte=recent.fiscalDateEnding.replace(year=recent.fiscalDateEnding.year - 1)
+    ).order_by('-fiscalDateEnding').first()
+    if not prior or not prior.dilutedEPS:
+        return None
+    return ((recent.dilutedEPS - prior.dilutedEPS) / prior.dilutedEPS) * 100
+
+
+def per_symbol_cagr(symbol):
+    """The earnings CAGR calculation as it was done one symbol at a time"""
+    span = min(4, AnnualIncomeStatement.objects.filter(stock__symbol=symbol).count())
+    recent = AnnualIncomeStatement.objects.filter(stock__symbol=symbol).order_by('-fiscalDateEnding').first()
+    if not recent:
+        return None
+    old = AnnualIncomeStatement.objects.filter(
+        stock__symbol=symbol,
+        fiscalDateEnding__gte=recent.fiscalDateEnding.replace(year=recent.fiscalDateEnding.year - (span - 1))
+    ).order_by('-fiscalDateEnding').last()
+    if not old.dilutedEPS or not recent.dilutedEPS or old.dilutedEPS < 0 or recent.dilutedEPS < 0:
+        return None
+    return ((float(recent.dilutedEPS / old.dilutedEPS) ** (1 / span)) - 1) * 100
+
+
+class MetricsTests(TestCase):
+    """The bulk metrics engine gives the same results as the per-symbol calculations it replaced"""
+
+    @classmethod
+    def setUpTestData(cls):
+        histories = {
+            # symbol: (quarterly diluted EPS newest first, annual diluted EPS newest first)
+            'GROW': ([2.0, 1.8, 1.6, 1.5, 1.2, 1.1], [6.0, 5.0, 4.0, 3.5, 3.0]),
+            'SHRT': ([1.0, 0.9, 0.8], [2.0, 1.5]),
+            'NEG': ([-0.5, 0.2, 0.3, 0.1, 0.4], [-1.0, 1.0, 2.0]),
+            'ZERO': ([1.0, 1.0, 1.0, 1.0, 0.0], [3.0, 2.0, 1.0, 0.0]),
+            'NONE': ([], []),
+        }
+        for symbol, (quarters, years) in histories.items():
+            stock = Stock.objects.create(symbol=symbol, isBought=False)
+            for index, eps in enumerate(quarters):
+                fiscal_date = date(2026, 6, 30) - timedelta(days=91 * index)
+                QuarterlyIncomeStatement.objects.create(stock=stock, fiscalDateEnding=fiscal_date, dilutedEPS=eps)
+            for index, eps in enumerate(years):
+                AnnualIncomeStatement.objects.create(stock=stock, fiscalDateEnding=date(2025 - index, 12, 31), dilutedEPS=eps)
+        cls.symbols = list(histories)
+
+    def assertSameMetric(self, actual, expected, places=6):
+        if expected is None:
+            self.assertIsNone(actual)
+        else:
+            self.assertAlmostEqual(float(actual), float(expected), places=places)
+
+    def test_bulk_update_matches_per_symbol_formulas(self):
+        metrics = StockService().update_metrics(self.symbols)
+        for symbol in self.symbols:
+            with self.subTest(symbol=symbol):
+                self.assertSameMetric(metrics[symbol]['yoyEPSPercentGrowth'], per_symbol_eps_growth(symbol))
+                self.assertSameMetric(metrics[symbol]['compoundedAnnualGrowthRate'], per_symbol_cagr(symbol))
+
+    def test_calculate_returns_fresh_value_or_none(self):
+        service = StockService()
+        Stock.objects.filter(symbol='NEG').update(yoyEPSPercentGrowth=12, compoundedAnnualGrowthRate=7)
+        self.assertIsNone(service.calculate_eps_growth_over_past_year('NEG'))
+        self.assertIsNone(service.calculate_earnings_CAGR('NEG'))
+        self.assertSameMetric(service.calculate_earnings_CAGR('GROW'), per_symbol_cagr('GROW'))
+        self.assertSameMetric(service.calculate_eps_growth_over_past_year('GROW'), per_symbol_eps_growth('GROW'))
+        # Stored values are rounded to the field's decimal places
+        self.assertSameMetric(Stock.objects.get(symbol='GROW').yoyEPSPercentGrowth, per_symbol_eps_growth('GROW'), places=3)
+
+
+class FetchAllStatementsTests(TestCase):
+    """fetch_all_statements fetches info and every statement for a symbol at once"""
+
+    STATEMENT_FETCHES = [
+        'fetch_stock_info',
+        'fetch_annual_income_statement', 'fetch_quarterly_income_statement',
+        'fetch_annual_balance_sheet', 'fetch_quarterly_balance_sheet',
+        'fetch_annual_cashflow', 'fetch_quarterly_cashflow',
+    ]
+
+    def patch_fetches(self, service, fetch):
+        for name in self.STATEMENT_FETCHES:
+            setattr(service, name, lambda symbol, name=name: fetch(name))
+
+    def test_returns_every_dataset(self):
+        with replayed_providers(['ALL1']):
+            results = YFinanceService().fetch_all_statements('ALL1')
+        self.assertEqual(len(results), 7)
+        self.assertEqual(results['stock_info']['shortName'], 'Synthetic ALL1')
+        self.assertFalse(results['quarterly_income_statement'].empty)
+
+    def test_fetches_run_concurrently(self):
+        # Every fetch waits until all seven are in flight, so running them one at a time breaks the barrier
+        barrier = threading.Barrier(len(self.STATEMENT_FETCHES), timeout=10)
+
+        def fetch(name):
+            barrier.wait()
+            return name
+
+        service = YFinanceService()
+        self.patch_fetches(service, fetch)
+        results = service.fetch_all_statements('ALL1')
+        self.assertEqual(sorted(results.values()), sorted(self.STATEMENT_FETCHES))
+
+    @override_settings(INGESTION_PROVIDER_CONCURRENCY={'yfinance': 3})
+    def test_fetches_share_the_provider_cap(self):
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def fetch(name):
+            with lock:
+                in_flight.append(name)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(name)
+            return name
+
+        service = YFinanceService()
+        self.patch_fetches(service, fetch)
+        service.fetch_all_statements('ALL1')
+        self.assertLessEqual(max(peak), 3)
+        self.assertEqual(len(peak), 7)
+
+
+class FrameToRowsTests(TestCase):
+    """yfinance statement frames convert to one row of model values per fiscal date"""
+
+    FIELDS = (
+        ('Total Revenue', 'totalRevenue', int),
+        ('Net Income', 'netIncome', int),
+        ('Diluted EPS', 'dilutedEPS', float),
+        ('Tax Rate For Calcs', 'taxRateForCalcs', float),
+    )
+
+    def setUp(self):
+        columns = pd.Index([pd.Timestamp('2026-03-31'), pd.Timestamp('2025-12-31 16:00'), datetime(2025, 9, 30)], dtype=object)
+        self.frame = pd.DataFrame(
+            [
+                [1.5e9, np.nan, 1.2e9],
+                [2.5, float('inf'), '1.75'],
+                [0.21, -float('inf'), 'n/a'],
+            ],
+            index=['Total Revenue', 'Diluted EPS', 'Tax Rate For Calcs'],
+            columns=columns,
+        )
+
+    def test_rows_are_keyed_by_fiscal_date(self):
+        rows = frame_to_rows(self.frame, self.FIELDS)
+        self.assertEqual(list(rows), [date(2026, 3, 31), date(2025, 12, 31), date(2025, 9, 30)])
+
+    def test_values(self):
+        rows = frame_to_rows(self.frame, self.FIELDS)
+        self.assertEqual(rows[date(2026, 3, 31)], {'totalRevenue': 1500000000, 'netIncome': None, 'dilutedEPS': 2.5, 'taxRateForCalcs': 0.21})
+        # NaN, inf and a missing row label all become None
+        self.assertEqual(rows[date(2025, 12, 31)], {'totalRevenue': None, 'netIncome': None, 'dilutedEPS': None, 'taxRateForCalcs': None})
+        # Numeric strings are parsed and anything else is treated as missing
+        self.assertEqual(rows[date(2025, 9, 30)], {'totalRevenue': 1200000000, 'netIncome': None, 'dilutedEPS': 1.75, 'taxRateForCalcs': None})
+
+    def test_value_types(self):
+        row = frame_to_rows(self.frame, self.FIELDS)[date(2026, 3, 31)]
+        self.assertIs(type(row['totalRevenue']), int)
+        self.assertIs(type(row['dilutedEPS']), float)
+
+    def test_hash_ignores_key_order(self):
+        row = frame_to_rows(self.frame, self.FIELDS)[date(2026, 3, 31)]
+        self.assertEqual(hash_row(row), hash_row(dict(reversed(list(row.items())))))
+        self.assertNotEqual(hash_row(row), hash_row({**row, 'dilutedEPS': 2.6}))
+
+
+
+class IncrementalStatementSaveTests(TestCase):
+    """Saving a statement again only writes the periods whose content changed"""
+
+    def setUp(self):
+        self.stock = Stock.objects.create(symbol='INC', isBought=False)
+        self.service = YFinanceService(incremental=True)
+        rng = np.random.default_rng(0)
+        self.frame = statement_frame(rng, QUARTERLY_INCOME_STATEMENT_FIELDS, 3, 4, date(2026, 10, 17))
+        self.latest = self.frame.columns[0].date()
+
+    def save(self, frame):
+        with CaptureQueriesContext(connection) as queries:
+            saved = self.service.save_quarterly_income_statement(self.stock, frame)
+        writes = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('INSERT INTO "stock_spot_quarterlyincomestatement"')]
+        return saved, writes
+
+    def stored(self):
+        return dict(QuarterlyIncomeStatement.objects.filter(stock=self.stock).values_list('fiscalDateEnding', 'lastUpdated'))
+
+    def test_unchanged_frame_writes_nothing(self):
+        saved, writes = self.save(self.frame)
+        self.assertEqual(len(saved), 4)
+        self.assertEqual(len(writes), 1)
+        before = self.stored()
+
+        saved, writes = self.save(self.frame.copy())
+        self.assertEqual(saved, [])
+        self.assertEqual(writes, [])
+        self.assertEqual(self.stored(), before)
+        refresh = DatasetRefresh.objects.get(stock=self.stock, dataset='quarterly_income_statement')
+        self.assertEqual(refresh.latestFiscalDate, self.latest)
+
+    def test_changed_period_rewrites_only_that_row(self):
+        self.save(self.frame)
+        before = self.stored()
+        changed = self.frame.copy()
+        period = changed.columns[2]
+        changed.loc['Total Revenue', period] += 1
+
+        saved, writes = self.save(changed)
+        self.assertEqual([row.fiscalDateEnding for row in saved], [period.date()])
+        self.assertEqual(len(writes), 1)
+        after = self.stored()
+        self.assertGreater(after[period.date()], before[period.date()])
+        self.assertEqual({day: value for day, value in after.items() if day != period.date()},
+                         {day: value for day, value in before.items() if day != period.date()})
+        stored = QuarterlyIncomeStatement.objects.get(stock=self.stock, fiscalDateEnding=period.date())
+        self.assertEqual(stored.totalRevenue, int(changed.loc['Total Revenue', period]))
+
+    def test_new_period_moves_the_watermark(self):
+        self.save(self.frame[self.frame.columns[1:]])
+        refresh = DatasetRefresh.objects.get(stock=self.stock, dataset='quarterly_income_statement')
+        self.assertEqual(refresh.latestFiscalDate, self.frame.columns[1].date())
+
+        saved, writes = self.save(self.frame)
+        self.assertEqual([row.fiscalDateEnding for row in saved], [self.latest])
+        refresh.refresh_from_db()
+        self.assertEqual(refresh.latestFiscalDate, self.latest)
+
+
+
+@override_settings(RSI_SOURCE='local', INGESTION_POLL_INTERVAL=0.02)
+class IngestionServiceTests(TestCase):
+    """One slow or failing source is reported without holding back or losing the others"""
+
+    def test_slow_and_failing_sources_are_reported(self):
+        stock = Stock.objects.create(symbol='ING1', isBought=False)
+        released = threading.Event()
+        self.addCleanup(released.set)
+
+        def fail(symbol):
+            raise ValueError('statement unavailable')
+
+        with replayed_providers(['ING1']), override_settings(INGESTION_FETCH_TIMEOUTS={'annual_cashflow': 0.2}):
+            yfinance = YFinanceService()
+            yfinance.fetch_annual_cashflow = lambda symbol: released.wait(10)
+            yfinance.fetch_quarterly_cashflow = fail
+            report = IngestionService(yfinance, AlphaVantageService()).ingest(stock)
+
+        self.assertEqual(report.failed, {
+            'annual_cashflow': 'timed out after 0.2s',
+            'quarterly_cashflow': 'statement unavailable',
+        })
+        self.assertEqual(sorted(report.succeeded), [
+            'annual_balance_sheet', 'annual_income_statement', 'quarterly_balance_sheet',
+            'quarterly_income_statement', 'stock_info',
+        ])
+        self.assertFalse(report.ok)
+        self.assertEqual(QuarterlyIncomeStatement.objects.filter(stock=stock).count(), 6)
+        self.assertLess(report.elapsed, 10)
+
+    def test_only_requested_datasets_are_fetched(self):
+        with replayed_providers(['ING2']):
+            report, results = IngestionService(YFinanceService(), AlphaVantageService()).fetch('ING2', ['stock_info'])
+        self.assertEqual(list(results), ['stock_info'])
+        self.assertEqual(report.failed, {})
+
+
+@override_settings(RSI_SOURCE='local')
+class IngestManyTests(TestCase):
+    """ingest_many reports per symbol, shares provider limits across symbols and refreshes only what is asked for"""
+
+    STATEMENTS = [
+        'annual_balance_sheet', 'annual_cashflow', 'annual_income_statement',
+        'quarterly_balance_sheet', 'quarterly_cashflow', 'quarterly_income_statement',
+    ]
+
+    def test_reports_every_symbol(self):
+        reported = []
+        with replayed_providers(['MANY1', 'MANY2']):
+            reports = StockService().ingest_many(['MANY1', 'MANY2', 'MANY1', 'GONE'], on_report=reported.append)
+        self.assertEqual(set(reports), {'MANY1', 'MANY2', 'GONE'})
+        self.assertEqual(sorted(report.symbol for report in reported), ['GONE', 'MANY1', 'MANY2'])
+        self.assertTrue(reports['MANY1'].ok and reports['MANY2'].ok)
+        self.assertEqual(sorted(reports['MANY1'].succeeded), sorted(['stock_info', *self.STATEMENTS]))
+        # No recorded responses for GONE, so every source fails without affecting the others
+        self.assertEqual(sorted(reports['GONE'].failed), sorted(['stock_info', *self.STATEMENTS]))
+        self.assertIsNotNone(Stock.objects.get(symbol='MANY2').relativeStrengthIndex)
+
+    @override_settings(INGESTION_PROVIDER_CONCURRENCY={'yfinance': 2}, INGESTION_MAX_SYMBOL_WORKERS=4)
+    def test_provider_limit_is_shared_across_symbols(self):
+        symbols = ['LIM1', 'LIM2', 'LIM3', 'LIM4']
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def counted(fetch):
+            def run(symbol):
+                with lock:
+                    in_flight[0] += 1
+                    peak[0] = max(peak[0], in_flight[0])
+                try:
+                    time.sleep(0.005)
+                    return fetch(symbol)
+                finally:
+                    with lock:
+                        in_flight[0] -= 1
+            return run
+
+        with replayed_providers(symbols):
+            service = StockService()
+            yfinance = service.yfinance_service
+            for name in ['fetch_stock_info', *(f"fetch_{dataset}" for dataset in self.STATEMENTS)]:
+                setattr(yfinance, name, counted(getattr(yfinance, name)))
+            reports = service.ingest_many(symbols)
+        self.assertTrue(all(report.ok for report in reports.values()))
+        self.assertLessEqual(peak[0], 2)
+
+    def test_only_and_force(self):
+        with replayed_providers(['FRC1']):
+            service = StockService()
+            service.ingest_many(['FRC1'])
+            # Everything was just refreshed, so there is nothing stale to fetch
+            self.assertEqual(service.ingest_many(['FRC1'])['FRC1'].succeeded, [])
+            self.assertEqual(service.ingest_many(['FRC1'], only=['stock_info'])['FRC1'].succeeded, [])
+            self.assertEqual(service.ingest_many(['FRC1'], only=['stock_info'], force=True)['FRC1'].succeeded, ['stock_info'])
+            forced = service.ingest_many(['FRC1'], force=True)['FRC1']
+            self.assertEqual(sorted(forced.succeeded), sorted(['stock_info', *self.STATEMENTS]))
+
+            DatasetRefresh.objects.filter(dataset='annual_cashflow').update(lastRefreshed=timezone.now() - timedelta(days=2))
+            self.assertEqual(service.ingest_many(['FRC1'])['FRC1'].succeeded, ['annual_cashflow'])
+
+
+class RefreshPricesTests(TestCase):
+    """Current prices come from batched multi-ticker downloads and are written to stocks and snapshots in bulk"""
+
+    def setUp(self):
+        self.symbols = ['PR1', 'PR2', 'PR3', 'PR4']
+        for symbol in self.symbols + ['NOPX']:
+            stock = Stock.objects.create(symbol=symbol, isBought=False, currentPrice=Decimal('1.23'))
+            StockSnapshot.objects.create(stock=stock, symbol=symbol, currentPrice=Decimal('1.23'))
+
+    def test_prices_are_downloaded_in_batches_and_saved_in_bulk(self):
+        with replayed_providers(self.symbols), override_settings(PRICE_DOWNLOAD_BATCH_SIZE=2):
+            closes = {
+                symbol: Decimal(str(round(float(ProviderRecorder().load('yfinance', 'download', symbol, {'interval': '1d'})['Close'].iloc[-1]), 2)))
+                for symbol in self.symbols
+            }
+            service = StockService()
+            downloads = []
+            download_prices = service.yfinance_service.download_prices
+
+            def record_download(symbols, **kwargs):
+                downloads.append(list(symbols))
+                return download_prices(symbols, **kwargs)
+
+            service.yfinance_service.download_prices = record_download
+            with CaptureQueriesContext(connection) as queries:
+                prices = service.price_history_service.refresh_prices()
+
+        self.assertEqual(downloads, [['PR1', 'PR2'], ['PR3', 'PR4'], ['NOPX']])
+        self.assertEqual(prices, closes)
+        stock_updates = [query for query in queries.captured_queries if query['sql'].startswith('UPDATE "stock_spot_stock"')]
+        self.assertEqual(len(stock_updates), 1)
+        for symbol, close in closes.items():
+            stock = Stock.objects.get(symbol=symbol)
+            self.assertEqual(stock.currentPrice, close)
+            self.assertEqual(stock.snapshot.currentPrice, close)
+        # NOPX was missing from its download, so it keeps its price
+        self.assertEqual(Stock.objects.get(symbol='NOPX').currentPrice, Decimal('1.23'))
+        self.assertEqual(StockSnapshot.objects.get(symbol='NOPX').currentPrice, Decimal('1.23'))
+        self.assertFalse(DailyPrice.objects.filter(stock__symbol='NOPX').exists())
+        self.assertTrue(DailyPrice.objects.filter(stock__symbol='PR3').exists())
+
+    def test_unchanged_prices_are_not_written(self):
+        with replayed_providers(self.symbols):
+            service = StockService()
+            service.price_history_service.refresh_prices(['PR1'])
+            with CaptureQueriesContext(connection) as queries:
+                prices = service.price_history_service.refresh_prices(['PR1'])
+        self.assertEqual(prices, {})
+        self.assertFalse(any(query['sql'].startswith('UPDATE') for query in queries.captured_queries))
+
+
+def eastern(day, hour, minute=0):
+    """A time on an October 2026 day in the market's timezone"""
+    return datetime(2026, 10, day, hour, minute, tzinfo=MARKET_TIMEZONE)
+
+
+class MarketHoursTests(TestCase):
+    """Market session and close times at fixed points of a week (Wed 14 to Mon 19 October 2026)"""
+
+    def test_is_market_open(self):
+        self.assertTrue(is_market_open(eastern(14, 9, 30)))
+        self.assertTrue(is_market_open(eastern(14, 15, 59)))
+        self.assertFalse(is_market_open(eastern(14, 9, 29)))
+        self.assertFalse(is_market_open(eastern(14, 16)))
+        self.assertFalse(is_market_open(eastern(17, 12)))
+        # Other timezones are converted first: 14:00 UTC is 10:00 in New York
+        self.assertTrue(is_market_open(datetime(2026, 10, 14, 14, tzinfo=dt_timezone.utc)))
+
+    def test_last_market_close(self):
+        self.assertEqual(last_market_close(eastern(14, 16)), eastern(14, 16))
+        self.assertEqual(last_market_close(eastern(14, 15, 59)), eastern(13, 16))
+        # Weekends and Monday before the close fall back to Friday
+        self.assertEqual(last_market_close(eastern(18, 12)), eastern(16, 16))
+        self.assertEqual(last_market_close(eastern(19, 10)), eastern(16, 16))
+
+
+class RefreshSchedulerDueTests(TestCase):
+    """Interval, market-hours and after-close cadences"""
+
+    def setUp(self):
+        self.scheduler = RefreshScheduler(mock.Mock())
+
+    def test_market_hours_interval(self):
+        spec = {'interval': 900, 'market_hours': True}
+        self.assertTrue(self.scheduler.is_due(spec, None, eastern(14, 10)))
+        self.assertFalse(self.scheduler.is_due(spec, eastern(14, 9, 50), eastern(14, 10)))
+        self.assertTrue(self.scheduler.is_due(spec, eastern(14, 9, 45), eastern(14, 10)))
+        self.assertFalse(self.scheduler.is_due(spec, None, eastern(17, 12)))
+        self.assertFalse(self.scheduler.is_due(spec, eastern(14, 10), eastern(14, 17)))
+
+    def test_after_close(self):
+        spec = {'after_close': 30 * 60}
+        # Before the close plus offset the last run of the previous day still counts
+        self.assertFalse(self.scheduler.is_due(spec, eastern(13, 16, 30), eastern(14, 16, 29)))
+        self.assertTrue(self.scheduler.is_due(spec, eastern(13, 16, 30), eastern(14, 16, 30)))
+        self.assertFalse(self.scheduler.is_due(spec, eastern(14, 16, 31), eastern(14, 20)))
+        # Over the weekend Friday's run is the latest one due
+        self.assertFalse(self.scheduler.is_due(spec, eastern(16, 17), eastern(18, 12)))
+        self.assertTrue(self.scheduler.is_due(spec, eastern(15, 17), eastern(18, 12)))
+
+    def test_run_due_persists_last_runs(self):
+        stock_service = mock.Mock()
+        stock_service.price_history_service.refresh_prices.return_value = {'AAA': Decimal('10.00')}
+        scheduler = RefreshScheduler(stock_service, {'prices': {'interval': 900, 'market_hours': True}})
+
+        self.assertEqual(scheduler.run_due(eastern(14, 10)), {'prices': {'AAA': Decimal('10.00')}})
+        # A restarted scheduler reads the stored last run and doesn't repeat the refresh
+        self.assertEqual(RefreshScheduler(stock_service, scheduler.schedule).run_due(eastern(14, 10, 5)), {})
+        self.assertEqual(stock_service.price_history_service.refresh_prices.call_count, 1)
+        self.assertEqual(ScheduledTask.objects.get(name='prices').lastRun, eastern(14, 10))
+
+
+class StatementHistoryTests(TestCase):
+    """A symbol's statement history comes back as columns, oldest period first, as JSON, Arrow or Parquet"""
+
+    url = '/api/stocks/api/statements/quarterly_income_statement/HIST/'
+
+    @classmethod
+    def setUpTestData(cls):
+        stock = Stock.objects.create(symbol='HIST', isBought=False)
+        other = Stock.objects.create(symbol='OTHR', isBought=False)
+        for index, month in enumerate((3, 6, 9, 12)):
+            QuarterlyIncomeStatement.objects.create(
+                stock=stock, fiscalDateEnding=date(2025, month, 28), totalRevenue=100 * (index + 1), dilutedEPS=index + 0.5
+            )
+        QuarterlyIncomeStatement.objects.create(stock=other, fiscalDateEnding=date(2025, 6, 28), totalRevenue=1)
+
+    def test_json_columns(self):
+        response = self.client.get(self.url, {'fields': 'totalRevenue,dilutedEPS', 'format': 'json'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'fiscalDateEnding': ['2025-03-28', '2025-06-28', '2025-09-28', '2025-12-28'],
+            'totalRevenue': [100, 200, 300, 400],
+            'dilutedEPS': [0.5, 1.5, 2.5, 3.5],
+        })
+
+    def test_start_and_end(self):
+        response = self.client.get(self.url, {'fields': 'totalRevenue', 'start': '2025-06-01', 'end': '2025-09-30', 'format': 'json'})
+        self.assertEqual(response.json(), {'fiscalDateEnding': ['2025-06-28', '2025-09-28'], 'totalRevenue': [200, 300]})
+        response = self.client.get(self.url, {'fields': 'totalRevenue', 'start': '2026-01-01', 'format': 'json'})
+        self.assertEqual(response.json(), {'fiscalDateEnding': [], 'totalRevenue': []})
+
+    def test_bad_requests(self):
+        response = self.client.get(self.url, {'fields': 'totalRevenue,bogus', 'format': 'json'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('bogus', response.json()['error'])
+        for param, value in (('start', '2025-13-01'), ('end', 'yesterday')):
+            response = self.client.get(self.url, {param: value, 'format': 'json'})
+            self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/stocks/api/statements/bogus_statement/HIST/', {'format': 'json'})
+        self.assertEqual(response.status_code, 404)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_and_parquet(self):
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        response = self.client.get(self.url, {'fields': 'totalRevenue', 'format': 'arrow'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/vnd.apache.arrow.stream')
+        table = pyarrow.ipc.open_stream(response.content).read_all()
+        self.assertEqual(table.column_names, ['fiscalDateEnding', 'totalRevenue'])
+        self.assertEqual(table.column('totalRevenue').to_pylist(), [100, 200, 300, 400])
+
+        response = self.client.get(self.url, {'fields': 'totalRevenue', 'end': '2025-06-30', 'format': 'parquet'})
+        self.assertEqual(response.status_code, 200)
+        table = pyarrow.parquet.read_table(pyarrow.BufferReader(response.content))
+        self.assertEqual(table.column('fiscalDateEnding').to_pylist(), [date(2025, 3, 28), date(2025, 6, 28)])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_binary_errors_fall_back_to_json(self):
+        response = self.client.get(self.url, {'fields': 'bogus', 'format': 'arrow'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(b'bogus', response.content)
@@ -1,6 +1,9 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import StockViewSet, generate_daily_report, home_page
+from .views import (
+    StockViewSet, StatementViewSet, statement_history,
+    generate_daily_report, report_job_status, home_page
+)
 
 router = DefaultRouter()
 router.register(r'', StockViewSet)
@@ -9,4 +12,7 @@ urlpatterns = [
     path('home/', home_page, name='home'),
     path('api/', include(router.urls)),
     path('api/report/', generate_daily_report, name='generate-daily-report'),
+    path('api/report/<int:job_id>/', report_job_status, name='report-job-status'),
+    path('api/statements/<str:dataset>/', StatementViewSet.as_view({'get': 'list'}), name='statement-list'),
+    path('api/statements/<str:dataset>/<str:symbol>/', statement_history, name='statement-history'),
 ]
\ No newline at end of file
@@ -1,13 +1,19 @@
 from rest_framework import viewsets, status
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import action, api_view, permission_classes, renderer_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.dateparse import parse_date
 from django.views.decorators.csrf import csrf_exempt
-from .models import Stock
-from .serializers import StockSerializer
+from .models import Stock, ReportJob
+from .serializers import StockSerializer, STATEMENT_SERIALIZERS, requested_fields
+from .renderers import COLUMNAR_RENDERERS
+from .pagination import StockCursorPagination, StatementCursorPagination
 from .services.stock import StockService
 from .services.alpha_vantage import AlphaVantageService
-from .services.email import EmailService
+from .services.report_jobs import ReportJobService
+from .services.screening import ScreeningService
 import re
 
 
@@ -21,6 +27,18 @@ class StockViewSet(viewsets.ViewSet):
         super().__init__(*args, **kwargs)
         self.stock_service = StockService()
         self.alpha_vantage_service = AlphaVantageService()
+        self.screening_service = ScreeningService()
+
+    def list(self, request):
+        """List stocks with cursor pagination, loading only the columns named in ?fields="""
+        serializer_context = {'request': request}
+        only = StockSerializer(context=serializer_context).get_only_fields()
+        paginator = StockCursorPagination()
+        page = paginator.paginate_queryset(
+            Stock.objects.only(*only, paginator.ordering.lstrip('-')), request, view=self
+        )
+        serializer = StockSerializer(page, many=True, context=serializer_context)
+        return paginator.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['post'])
     def create_stock(self, request):
@@ -37,6 +55,82 @@ class StockViewSet(viewsets.ViewSet):
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get'])
+    def screen(self, request):
+        """Screen stored fundamentals, e.g. ?q=rsi < 30 and cagr > 15&order=-cagr&fields=symbol,rsi,cagr"""
+        try:
+            fields = request.query_params.get('fields')
+            limit = min(int(request.query_params.get('limit', 50)), settings.SCREEN_MAX_LIMIT)
+            results, next_cursor = self.screening_service.screen(
+                expression=request.query_params.get('q', ''),
+                order=request.query_params.get('order', 'symbol'),
+                fields=[field.strip() for field in fields.split(',') if field.strip()] if fields else None,
+                cursor=request.query_params.get('cursor'),
+                limit=max(limit, 1)
+            )
+        # ScreenError and CursorError are ValueErrors; bad dates surface as ValidationError
+        except (ValueError, ValidationError) as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': results, 'next_cursor': next_cursor})
+
+
+class StatementViewSet(viewsets.ViewSet):
+    """Read-only listing of stored statement rows for one dataset, newest period first"""
+
+    def list(self, request, dataset):
+        serializer_class = STATEMENT_SERIALIZERS.get(dataset)
+        if serializer_class is None:
+            return Response({'error': f'Unknown statement: {dataset}'}, status=status.HTTP_404_NOT_FOUND)
+        serializer_context = {'request': request}
+        only = serializer_class(context=serializer_context).get_only_fields()
+        queryset = serializer_class.Meta.model.objects.only(*only, 'fiscalDateEnding')
+        if 'stock__symbol' in only:
+            queryset = queryset.select_related('stock')
+        symbol = request.query_params.get('symbol')
+        if symbol:
+            queryset = queryset.filter(stock__symbol=symbol.upper())
+
+        paginator = StatementCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = serializer_class(page, many=True, context=serializer_context)
+        return paginator.get_paginated_response(serializer.data)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@renderer_classes(COLUMNAR_RENDERERS)
+def statement_history(request, dataset, symbol):
+    """Return a symbol's statement history as columns, oldest period first
+
+    Supports ?fields=, ?start= and ?end= (YYYY-MM-DD), and ?format=arrow or parquet when pyarrow is installed.
+    """
+    serializer_class = STATEMENT_SERIALIZERS.get(dataset)
+    if serializer_class is None:
+        return Response({'error': f'Unknown statement: {dataset}'}, status=status.HTTP_404_NOT_FOUND)
+    # Every row belongs to the requested symbol, so it isn't repeated as a column
+    available = [field for field in serializer_class().fields if field not in ('id', 'symbol')]
+    fields = requested_fields(request) or available
+    unknown = set(fields) - set(available)
+    if unknown:
+        return Response({'error': f"Unknown fields: {', '.join(sorted(unknown))}"}, status=status.HTTP_400_BAD_REQUEST)
+    fields = ['fiscalDateEnding'] + [field for field in fields if field != 'fiscalDateEnding']
+
+    queryset = serializer_class.Meta.model.objects.filter(stock__symbol=symbol.upper())
+    for param, lookup in (('start', 'fiscalDateEnding__gte'), ('end', 'fiscalDateEnding__lte')):
+        value = request.query_params.get(param)
+        if value:
+            try:
+                parsed = parse_date(value)
+            except ValueError:
+                parsed = None
+            if parsed is None:
+                return Response({'error': f'Invalid {param} date: {value}'}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(**{lookup: parsed})
+
+    rows = list(queryset.order_by('fiscalDateEnding').values_list(*fields))
+    columns = list(zip(*rows)) if rows else [()] * len(fields)
+    return Response({field: list(values) for field, values in zip(fields, columns)})
+
 
 @csrf_exempt
 @api_view(['POST'])
@@ -58,24 +152,36 @@ def generate_daily_report(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Send report
-        email_service = EmailService()
-        response = email_service.send_stock_report(symbols)
-        
-        if response.status_code == 200:
-            return Response(
-                {'message': 'Report generated and sent successfully', 'symbols': symbols},
-                status=status.HTTP_200_OK
-            )
-        else:
-            return Response(
-                {'error': 'Failed to send email', 'details': response.text},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # Queue the report; the run_report_jobs worker ingests, renders and sends it
+        job = ReportJobService().enqueue(symbols)
+        return Response(
+            {'message': 'Report queued', 'job_id': job.pk, 'symbols': symbols},
+            status=status.HTTP_202_ACCEPTED
+        )
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def report_job_status(request, job_id):
+    """Report a queued report job's status and per-symbol progress"""
+    try:
+        job = ReportJob.objects.get(pk=job_id)
+    except ReportJob.DoesNotExist:
+        return Response({'error': f'Report job {job_id} not found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response({
+        'job_id': job.pk,
+        'status': job.status,
+        'symbols': job.symbols,
+        'progress': job.progress,
+        'error': job.error,
+        'created_at': job.createdAt,
+        'started_at': job.startedAt,
+        'finished_at': job.finishedAt,
+    })
+
+
 def home_page(request):
     """Render the home page with stock report input"""
     from django.shortcuts import render